@@ -0,0 +1,139 @@
+"""Compare row and grouped (GROUP_CONCAT) dataset report queries.
+
+Against a sparql endpoint, both modes are fetched and aggregated and the
+bytes transferred and end to end time are reported:
+
+    PYTHONPATH=src python benchmarks/dataset_report_queries.py live
+
+with FDK_SPARQL_URI pointing at the endpoint.
+
+Without arguments, synthetic responses shaped like the two modes are used,
+which measures payload size and aggregation time only.
+"""
+
+import asyncio
+import json
+import sys
+import time
+from typing import Callable, Dict, List, Tuple
+
+from aiohttp import ClientSession
+
+from fdk_organization_bff.service.adapter import (
+    query_format_dataset_report_metrics,
+    query_general_dataset_report_metrics,
+    query_publisher_dataset_report_metrics,
+)
+from fdk_organization_bff.service.report_service import _build_dataset_report
+
+DATASETS = 20000
+THEMES_PER_DATASET = 4
+DISTRIBUTIONS_PER_DATASET = 5
+
+
+def response(bindings: List[Dict]) -> bytes:
+    """Wrap bindings in a sparql json response."""
+    return json.dumps({"results": {"bindings": bindings}}).encode()
+
+
+def value(text: str) -> Dict[str, str]:
+    """Create binding value."""
+    return {"type": "uri", "value": text}
+
+
+def synthetic_responses(grouped: bool) -> Tuple[bytes, bytes, bytes]:
+    """Create format, general and publisher responses for DATASETS datasets."""
+    general: List[Dict] = []
+    formats: List[Dict] = []
+    publishers: List[Dict] = []
+    for i in range(DATASETS):
+        dataset = value(f"https://datasets.fellesdatakatalog.digdir.no/{i}")
+        themes = [
+            f"http://publications.europa.eu/resource/authority/data-theme/T{t}"
+            for t in range(THEMES_PER_DATASET)
+        ]
+        media_types = [
+            f"https://www.iana.org/assignments/media-types/application/t{d}"
+            for d in range(DISTRIBUTIONS_PER_DATASET)
+        ]
+        common = {
+            "dataset": dataset,
+            "firstHarvested": value("2020-01-01T00:00:00Z"),
+            "accessRights": value(
+                "http://publications.europa.eu/resource/authority/access-right/PUBLIC"
+            ),
+            "isOpenData": value("true"),
+        }
+        if grouped:
+            general.append({**common, "themes": value("\n".join(themes))})
+            formats.append(
+                {
+                    "dataset": dataset,
+                    "formats": value("\n".join(media_types + ["JSON"])),
+                }
+            )
+        else:
+            general.extend({**common, "theme": value(theme)} for theme in themes)
+            formats.extend(
+                {
+                    "dataset": dataset,
+                    "mediaType": value(media_type),
+                    "format": value("JSON"),
+                }
+                for media_type in media_types
+            )
+        publishers.append(
+            {
+                "dataset": dataset,
+                "orgId": value(str(900000000 + i % 300)),
+                "orgPath": value(f"/STAT/{900000000 + i % 300}"),
+            }
+        )
+    return response(formats), response(general), response(publishers)
+
+
+async def live_responses(grouped: bool) -> Tuple[bytes, bytes, bytes]:
+    """Fetch format, general and publisher responses from FDK_SPARQL_URI."""
+    async with ClientSession() as session:
+        return (
+            await query_format_dataset_report_metrics(session, grouped),
+            await query_general_dataset_report_metrics(session, grouped),
+            await query_publisher_dataset_report_metrics(session),
+        )
+
+
+def measure(
+    fetch: Callable[[bool], Tuple[bytes, bytes, bytes]], grouped: bool
+) -> Tuple[int, float, float]:
+    """Return bytes, fetch seconds and aggregation seconds for one mode."""
+    start = time.perf_counter()
+    responses = fetch(grouped)
+    fetched = time.perf_counter()
+    _build_dataset_report(*responses, None, None, grouped)
+    return (
+        sum(len(part) for part in responses),
+        fetched - start,
+        time.perf_counter() - fetched,
+    )
+
+
+def main() -> None:
+    """Print bytes and time per mode."""
+    live = len(sys.argv) > 1 and sys.argv[1] == "live"
+    fetch: Callable[[bool], Tuple[bytes, bytes, bytes]] = (
+        (lambda grouped: asyncio.run(live_responses(grouped)))
+        if live
+        else synthetic_responses
+    )
+    for name, grouped in [("rows", False), ("grouped", True)]:
+        size, fetch_time, build_time = measure(fetch, grouped)
+        print(
+            f"{name:<8} bytes={size:>11,d} "
+            f"{'fetch' if live else 'generate'}={fetch_time:6.2f}s "
+            f"aggregate={build_time:6.2f}s "
+            f"total={fetch_time + build_time:6.2f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Measure event loop latency under heavy logging, blocking vs queued handler.
+
+A ticker task sleeps 1ms in a loop and records how late it wakes up while a
+second task logs bursts of JSON records to a slow stream, standing in for a
+stdout pipe that is not drained fast enough.
+
+Usage: PYTHONPATH=src python benchmarks/logging_latency.py
+"""
+
+import asyncio
+import logging
+from logging.handlers import QueueListener
+import queue
+import statistics
+import time
+from typing import List, Tuple
+
+from fdk_organization_bff.gunicorn_config import (
+    DroppingQueueHandler,
+    StackdriverJsonFormatter,
+)
+
+RECORDS = 20000
+BURST = 200
+QUEUE_SIZE = 10000
+WRITE_DELAY = 0.00002
+
+
+class SlowStream:
+    """Stream where every write blocks for WRITE_DELAY seconds."""
+
+    writes = 0
+
+    def write(self: "SlowStream", text: str) -> int:
+        """Block, then discard text."""
+        self.writes += 1
+        time.sleep(WRITE_DELAY)
+        return len(text)
+
+    def flush(self: "SlowStream") -> None:
+        """Nothing to flush."""
+
+
+async def ticker(lags: List[float], done: asyncio.Event) -> None:
+    """Record how late 1ms sleeps wake up."""
+    while not done.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(0.001)
+        lags.append((time.perf_counter() - start - 0.001) * 1000)
+
+
+async def log_heavily(logger: logging.Logger, done: asyncio.Event) -> None:
+    """Log bursts of records, yielding to the loop between bursts."""
+    for i in range(RECORDS):
+        logger.warning("upstream call failed", extra={"attempt": i, "id": "123"})
+        if i % BURST == 0:
+            await asyncio.sleep(0)
+    done.set()
+
+
+async def measure(logger: logging.Logger) -> List[float]:
+    """Return ticker lags in ms while logging."""
+    lags: List[float] = list()
+    done = asyncio.Event()
+    await asyncio.gather(ticker(lags, done), log_heavily(logger, done))
+    return lags
+
+
+def run(handler: logging.Handler) -> Tuple[List[float], float]:
+    """Return lags and wall time for logging through handler."""
+    logger = logging.getLogger(f"benchmark.{id(handler)}")
+    logger.propagate = False
+    logger.addHandler(handler)
+    start = time.perf_counter()
+    lags = asyncio.run(measure(logger))
+    return lags, time.perf_counter() - start
+
+
+def report(name: str, lags: List[float], elapsed: float) -> None:
+    """Print latency percentiles."""
+    lags = sorted(lags)
+    p99 = lags[int(len(lags) * 0.99) - 1] if lags else 0.0
+    print(
+        f"{name:<8} ticks={len(lags):6d} "
+        f"p50={statistics.median(lags) if lags else 0.0:8.3f}ms "
+        f"p99={p99:8.3f}ms max={max(lags) if lags else 0.0:8.3f}ms "
+        f"loop busy={elapsed:6.2f}s"
+    )
+
+
+def main() -> None:
+    """Compare blocking stream handler and dropping queue handler."""
+    blocking = logging.StreamHandler(SlowStream())
+    blocking.setFormatter(StackdriverJsonFormatter())
+    report("blocking", *run(blocking))
+
+    stream = SlowStream()
+    json_handler = logging.StreamHandler(stream)
+    json_handler.setFormatter(StackdriverJsonFormatter())
+    queued = DroppingQueueHandler(queue.Queue(QUEUE_SIZE))
+    listener = QueueListener(queued.queue, json_handler)
+    listener.start()
+    lags, elapsed = run(queued)
+    listener.stop()
+    report("queued", lags, elapsed)
+    print(f"queued   wrote {stream.writes} records incl. drop notices of {RECORDS}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""Compare dict per dataset metrics with columnar report storage.
+
+Gathers synthetic dataset report metrics, then reports memory per dataset
+of the dict of dicts and of the dictionary encoded columns, and the time
+to aggregate the report of every orgPath node from each. The dict variant
+is the per dataset loop reports used before columns.
+
+Usage: PYTHONPATH=src python benchmarks/report_columns.py [datasets]
+"""
+
+import gc
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Tuple
+
+from fdk_organization_bff.service.report_service import (
+    _dataset_columns,
+    _dataset_report,
+    _gather_grouped_dataset_metrics,
+    _rows_by_org_path_node,
+)
+from fdk_organization_bff.utils.utils import split_org_path
+
+DATASETS = 50000
+ORGANIZATIONS = 600
+
+
+def value(text: str) -> Dict[str, str]:
+    """Create binding value."""
+    return {"value": text}
+
+
+def synthetic_metrics(datasets: int) -> dict:
+    """Gather metrics of synthetic grouped dataset report bindings."""
+    general, formats, publishers = [], [], []
+    for i in range(datasets):
+        dataset = value(f"https://datasets.fellesdatakatalog.digdir.no/{i}")
+        org_id = str(900000000 + i % ORGANIZATIONS)
+        general.append(
+            {
+                "dataset": dataset,
+                "firstHarvested": value("2020-01-01T00:00:00Z"),
+                "isOpenData": value("true" if i % 3 else "false"),
+                "transportportal": value("true" if i % 7 == 0 else "false"),
+                "accessRights": value(("PUBLIC", "RESTRICTED", "NON_PUBLIC")[i % 3]),
+                "themes": value("\n".join(f"T{(i + t) % 13}" for t in range(i % 4))),
+            }
+        )
+        formats.append(
+            {
+                "dataset": dataset,
+                "formats": value("\n".join(f"F{(i + f) % 29}" for f in range(i % 5))),
+            }
+        )
+        publishers.append(
+            {
+                "dataset": dataset,
+                "orgId": value(org_id),
+                "orgPath": value(f"/STAT/{i % 40}/{org_id}"),
+            }
+        )
+    return _gather_grouped_dataset_metrics(formats, general, publishers)
+
+
+def allocated(build: Callable[[], Any]) -> Tuple[Any, int]:
+    """Return result of build and bytes it holds on to."""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+def dict_report(metrics: dict, uris: List[str]) -> Dict[str, Any]:
+    """Aggregate dataset report fields with one dict lookup loop per dataset."""
+    orgs, open_data, access_rights = set(), 0, dict()
+    org_paths: Dict[str, int] = dict()
+    format_counts: Dict[str, int] = dict()
+    theme_counts: Dict[str, int] = dict()
+    for uri in uris:
+        dataset = metrics[uri]
+        if dataset.get("orgId") is not None:
+            orgs.add(dataset["orgId"])
+        if dataset.get("isOpenData") == "true":
+            open_data += 1
+        access_right = dataset.get("accessRights")
+        if access_right is not None:
+            access_rights[access_right] = access_rights.get(access_right, 0) + 1
+        for format_value in dataset["formats"]:
+            format_counts[format_value] = format_counts.get(format_value, 0) + 1
+        for theme in dataset["allThemes"]:
+            theme_counts[theme] = theme_counts.get(theme, 0) + 1
+        for part in split_org_path(dataset.get("orgPath", "/MISSING")):
+            org_paths[part] = org_paths.get(part, 0) + 1
+    return {
+        "organizationCount": len(orgs),
+        "opendata": open_data,
+        "accessRights": access_rights,
+        "orgPaths": org_paths,
+        "formats": format_counts,
+        "allThemes": theme_counts,
+    }
+
+
+def timed(aggregate: Callable[[], None]) -> float:
+    """Return best of three run times of aggregate."""
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        aggregate()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    """Print memory per dataset and node aggregation time of both storages."""
+    datasets = int(sys.argv[1]) if len(sys.argv) > 1 else DATASETS
+    metrics, dict_size = allocated(lambda: synthetic_metrics(datasets))
+    columns, column_size = allocated(lambda: _dataset_columns(metrics))
+    rows_by_node = _rows_by_org_path_node(columns)
+    uris_by_node = {
+        node: [columns.uris[row] for row in rows] for node, rows in rows_by_node.items()
+    }
+
+    dict_time = timed(
+        lambda: [dict_report(metrics, uris) for uris in uris_by_node.values()]
+    )
+    column_time = timed(
+        lambda: [_dataset_report(columns, rows, None) for rows in rows_by_node.values()]
+    )
+    print(f"datasets={datasets:,d} nodes={len(rows_by_node):,d}")
+    for name, size, seconds in [
+        ("dicts", dict_size, dict_time),
+        ("columns", column_size, column_time),
+    ]:
+        print(
+            f"{name:<8} bytes/dataset={size / datasets:8.1f} "
+            f"aggregate all nodes={seconds:6.2f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
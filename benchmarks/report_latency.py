@@ -0,0 +1,185 @@
+"""Measure /ping and organization catalog latency while reports build.
+
+Starts a fake upstream (organization catalog, Enhetsregisteret, sparql and
+metadata quality) and the bff on local ports, keeps concept reports building
+over a large synthetic sparql response, and probes the light endpoints.
+Report snapshots expire at once, so every report request builds the report.
+Runs once with aggregation on the event loop and once in the process pool.
+
+Usage: PYTHONPATH=src python benchmarks/report_latency.py [bindings]
+"""
+
+import asyncio
+import json
+import logging
+import os
+import statistics
+import sys
+import time
+from typing import Dict, List
+
+from aiohttp import ClientSession, web
+
+UPSTREAM_PORT = 18081
+BFF_PORT = 18080
+UPSTREAM = f"http://127.0.0.1:{UPSTREAM_PORT}"
+BFF = f"http://127.0.0.1:{BFF_PORT}"
+DURATION = 10.0
+CONCURRENT_REPORTS = 2
+PROBE_INTERVAL = 0.02
+
+os.environ.update(
+    {
+        "ORGANIZATION_CATALOG_URI": UPSTREAM,
+        "DATA_BRREG_URI": UPSTREAM,
+        "FDK_SPARQL_URI": f"{UPSTREAM}/sparql",
+        "FDK_METADATA_QUALITY_URI": UPSTREAM,
+        "REFERENCE_DATA_URI": UPSTREAM,
+        "SLOW_REQUEST_THRESHOLD_MS": "0",
+        "REPORT_SNAPSHOT_TTL_SECONDS": "0",
+    }
+)
+
+from fdk_organization_bff.app import create_app  # noqa: E402
+from fdk_organization_bff.config import Config  # noqa: E402
+from fdk_organization_bff.utils.process_pool import (  # noqa: E402
+    shutdown_process_pool,
+)
+
+
+def concepts_response(bindings: int) -> bytes:
+    """Create sparql response for the concepts report query."""
+    return json.dumps(
+        {
+            "results": {
+                "bindings": [
+                    {
+                        "concept": {"value": f"https://concepts/{i // 2}"},
+                        "firstHarvested": {"value": "2020-01-01T00:00:00Z"},
+                        "orgId": {"value": str(900000000 + i % 500)},
+                        "orgPath": {"value": f"/STAT/{900000000 + i % 500}"},
+                        "referer": {"value": f"https://datasets/{i}"},
+                    }
+                    for i in range(bindings)
+                ]
+            }
+        }
+    ).encode()
+
+
+def fake_upstream(report: bytes) -> web.Application:
+    """Create app answering every upstream call made by the bff."""
+    empty = json.dumps({"results": {"bindings": []}}).encode()
+
+    async def sparql(request: web.Request) -> web.Response:
+        query = request.rel_url.query.get("query", "")
+        body = report if "?referer" in query else empty
+        return web.Response(body=body, content_type="application/json")
+
+    async def organization(request: web.Request) -> web.Response:
+        return web.json_response(
+            {
+                "organizationId": request.match_info["id"],
+                "name": "ORG",
+                "orgPath": f"/STAT/{request.match_info['id']}",
+            }
+        )
+
+    async def enhet(request: web.Request) -> web.Response:
+        return web.json_response({"organisasjonsnummer": request.match_info["id"]})
+
+    async def scores(request: web.Request) -> web.Response:
+        return web.json_response({})
+
+    app = web.Application()
+    app.add_routes(
+        [
+            web.get("/sparql", sparql),
+            web.get("/organizations/{id}", organization),
+            web.get("/enhetsregisteret/api/enheter/{id}", enhet),
+            web.post("/api/scores", scores),
+        ]
+    )
+    return app
+
+
+async def keep_reports_building(session: ClientSession, stop: asyncio.Event) -> int:
+    """Request concept reports until stopped, return number built."""
+    built = 0
+    while not stop.is_set():
+        async with session.get(f"{BFF}/reports/concepts") as response:
+            await response.read()
+        built += 1
+    return built
+
+
+async def probe(session: ClientSession, path: str, stop: asyncio.Event) -> List[float]:
+    """Return latencies in ms for path, requested every PROBE_INTERVAL."""
+    latencies: List[float] = list()
+    while not stop.is_set():
+        start = time.perf_counter()
+        async with session.get(f"{BFF}{path}") as response:
+            await response.read()
+        latencies.append((time.perf_counter() - start) * 1000)
+        await asyncio.sleep(PROBE_INTERVAL)
+    return latencies
+
+
+def summary(latencies: List[float]) -> str:
+    """Format latency percentiles."""
+    latencies = sorted(latencies)
+    p99 = latencies[max(int(len(latencies) * 0.99) - 1, 0)]
+    return (
+        f"n={len(latencies):4d} p50={statistics.median(latencies):8.1f}ms "
+        f"p99={p99:8.1f}ms max={latencies[-1]:8.1f}ms"
+    )
+
+
+async def measure(workers: int) -> Dict[str, str]:
+    """Run load with given number of report processes."""
+    shutdown_process_pool()
+    Config._REPORT_PROCESS_WORKERS = workers
+    stop = asyncio.Event()
+    async with ClientSession() as session:
+        async with session.get(f"{BFF}/reports/concepts") as response:
+            await response.read()
+        reports = [
+            asyncio.ensure_future(keep_reports_building(session, stop))
+            for _ in range(CONCURRENT_REPORTS)
+        ]
+        ping = asyncio.ensure_future(probe(session, "/ping", stop))
+        catalog = asyncio.ensure_future(
+            probe(session, "/organizationcatalogs/910244132", stop)
+        )
+        await asyncio.sleep(DURATION)
+        stop.set()
+        built = sum(await asyncio.gather(*reports))
+        return {
+            "reports built": str(built),
+            "/ping": summary(await ping),
+            "/organizationcatalogs/{id}": summary(await catalog),
+        }
+
+
+async def main(bindings: int) -> None:
+    """Start fake upstream and bff, then measure both modes."""
+    logging.disable(logging.WARNING)
+    upstream = web.AppRunner(fake_upstream(concepts_response(bindings)))
+    await upstream.setup()
+    await web.TCPSite(upstream, "127.0.0.1", UPSTREAM_PORT).start()
+    bff = web.AppRunner(await create_app())
+    await bff.setup()
+    await web.TCPSite(bff, "127.0.0.1", BFF_PORT).start()
+
+    try:
+        for name, workers in [("event loop", 0), ("process pool", 1)]:
+            print(f"aggregation on {name}, {bindings} bindings:")
+            for key, value in (await measure(workers)).items():
+                print(f"  {key:<28} {value}")
+    finally:
+        await bff.cleanup()
+        await upstream.cleanup()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000))
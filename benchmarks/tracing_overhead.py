@@ -0,0 +1,50 @@
+"""Measure per-request overhead of tracing at a given sample rate.
+
+Usage: PYTHONPATH=src python benchmarks/tracing_overhead.py [sample_rate]
+"""
+
+import asyncio
+import logging
+import sys
+import time
+
+from fdk_organization_bff.utils.tracing import end_trace, span, start_trace, traced
+
+REQUESTS = 20000
+UPSTREAM_CALLS = 6
+
+
+@traced("service")
+async def service() -> None:
+    """Simulate a service call with upstream calls."""
+    for _ in range(UPSTREAM_CALLS):
+        with span("upstream GET", **{"http.url": "http://upstream"}):
+            pass
+
+
+async def run(sample_rate: float) -> float:
+    """Return mean microseconds per request."""
+    start = time.perf_counter()
+    for _ in range(REQUESTS):
+        token = start_trace("GET /organizationcatalogs", None, sample_rate)
+        await service()
+        if token is not None:
+            end_trace(token, **{"http.status_code": 200})
+    return (time.perf_counter() - start) / REQUESTS * 1e6
+
+
+def main() -> None:
+    """Compare untraced requests to requests traced at the given rate."""
+    logging.getLogger("fdk_organization_bff.tracing").addHandler(logging.NullHandler())
+    logging.getLogger("fdk_organization_bff.tracing").propagate = False
+    sample_rate = float(sys.argv[1]) if len(sys.argv) > 1 else 1.0
+
+    baseline = asyncio.run(run(0.0))
+    traced_mean = asyncio.run(run(sample_rate))
+    print(f"untraced:          {baseline:8.2f} us/request")
+    print(f"sample rate {sample_rate:<5}: {traced_mean:8.2f} us/request")
+    print(f"overhead:          {traced_mean - baseline:8.2f} us/request")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,24 +1,57 @@
 """Module for starting an aiohttp API."""
 
+import asyncio
+import contextlib
 import logging
 import os
+from typing import AsyncIterator
 
 from aiohttp import web
 from aiohttp_middlewares import cors_middleware
 
 from fdk_organization_bff.config import Config
+from fdk_organization_bff.middlewares import (
+    overload_middleware,
+    profiling_middleware,
+    server_timing_middleware,
+    slow_request_middleware,
+    staleness_middleware,
+    tracing_middleware,
+)
 from fdk_organization_bff.resources import (
+    AllReportsView,
     ConceptReportView,
     DataServiceReportView,
     DatasetsReportView,
     InformationModelReportView,
+    Metrics,
     MunicipalityCategories,
     OrgCatalog,
     OrgCatalogs,
+    OrgCatalogsBatch,
     Ping,
+    Profiling,
     Ready,
+    ReportTimeSeriesView,
     StateCategories,
 )
+from fdk_organization_bff.service.organization_directory import (
+    organization_directory,
+)
+from fdk_organization_bff.service.upstream_pools import upstream_pools
+from fdk_organization_bff.service.warm_snapshot import (
+    load_snapshot,
+    save_periodically,
+    save_snapshot,
+)
+from fdk_organization_bff.utils.process_pool import shutdown_process_pool
+from fdk_organization_bff.utils.profiler import request_profiler
+from fdk_organization_bff.utils.tracing import configure_span_export
+
+organization_directory_refresh = web.AppKey(
+    "organization_directory_refresh", asyncio.Task
+)
+warm_snapshot_saver = web.AppKey("warm_snapshot_saver", asyncio.Task)
 
 
 def setup_routes(app: web.Application) -> None:
@@ -27,6 +60,8 @@ def setup_routes(app: web.Application) -> None:
         [
             web.get(Config.routes()["PING"], Ping),
             web.get(Config.routes()["READY"], Ready),
+            web.get(Config.routes()["METRICS"], Metrics),
+            web.view(Config.routes()["ORG_CATALOGS_BATCH"], OrgCatalogsBatch),
             web.get(Config.routes()["ORG_CATALOG"], OrgCatalog),
             web.get(Config.routes()["ORG_CATALOGS"], OrgCatalogs),
             web.get(Config.routes()["STATE_CATEGORIES"], StateCategories),
@@ -37,8 +72,41 @@ def setup_routes(app: web.Application) -> None:
             web.get(
                 Config.routes()["INFORMATION_MODEL_REPORT"], InformationModelReportView
             ),
+            web.get(Config.routes()["ALL_REPORTS"], AllReportsView),
+            web.get(Config.routes()["REPORT_TIMESERIES"], ReportTimeSeriesView),
         ]
     )
+    if Config.profiling_secret():
+        app.router.add_view(Config.routes()["PROFILING"], Profiling)
+
+
+async def background_tasks(app: web.Application) -> AsyncIterator[None]:
+    """Run upstream pools and background refresh while the application is up."""
+    snapshot_path = Config.warm_snapshot_path()
+    if snapshot_path:
+        load_snapshot(snapshot_path)
+        app[warm_snapshot_saver] = asyncio.create_task(
+            save_periodically(snapshot_path, Config.warm_snapshot_interval_seconds())
+        )
+    upstream_pools.start()
+    app[organization_directory_refresh] = asyncio.create_task(
+        organization_directory.refresh_periodically(
+            Config.organization_directory_refresh_seconds()
+        )
+    )
+
+    yield
+
+    app[organization_directory_refresh].cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await app[organization_directory_refresh]
+    if snapshot_path:
+        app[warm_snapshot_saver].cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await app[warm_snapshot_saver]
+        await save_snapshot(snapshot_path)
+    shutdown_process_pool()
+    await upstream_pools.close()
 
 
 async def create_app() -> web.Application:
@@ -48,18 +116,31 @@ async def create_app() -> web.Application:
 
     allow_all = "*" in origins
 
-    app = web.Application(
-        middlewares=[
-            cors_middleware(
-                allow_all=allow_all,
-                origins=None if allow_all else origins,
-                allow_methods=["GET"],
-                allow_headers=["*"],
-            )
-        ]
-    )
+    middlewares = [
+        cors_middleware(
+            allow_all=allow_all,
+            origins=None if allow_all else origins,
+            allow_methods=["GET", "POST"],
+            allow_headers=["*"],
+        )
+    ]
+    if Config.trace_sample_rate() > 0:
+        middlewares.append(tracing_middleware(Config.trace_sample_rate()))
+    if Config.slow_request_threshold_ms() > 0:
+        middlewares.append(slow_request_middleware(Config.slow_request_threshold_ms()))
+    if Config.server_timing_sample_rate() > 0:
+        middlewares.append(server_timing_middleware(Config.server_timing_sample_rate()))
+
+    if Config.profiling_secret():
+        middlewares.append(profiling_middleware(request_profiler))
+    middlewares.append(staleness_middleware())
+    middlewares.append(overload_middleware(Config.overload_retry_after_seconds()))
+
+    app = web.Application(middlewares=middlewares)
 
     logging.basicConfig(level=logging.INFO)
+    configure_span_export()
     setup_routes(app)
+    app.cleanup_ctx.append(background_tasks)
 
     return app
@@ -3,7 +3,9 @@
 Modules:
     catalog_quality_score
     filter_enum
+    municipality_lookup
     organization_catalog
+    organization_catalog_batch
     organization_catalog_list
     organization_catalog_summary
     organization_category
@@ -12,11 +14,16 @@ Modules:
     organization_details
     organization_concepts
     organization_informationmodels
+    upstream_enum
 """
 
 from fdk_organization_bff.classes.catalog_quality_score import CatalogQualityScore
 from fdk_organization_bff.classes.filter_enum import FilterEnum
+from fdk_organization_bff.classes.municipality_lookup import MunicipalityLookup
 from fdk_organization_bff.classes.organization_catalog import OrganizationCatalog
+from fdk_organization_bff.classes.organization_catalog_batch import (
+    OrganizationCatalogBatch,
+)
 from fdk_organization_bff.classes.organization_catalog_list import (
     OrganizationCatalogList,
 )
@@ -37,8 +44,11 @@ from fdk_organization_bff.classes.organization_informationmodels import (
     OrganizationInformationmodels,
 )
 from fdk_organization_bff.classes.reports import (
+    AllReports,
     ConceptReport,
     DataServiceReport,
     DatasetsReport,
     InformationModelReport,
+    ReportTimeSeries,
 )
+from fdk_organization_bff.classes.upstream_enum import UpstreamEnum
@@ -0,0 +1,12 @@
+"""Municipality lookup data class."""
+
+from dataclasses import dataclass
+from typing import Dict, List
+
+
+@dataclass
+class MunicipalityLookup:
+    """Data class with fylker and the fylkesnummer of each fylke or kommune organization."""
+
+    fylker: List[Dict]
+    fylkesnummerByOrganization: Dict[str, str]
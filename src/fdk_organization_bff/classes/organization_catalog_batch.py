@@ -0,0 +1,13 @@
+"""Organization catalog batch data class."""
+
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from fdk_organization_bff.classes.organization_catalog import OrganizationCatalog
+
+
+@dataclass
+class OrganizationCatalogBatch:
+    """Data class wrapping organization catalogs keyed by organization id."""
+
+    organizations: Dict[str, Optional[OrganizationCatalog]]
@@ -48,3 +48,21 @@ class InformationModelReport:
     newLastWeek: int
     organizationCount: int
     orgPaths: list
+
+
+@dataclass
+class ReportTimeSeries:
+    """Data class wrapping harvested objects per time bucket."""
+
+    bucket: str
+    series: list
+
+
+@dataclass
+class AllReports:
+    """Data class wrapping the reports of all entity types."""
+
+    datasets: DatasetsReport
+    dataServices: DataServiceReport
+    concepts: ConceptReport
+    informationModels: InformationModelReport
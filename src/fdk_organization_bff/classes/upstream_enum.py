@@ -0,0 +1,13 @@
+"""Upstream enum class."""
+
+from enum import Enum
+
+
+class UpstreamEnum(Enum):
+    """Enum class with upstream services called by the bff."""
+
+    ORGANIZATION_CATALOG = "orgcatalog"
+    BRREG = "brreg"
+    SPARQL = "sparql"
+    METADATA_QUALITY = "mqa"
+    REFERENCE_DATA = "referencedata"
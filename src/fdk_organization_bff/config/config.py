@@ -1,7 +1,7 @@
 """Configure fdk-organization-bff."""
 
 import os
-from typing import Dict, Type, TypeVar
+from typing import Dict, Optional, Type, TypeVar
 
 T = TypeVar("T", bound="Config")
 
@@ -18,12 +18,18 @@ class Config:
         "READY": "/ready",
         "ORG_CATALOG": _ORG_CATALOG_PATH + "/{id}",
         "ORG_CATALOGS": _ORG_CATALOG_PATH,
+        "ORG_CATALOGS_BATCH": _ORG_CATALOG_PATH + "/batch",
         "STATE_CATEGORIES": _ORG_CATEGORIES_PATH + "/state",
         "MUNICIPALITY_CATEGORIES": _ORG_CATEGORIES_PATH + "/municipality",
         "CONCEPT_REPORT": _REPORTS_PATH + "/concepts",
         "DATA_SERVICE_REPORT": _REPORTS_PATH + "/data-services",
         "DATASETS_REPORT": _REPORTS_PATH + "/datasets",
         "INFORMATION_MODEL_REPORT": _REPORTS_PATH + "/information-models",
+        "ALL_REPORTS": _REPORTS_PATH + "/all",
+        "REPORT_TIMESERIES": _REPORTS_PATH
+        + "/{type:datasets|data-services|concepts|information-models}/timeseries",
+        "PROFILING": "/admin/profiling",
+        "METRICS": "/metrics",
     }
     _ORGANIZATION_CATALOG_URI = os.getenv(
         "ORGANIZATION_CATALOG_URI",
@@ -45,6 +51,83 @@ class Config:
         "REFERENCE_DATA_URI",
         "https://staging.fellesdatakatalog.digdir.no",
     )
+    _ORG_CATALOG_BATCH_MAX_IDS = int(os.getenv("ORG_CATALOG_BATCH_MAX_IDS", "100"))
+    _ORG_CATALOG_BATCH_CONCURRENCY = int(
+        os.getenv("ORG_CATALOG_BATCH_CONCURRENCY", "10")
+    )
+    _ORGANIZATION_DIRECTORY_REFRESH_SECONDS = float(
+        os.getenv("ORGANIZATION_DIRECTORY_REFRESH_SECONDS", "900")
+    )
+    _MUNICIPALITY_LOOKUP_TTL_SECONDS = float(
+        os.getenv("MUNICIPALITY_LOOKUP_TTL_SECONDS", str(7 * 24 * 60 * 60))
+    )
+    _MUNICIPALITY_LOOKUP_PATH = os.getenv("MUNICIPALITY_LOOKUP_PATH")
+    _BRREG_CACHE_SIZE = int(os.getenv("BRREG_CACHE_SIZE", "5000"))
+    _BRREG_CACHE_TTL_SECONDS = float(
+        os.getenv("BRREG_CACHE_TTL_SECONDS", str(24 * 60 * 60))
+    )
+    _BRREG_CACHE_NEGATIVE_TTL_SECONDS = float(
+        os.getenv("BRREG_CACHE_NEGATIVE_TTL_SECONDS", str(10 * 60))
+    )
+    _SERVER_TIMING_SAMPLE_RATE = float(os.getenv("SERVER_TIMING_SAMPLE_RATE", "0"))
+    _TRACE_SAMPLE_RATE = float(os.getenv("TRACE_SAMPLE_RATE", "0"))
+    _TRACE_EXPORT_PATH = os.getenv("TRACE_EXPORT_PATH")
+    _PROFILING_SECRET = os.getenv("PROFILING_SECRET")
+    _REPORT_PROCESS_WORKERS = int(os.getenv("REPORT_PROCESS_WORKERS", "1"))
+    _DATASETS_REPORT_QUERY_MODE = os.getenv("DATASETS_REPORT_QUERY_MODE", "grouped")
+    _REPORT_SNAPSHOT_TTL_SECONDS = float(
+        os.getenv("REPORT_SNAPSHOT_TTL_SECONDS", "900")
+    )
+    _MOST_IN_USE_MAX_LIMIT = int(os.getenv("MOST_IN_USE_MAX_LIMIT", "100"))
+    _REPORT_LIMIT_MAX = int(os.getenv("REPORT_LIMIT_MAX", "1000"))
+    _UPSTREAM_POOLS = {
+        upstream: {
+            "limit": int(os.getenv(f"{upstream}_POOL_LIMIT", str(limit))),
+            "keepalive_timeout": float(
+                os.getenv(f"{upstream}_POOL_KEEPALIVE_SECONDS", "15")
+            ),
+            "dns_cache_ttl": int(
+                os.getenv(f"{upstream}_POOL_DNS_CACHE_SECONDS", "300")
+            ),
+        }
+        for upstream, limit in [
+            ("ORGANIZATION_CATALOG", 20),
+            ("BRREG", 10),
+            ("SPARQL", 30),
+            ("METADATA_QUALITY", 10),
+            ("REFERENCE_DATA", 5),
+        ]
+    }
+    _UPSTREAM_ADMISSION = {
+        upstream: {
+            "concurrency": int(
+                os.getenv(f"{upstream}_MAX_CONCURRENCY", str(concurrency))
+            ),
+            "queue": int(os.getenv(f"{upstream}_MAX_QUEUE", str(4 * concurrency))),
+            "queue_timeout": float(
+                os.getenv(f"{upstream}_QUEUE_TIMEOUT_SECONDS", "1.0")
+            ),
+        }
+        for upstream, concurrency in [
+            ("ORGANIZATION_CATALOG", 20),
+            ("BRREG", 10),
+            ("SPARQL", 16),
+            ("METADATA_QUALITY", 10),
+            ("REFERENCE_DATA", 5),
+        ]
+    }
+    _WARM_SNAPSHOT_PATH = os.getenv("WARM_SNAPSHOT_PATH")
+    _WARM_SNAPSHOT_INTERVAL_SECONDS = float(
+        os.getenv("WARM_SNAPSHOT_INTERVAL_SECONDS", "600")
+    )
+    _LAST_KNOWN_GOOD_MAX_ENTRIES = int(os.getenv("LAST_KNOWN_GOOD_MAX_ENTRIES", "2000"))
+    _OVERLOAD_RETRY_AFTER_SECONDS = int(os.getenv("OVERLOAD_RETRY_AFTER_SECONDS", "5"))
+    _SPARQL_POST_THRESHOLD_BYTES = int(os.getenv("SPARQL_POST_THRESHOLD_BYTES", "2000"))
+    _SPARQL_RESULT_FORMAT = os.getenv("SPARQL_RESULT_FORMAT", "json")
+    _JSON_DECODE_OFFLOAD_BYTES = int(
+        os.getenv("JSON_DECODE_OFFLOAD_BYTES", str(256 * 1024))
+    )
+    _SLOW_REQUEST_THRESHOLD_MS = float(os.getenv("SLOW_REQUEST_THRESHOLD_MS", "2000"))
 
     @classmethod
     def routes(cls: Type[T]) -> Dict[str, str]:
@@ -75,3 +158,142 @@ class Config:
     def reference_data_uri(cls: Type[T]) -> str:
         """Return reference-data URI."""
         return cls._REFERENCE_DATA_URI
+
+    @classmethod
+    def org_catalog_batch_max_ids(cls: Type[T]) -> int:
+        """Max number of organization ids accepted by the batch endpoint."""
+        return cls._ORG_CATALOG_BATCH_MAX_IDS
+
+    @classmethod
+    def org_catalog_batch_concurrency(cls: Type[T]) -> int:
+        """Max number of concurrent per-organization upstream calls in a batch."""
+        return cls._ORG_CATALOG_BATCH_CONCURRENCY
+
+    @classmethod
+    def organization_directory_refresh_seconds(cls: Type[T]) -> float:
+        """Seconds between background refreshes of the organization directory."""
+        return cls._ORGANIZATION_DIRECTORY_REFRESH_SECONDS
+
+    @classmethod
+    def municipality_lookup_ttl_seconds(cls: Type[T]) -> float:
+        """Seconds the municipality lookup from reference-data is kept."""
+        return cls._MUNICIPALITY_LOOKUP_TTL_SECONDS
+
+    @classmethod
+    def municipality_lookup_path(cls: Type[T]) -> Optional[str]:
+        """File the municipality lookup is persisted to, None to keep it in memory only."""
+        return cls._MUNICIPALITY_LOOKUP_PATH
+
+    @classmethod
+    def brreg_cache_size(cls: Type[T]) -> int:
+        """Max number of Enhetsregisteret responses kept in memory."""
+        return cls._BRREG_CACHE_SIZE
+
+    @classmethod
+    def brreg_cache_ttl_seconds(cls: Type[T]) -> float:
+        """Seconds an Enhetsregisteret response is kept."""
+        return cls._BRREG_CACHE_TTL_SECONDS
+
+    @classmethod
+    def brreg_cache_negative_ttl_seconds(cls: Type[T]) -> float:
+        """Seconds an empty Enhetsregisteret response is kept."""
+        return cls._BRREG_CACHE_NEGATIVE_TTL_SECONDS
+
+    @classmethod
+    def server_timing_sample_rate(cls: Type[T]) -> float:
+        """Share of responses with Server-Timing header, 0 disables it."""
+        return cls._SERVER_TIMING_SAMPLE_RATE
+
+    @classmethod
+    def trace_sample_rate(cls: Type[T]) -> float:
+        """Share of requests traced, incoming traces included, 0 disables it."""
+        return cls._TRACE_SAMPLE_RATE
+
+    @classmethod
+    def trace_export_path(cls: Type[T]) -> Optional[str]:
+        """File spans are written to as json lines, None to log them."""
+        return cls._TRACE_EXPORT_PATH
+
+    @classmethod
+    def profiling_secret(cls: Type[T]) -> Optional[str]:
+        """Secret required to profile requests, None disables profiling."""
+        return cls._PROFILING_SECRET
+
+    @classmethod
+    def slow_request_threshold_ms(cls: Type[T]) -> float:
+        """Milliseconds after which a request is logged as slow, 0 disables it."""
+        return cls._SLOW_REQUEST_THRESHOLD_MS
+
+    @classmethod
+    def report_process_workers(cls: Type[T]) -> int:
+        """Size of the report process pool, 0 aggregates on the event loop."""
+        return cls._REPORT_PROCESS_WORKERS
+
+    @classmethod
+    def json_decode_offload_bytes(cls: Type[T]) -> int:
+        """Size from which upstream json is decoded on a thread pool."""
+        return cls._JSON_DECODE_OFFLOAD_BYTES
+
+    @classmethod
+    def report_snapshot_ttl_seconds(cls: Type[T]) -> float:
+        """Return seconds report snapshots are used before they are rebuilt."""
+        return cls._REPORT_SNAPSHOT_TTL_SECONDS
+
+    @classmethod
+    def most_in_use_max_limit(cls: Type[T]) -> int:
+        """Return number of most referred concepts kept in concept reports."""
+        return cls._MOST_IN_USE_MAX_LIMIT
+
+    @classmethod
+    def report_limit_max(cls: Type[T]) -> int:
+        """Return largest value accepted for report limit query params."""
+        return cls._REPORT_LIMIT_MAX
+
+    @classmethod
+    def datasets_report_grouped(cls: Type[T]) -> bool:
+        """Aggregate themes and formats per dataset in the sparql service."""
+        return cls._DATASETS_REPORT_QUERY_MODE != "rows"
+
+    @classmethod
+    def sparql_result_format(cls: Type[T]) -> str:
+        """Sparql result format to request: json, tsv or csv."""
+        return (
+            cls._SPARQL_RESULT_FORMAT
+            if cls._SPARQL_RESULT_FORMAT in ("json", "tsv", "csv")
+            else "json"
+        )
+
+    @classmethod
+    def upstream_pool(cls: Type[T], upstream: str) -> Dict[str, float]:
+        """Return connection limit, keep-alive and dns cache ttl of upstream's pool."""
+        return cls._UPSTREAM_POOLS[upstream]
+
+    @classmethod
+    def upstream_admission(cls: Type[T], upstream: str) -> Dict[str, float]:
+        """Return max concurrency, max queue length and queue timeout of upstream."""
+        return cls._UPSTREAM_ADMISSION[upstream]
+
+    @classmethod
+    def warm_snapshot_path(cls: Type[T]) -> Optional[str]:
+        """Return file warm state is snapshotted to, None to disable snapshots."""
+        return cls._WARM_SNAPSHOT_PATH
+
+    @classmethod
+    def warm_snapshot_interval_seconds(cls: Type[T]) -> float:
+        """Return seconds between periodic warm snapshots."""
+        return cls._WARM_SNAPSHOT_INTERVAL_SECONDS
+
+    @classmethod
+    def last_known_good_max_entries(cls: Type[T]) -> int:
+        """Return max number of last known good values kept for outages."""
+        return cls._LAST_KNOWN_GOOD_MAX_ENTRIES
+
+    @classmethod
+    def overload_retry_after_seconds(cls: Type[T]) -> int:
+        """Return Retry-After of 503 responses on overloaded or failing upstreams."""
+        return cls._OVERLOAD_RETRY_AFTER_SECONDS
+
+    @classmethod
+    def sparql_post_threshold_bytes(cls: Type[T]) -> int:
+        """Return encoded query length above which sparql queries are posted."""
+        return cls._SPARQL_POST_THRESHOLD_BYTES
@@ -1,10 +1,13 @@
 """Gunicorn module."""
 
+import atexit
 import logging
+from logging.handlers import QueueHandler, QueueListener
 import multiprocessing
 from os import environ as env
+import queue
 import sys
-from typing import Any
+from typing import Any, Optional
 
 from dotenv import load_dotenv
 from gunicorn import glogging
@@ -15,6 +18,7 @@ load_dotenv()
 HOST_PORT = env.get("HOST_PORT", "8080")
 DEBUG_MODE = env.get("DEBUG_MODE", False)
 LOG_LEVEL = env.get("LOG_LEVEL", "INFO")
+LOG_QUEUE_SIZE = int(env.get("LOG_QUEUE_SIZE", "10000"))
 
 # Gunicorn config
 bind = ":" + HOST_PORT
@@ -32,7 +36,7 @@ class StackdriverJsonFormatter(json.JsonFormatter, object):
         fmt: str = "%(levelname) %(message)",
         style: str = "%",
         *args: Any,
-        **kwargs: Any
+        **kwargs: Any,
     ) -> None:
         """Init json-logger."""
         json.JsonFormatter.__init__(self, fmt=fmt, *args, **kwargs)
@@ -45,13 +49,68 @@ class StackdriverJsonFormatter(json.JsonFormatter, object):
         return super(StackdriverJsonFormatter, self).process_log_record(log_record)
 
 
+class DroppingQueueHandler(QueueHandler):
+    """Queue handler that drops records instead of blocking when the queue is full.
+
+    Records are queued unformatted, so formatting and writing both happen on the
+    listener thread. The number of dropped records is logged once the queue
+    accepts records again.
+    """
+
+    def __init__(self: Any, log_queue: queue.Queue) -> None:
+        """Init handler with a bounded queue."""
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self: Any, record: logging.LogRecord) -> logging.LogRecord:
+        """Return record unformatted, leaving formatting to the listener thread.
+
+        Unlike QueueHandler.prepare, msg, args and exc_info are kept, so the
+        json formatter still sees them. The queue never leaves the process, so
+        records need not be picklable, but args are rendered when the listener
+        writes the record, not when it is logged.
+        """
+        return record
+
+    def enqueue(self: Any, record: logging.LogRecord) -> None:
+        """Put record on queue without blocking, count it as dropped when full."""
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+            return
+
+        if self.dropped:
+            dropped, self.dropped = self.dropped, 0
+            try:
+                self.queue.put_nowait(
+                    logging.LogRecord(
+                        record.name,
+                        logging.WARNING,
+                        __file__,
+                        0,
+                        f"Dropped {dropped} log records, log queue was full",
+                        None,
+                        None,
+                    )
+                )
+            except queue.Full:
+                self.dropped += dropped
+
+
 # Override the logger to remove healthcheck (ping) from the access log and format logs as json
 class CustomGunicornLogger(glogging.Logger):
     """Custom Gunicorn Logger class."""
 
+    log_handler: Optional[DroppingQueueHandler] = None
+    log_listener: Optional[QueueListener] = None
+    json_handler: Optional[logging.Handler] = None
+    exit_registered = False
+
     def setup(self: Any, cfg: Any) -> None:
-        """Set up function."""
+        """Set up function, called again on reload."""
         super().setup(cfg)
+        self.stop_log_listener()
 
         access_logger = logging.getLogger("gunicorn.access")
         access_logger.addFilter(PingFilter())
@@ -71,13 +130,37 @@ class CustomGunicornLogger(glogging.Logger):
         loggers.append(root_logger)
         loggers.append(access_logger)
 
-        json_handler = logging.StreamHandler(sys.stdout)
-        json_handler.setFormatter(StackdriverJsonFormatter())
+        self.json_handler = logging.StreamHandler(sys.stdout)
+        self.json_handler.setFormatter(StackdriverJsonFormatter())
+        self.log_handler = DroppingQueueHandler(queue.Queue(LOG_QUEUE_SIZE))
 
         for logger in loggers:
             for handler in logger.handlers:
                 logger.removeHandler(handler)
-            logger.addHandler(json_handler)
+            logger.addHandler(self.log_handler)
+
+        self.start_log_listener()
+        if not self.exit_registered:
+            atexit.register(self.stop_log_listener)
+            self.exit_registered = True
+
+    def start_log_listener(self: Any) -> None:
+        """Start thread writing queued records, also needed after fork.
+
+        A fresh queue is used since a queue lock held by the parent's listener
+        thread at fork would never be released in the child.
+        """
+        if self.log_handler is None or self.json_handler is None:
+            return
+        self.log_handler.queue = queue.Queue(LOG_QUEUE_SIZE)
+        self.log_listener = QueueListener(self.log_handler.queue, self.json_handler)
+        self.log_listener.start()
+
+    def stop_log_listener(self: Any) -> None:
+        """Write remaining queued records and stop the listener thread."""
+        if self.log_listener is not None:
+            self.log_listener.stop()
+            self.log_listener = None
 
 
 class PingFilter(logging.Filter):
@@ -105,3 +188,15 @@ class BlackboxExporterFilter(logging.Filter):
 
 
 logger_class = CustomGunicornLogger
+
+
+def post_fork(server: Any, worker: Any) -> None:
+    """Start log listener in worker, threads do not survive fork."""
+    if isinstance(worker.log, CustomGunicornLogger):
+        worker.log.start_log_listener()
+
+
+def worker_exit(server: Any, worker: Any) -> None:
+    """Flush queued log records before the worker exits."""
+    if isinstance(worker.log, CustomGunicornLogger):
+        worker.log.stop_log_listener()
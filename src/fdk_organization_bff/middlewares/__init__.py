@@ -0,0 +1,17 @@
+"""Middlewares package.
+
+Modules:
+    overload
+    profiling
+    server_timing
+    slow_request
+    staleness
+    tracing
+"""
+
+from .overload import overload_middleware
+from .profiling import profiling_middleware
+from .server_timing import server_timing_middleware
+from .slow_request import slow_request_middleware
+from .staleness import staleness_middleware
+from .tracing import tracing_middleware
@@ -0,0 +1,27 @@
+"""Middleware module answering 503 when an upstream is overloaded or failing."""
+
+import logging
+from typing import Awaitable, Callable
+
+from aiohttp.web import HTTPServiceUnavailable, middleware, Request, StreamResponse
+
+from fdk_organization_bff.service.admission_control import UpstreamOverloadedError
+from fdk_organization_bff.service.sparql_client import SparqlQueryError
+
+Handler = Callable[[Request], Awaitable[StreamResponse]]
+
+
+def overload_middleware(retry_after_seconds: int) -> Callable:
+    """Create middleware turning rejected or failed upstream calls into 503."""
+
+    @middleware
+    async def overload(request: Request, handler: Handler) -> StreamResponse:
+        try:
+            return await handler(request)
+        except (UpstreamOverloadedError, SparqlQueryError) as error:
+            logging.warning(f"Rejected {request.method} {request.path}: {error}")
+            raise HTTPServiceUnavailable(
+                headers={"Retry-After": str(retry_after_seconds)}
+            )
+
+    return overload
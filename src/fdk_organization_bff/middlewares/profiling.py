@@ -0,0 +1,30 @@
+"""Middleware module for on-demand request profiling."""
+
+from typing import Awaitable, Callable
+
+from aiohttp.web import middleware, Request, StreamResponse
+
+from fdk_organization_bff.utils.profiler import PROFILE_HEADER, RequestProfiler
+
+Handler = Callable[[Request], Awaitable[StreamResponse]]
+
+
+def profiling_middleware(profiler: RequestProfiler) -> Callable:
+    """Create middleware profiling requests selected by profiler."""
+
+    @middleware
+    async def profiling(request: Request, handler: Handler) -> StreamResponse:
+        if not profiler.should_profile(
+            request.path, request.headers.get(PROFILE_HEADER)
+        ):
+            return await handler(request)
+
+        response = await profiler.profile(
+            f"{request.method} {request.path_qs}", lambda: handler(request)
+        )
+        profile_id = profiler.last_id()
+        if profile_id and not response.prepared:
+            response.headers["X-Profile-Id"] = profile_id
+        return response
+
+    return profiling
@@ -0,0 +1,39 @@
+"""Middleware module for Server-Timing headers."""
+
+import random
+import time
+from typing import Awaitable, Callable
+
+from aiohttp.web import middleware, Request, StreamResponse
+
+from fdk_organization_bff.utils.request_timings import (
+    current_request_timings,
+    start_request_timings,
+    stop_request_timings,
+)
+
+Handler = Callable[[Request], Awaitable[StreamResponse]]
+
+
+def server_timing_middleware(sample_rate: float) -> Callable:
+    """Create middleware adding Server-Timing to a sample_rate share of responses."""
+
+    @middleware
+    async def server_timing(request: Request, handler: Handler) -> StreamResponse:
+        if random.random() >= sample_rate:  # noqa: S311
+            return await handler(request)
+
+        token = start_request_timings()
+        start = time.perf_counter()
+        try:
+            response = await handler(request)
+            timings = current_request_timings()
+            if timings is not None and not response.prepared:
+                response.headers["Server-Timing"] = timings.server_timing_header(
+                    (time.perf_counter() - start) * 1000
+                )
+            return response
+        finally:
+            stop_request_timings(token)
+
+    return server_timing
@@ -0,0 +1,57 @@
+"""Middleware module for logging slow requests."""
+
+import logging
+import time
+from typing import Awaitable, Callable
+
+from aiohttp.web import HTTPException, middleware, Request, StreamResponse
+
+from fdk_organization_bff.utils.request_timings import (
+    current_request_timings,
+    start_request_timings,
+    stop_request_timings,
+)
+
+Handler = Callable[[Request], Awaitable[StreamResponse]]
+
+slow_request_logger = logging.getLogger("fdk_organization_bff.slow_requests")
+
+
+def slow_request_middleware(threshold_ms: float) -> Callable:
+    """Create middleware logging requests slower than threshold_ms."""
+
+    @middleware
+    async def slow_request(request: Request, handler: Handler) -> StreamResponse:
+        token = start_request_timings()
+        start = time.perf_counter()
+        status = 500
+        try:
+            response = await handler(request)
+            status = response.status
+            return response
+        except HTTPException as error:
+            status = error.status
+            raise
+        finally:
+            total_ms = (time.perf_counter() - start) * 1000
+            timings = current_request_timings()
+            if total_ms >= threshold_ms and timings is not None:
+                route = request.match_info.route.resource
+                slow_request_logger.warning(
+                    f"Slow request {request.method} {request.path} "
+                    f"took {total_ms:.0f}ms",
+                    extra={
+                        "slowRequest": {
+                            "method": request.method,
+                            "route": route.canonical if route else request.path,
+                            "path": request.path,
+                            "params": dict(request.rel_url.query),
+                            "status": status,
+                            "totalMs": round(total_ms, 1),
+                            **timings.to_dict(),
+                        }
+                    },
+                )
+            stop_request_timings(token)
+
+    return slow_request
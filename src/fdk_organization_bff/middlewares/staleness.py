@@ -0,0 +1,34 @@
+"""Middleware module marking responses built from stale data."""
+
+from typing import Awaitable, Callable
+
+from aiohttp.web import middleware, Request, StreamResponse
+
+from fdk_organization_bff.utils.staleness import (
+    current_staleness,
+    start_staleness,
+    stop_staleness,
+)
+
+Handler = Callable[[Request], Awaitable[StreamResponse]]
+
+STALE_WARNING = '110 - "Response is Stale"'
+
+
+def staleness_middleware() -> Callable:
+    """Create middleware adding Warning and Age headers to stale responses."""
+
+    @middleware
+    async def staleness(request: Request, handler: Handler) -> StreamResponse:
+        token = start_staleness()
+        try:
+            response = await handler(request)
+            recorded = current_staleness()
+            if recorded is not None and recorded.ages:
+                response.headers["Warning"] = STALE_WARNING
+                response.headers["Age"] = str(int(recorded.max_age))
+            return response
+        finally:
+            stop_staleness(token)
+
+    return staleness
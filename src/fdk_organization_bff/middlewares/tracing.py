@@ -0,0 +1,46 @@
+"""Middleware module for request tracing."""
+
+from typing import Awaitable, Callable
+
+from aiohttp.web import HTTPException, middleware, Request, StreamResponse
+
+from fdk_organization_bff.utils.tracing import end_trace, start_trace
+
+Handler = Callable[[Request], Awaitable[StreamResponse]]
+
+
+def tracing_middleware(sample_rate: float) -> Callable:
+    """Create middleware tracing sampled requests."""
+
+    @middleware
+    async def tracing(request: Request, handler: Handler) -> StreamResponse:
+        route = request.match_info.route.resource
+        route_name = route.canonical if route else request.path
+        token = start_trace(
+            f"{request.method} {route_name}",
+            request.headers.get("traceparent"),
+            sample_rate,
+        )
+        if token is None:
+            return await handler(request)
+
+        status = 500
+        try:
+            response = await handler(request)
+            status = response.status
+            return response
+        except HTTPException as error:
+            status = error.status
+            raise
+        finally:
+            end_trace(
+                token,
+                **{
+                    "http.method": request.method,
+                    "http.route": route_name,
+                    "http.target": request.path_qs,
+                    "http.status_code": status,
+                },
+            )
+
+    return tracing
@@ -3,21 +3,29 @@
 Modules:
     ping
     ready
+    metrics
     org_catalog
     org_catalogs
+    org_catalogs_batch
+    profiling
     state_categories
     municipality_categories
 """
 
+from .metrics import Metrics
 from .municipality_categories import MunicipalityCategories
 from .org_catalog import OrgCatalog
 from .org_catalogs import OrgCatalogs
+from .org_catalogs_batch import OrgCatalogsBatch
 from .ping import Ping
+from .profiling import Profiling
 from .ready import Ready
 from .reports import (
+    AllReportsView,
     ConceptReportView,
     DataServiceReportView,
     DatasetsReportView,
     InformationModelReportView,
+    ReportTimeSeriesView,
 )
 from .state_categories import StateCategories
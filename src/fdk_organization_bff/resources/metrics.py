@@ -0,0 +1,16 @@
+"""Resource module for metrics."""
+
+from aiohttp.web import Response, View
+
+from fdk_organization_bff.utils.metrics import metrics
+
+
+class Metrics(View):
+    """Class representing metrics resource."""
+
+    @staticmethod
+    async def get() -> Response:
+        """Get metrics of this worker process in Prometheus text format."""
+        return Response(
+            text=metrics.exposition(), content_type="text/plain", charset="utf-8"
+        )
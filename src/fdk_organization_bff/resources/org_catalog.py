@@ -1,13 +1,11 @@
 """Resource module for specific organization catalog."""
 
-from dataclasses import asdict
-
-from aiohttp.web import json_response, Response, View
+from aiohttp.web import Response, View
 
 from fdk_organization_bff.classes import FilterEnum
 from fdk_organization_bff.service.org_catalog_service import get_organization_catalog
 from fdk_organization_bff.utils.utils import filter_param_to_enum
-from .utils import fifteen_min_cache_header
+from .utils import dataclass_json_response, fifteen_min_cache_header
 
 
 class OrgCatalog(View):
@@ -23,6 +21,6 @@ class OrgCatalog(View):
                 self.request.match_info["id"], filter
             )
             if catalog:
-                return json_response(asdict(catalog), headers=fifteen_min_cache_header)
+                return dataclass_json_response(catalog, fifteen_min_cache_header)
             else:
                 return Response(status=404)
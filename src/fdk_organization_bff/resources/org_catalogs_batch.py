@@ -0,0 +1,54 @@
+"""Resource module for a batch of organization catalogs."""
+
+import json
+from typing import List, Optional
+
+from aiohttp.web import Request, Response, View
+
+from fdk_organization_bff.classes import FilterEnum
+from fdk_organization_bff.config import Config
+from fdk_organization_bff.service.org_catalog_service import (
+    get_organization_catalogs_batch,
+)
+from fdk_organization_bff.utils.utils import filter_param_to_enum
+from .utils import dataclass_json_response, fifteen_min_cache_header
+
+
+def _unique_ids(ids: List) -> Optional[List[str]]:
+    """Strip and deduplicate ids, None if any id is invalid."""
+    if not all(isinstance(id, str) and id.strip() for id in ids):
+        return None
+    return list(dict.fromkeys(id.strip() for id in ids))
+
+
+async def _batch_response(request: Request, requested_ids: List) -> Response:
+    """Respond with organization catalogs for requested ids."""
+    filter = filter_param_to_enum(request.rel_url.query.get("filter"))
+    if (
+        filter is FilterEnum.INVALID
+        or len(requested_ids) > Config.org_catalog_batch_max_ids()
+    ):
+        return Response(status=400)
+    ids = _unique_ids(requested_ids)
+    if not ids:
+        return Response(status=400)
+    catalogs = await get_organization_catalogs_batch(ids, filter)
+    return dataclass_json_response(catalogs, fifteen_min_cache_header)
+
+
+class OrgCatalogsBatch(View):
+    """Class representing a batch of organization catalogs resource."""
+
+    async def get(self: View) -> Response:
+        """Get organization catalogs for ids given as comma separated query param."""
+        ids = self.request.rel_url.query.get("ids")
+        return await _batch_response(self.request, ids.split(",") if ids else [])
+
+    async def post(self: View) -> Response:
+        """Get organization catalogs for ids given in json body."""
+        try:
+            body = await self.request.json()
+        except json.JSONDecodeError:
+            return Response(status=400)
+        ids = body.get("ids") if isinstance(body, dict) else None
+        return await _batch_response(self.request, ids if isinstance(ids, list) else [])
@@ -0,0 +1,46 @@
+"""Resource module for on-demand request profiling."""
+
+import json
+
+from aiohttp.web import json_response, Response, View
+
+from fdk_organization_bff.utils.profiler import PROFILE_HEADER, request_profiler
+
+MAX_ARMED_REQUESTS = 100
+
+
+class Profiling(View):
+    """Class representing profiling admin resource."""
+
+    async def get(self: View) -> Response:
+        """Get armed paths and recent profiles."""
+        if not request_profiler.authorized(self.request.headers.get(PROFILE_HEADER)):
+            return Response(status=403)
+        return json_response(
+            {
+                "armed": request_profiler.armed(),
+                "profiles": request_profiler.results(),
+            }
+        )
+
+    async def post(self: View) -> Response:
+        """Profile the next count requests to path given in json body."""
+        if not request_profiler.authorized(self.request.headers.get(PROFILE_HEADER)):
+            return Response(status=403)
+        try:
+            body = await self.request.json()
+        except json.JSONDecodeError:
+            return Response(status=400)
+
+        path = body.get("path") if isinstance(body, dict) else None
+        count = body.get("count", 1) if isinstance(body, dict) else None
+        if (
+            not isinstance(path, str)
+            or not path.startswith("/")
+            or not isinstance(count, int)
+            or not 0 <= count <= MAX_ARMED_REQUESTS
+        ):
+            return Response(status=400)
+
+        request_profiler.arm(path, count)
+        return json_response({"armed": request_profiler.armed()})
@@ -1,17 +1,26 @@
 """Resource module for reports."""
 
-from dataclasses import asdict
 from typing import Optional
 
-from aiohttp.web import json_response, Response, View
+from aiohttp.web import Response, View
 
+from fdk_organization_bff.config import Config
 from fdk_organization_bff.service.report_service import (
+    get_all_reports,
     get_concept_report,
     get_data_service_report,
     get_dataset_report,
     get_information_model_report,
+    get_report_timeseries,
+    TIME_BUCKETS,
+)
+from .utils import (
+    dataclass_json_response,
+    facet_limits_param,
+    fifteen_min_cache_header,
+    limit_param,
+    new_since_param,
 )
-from .utils import fifteen_min_cache_header
 
 
 class DatasetsReportView(View):
@@ -21,8 +30,13 @@ class DatasetsReportView(View):
         """Get dataset report."""
         org_path: Optional[str] = self.request.rel_url.query.get("orgPath")
         theme_profile: Optional[str] = self.request.rel_url.query.get("themeprofile")
-        report = await get_dataset_report(org_path, theme_profile)
-        return json_response(asdict(report), headers=fifteen_min_cache_header)
+        try:
+            new_since = new_since_param(self.request.rel_url.query)
+            facets = facet_limits_param(self.request.rel_url.query)
+        except ValueError:
+            return Response(status=400)
+        report = await get_dataset_report(org_path, theme_profile, new_since, facets)
+        return dataclass_json_response(report, fifteen_min_cache_header)
 
 
 class DataServiceReportView(View):
@@ -31,8 +45,13 @@ class DataServiceReportView(View):
     async def get(self: View) -> Response:
         """Get data service report."""
         org_path: Optional[str] = self.request.rel_url.query.get("orgPath")
-        report = await get_data_service_report(org_path)
-        return json_response(asdict(report), headers=fifteen_min_cache_header)
+        try:
+            new_since = new_since_param(self.request.rel_url.query)
+            facets = facet_limits_param(self.request.rel_url.query)
+        except ValueError:
+            return Response(status=400)
+        report = await get_data_service_report(org_path, new_since, facets)
+        return dataclass_json_response(report, fifteen_min_cache_header)
 
 
 class ConceptReportView(View):
@@ -41,8 +60,16 @@ class ConceptReportView(View):
     async def get(self: View) -> Response:
         """Get concept report."""
         org_path: Optional[str] = self.request.rel_url.query.get("orgPath")
-        report = await get_concept_report(org_path)
-        return json_response(asdict(report), headers=fifteen_min_cache_header)
+        try:
+            new_since = new_since_param(self.request.rel_url.query)
+            facets = facet_limits_param(self.request.rel_url.query)
+            limit = limit_param(
+                self.request.rel_url.query, maximum=Config.most_in_use_max_limit()
+            )
+        except ValueError:
+            return Response(status=400)
+        report = await get_concept_report(org_path, new_since, limit, facets)
+        return dataclass_json_response(report, fifteen_min_cache_header)
 
 
 class InformationModelReportView(View):
@@ -51,5 +78,47 @@ class InformationModelReportView(View):
     async def get(self: View) -> Response:
         """Get information model report."""
         org_path: Optional[str] = self.request.rel_url.query.get("orgPath")
-        report = await get_information_model_report(org_path)
-        return json_response(asdict(report), headers=fifteen_min_cache_header)
+        try:
+            new_since = new_since_param(self.request.rel_url.query)
+            facets = facet_limits_param(self.request.rel_url.query)
+        except ValueError:
+            return Response(status=400)
+        report = await get_information_model_report(org_path, new_since, facets)
+        return dataclass_json_response(report, fifteen_min_cache_header)
+
+
+class AllReportsView(View):
+    """Class representing the combined report resource."""
+
+    async def get(self: View) -> Response:
+        """Get reports of all entity types."""
+        org_path: Optional[str] = self.request.rel_url.query.get("orgPath")
+        theme_profile: Optional[str] = self.request.rel_url.query.get("themeprofile")
+        try:
+            new_since = new_since_param(self.request.rel_url.query)
+            facets = facet_limits_param(self.request.rel_url.query)
+            limit = limit_param(
+                self.request.rel_url.query, maximum=Config.most_in_use_max_limit()
+            )
+        except ValueError:
+            return Response(status=400)
+        reports = await get_all_reports(
+            org_path, theme_profile, new_since, limit, facets
+        )
+        return dataclass_json_response(reports, fifteen_min_cache_header)
+
+
+class ReportTimeSeriesView(View):
+    """Class representing harvested objects per time bucket resource."""
+
+    async def get(self: View) -> Response:
+        """Get harvested objects of report type per week or month."""
+        org_path: Optional[str] = self.request.rel_url.query.get("orgPath")
+        theme_profile: Optional[str] = self.request.rel_url.query.get("themeprofile")
+        bucket = self.request.rel_url.query.get("bucket", "week")
+        if bucket not in TIME_BUCKETS:
+            return Response(status=400)
+        timeseries = await get_report_timeseries(
+            self.request.match_info["type"], org_path, bucket, theme_profile
+        )
+        return dataclass_json_response(timeseries, fifteen_min_cache_header)
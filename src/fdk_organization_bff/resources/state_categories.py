@@ -1,14 +1,13 @@
 """Resource module for state categories."""
 
-from dataclasses import asdict
 from typing import Optional
 
-from aiohttp.web import json_response, Response, View
+from aiohttp.web import Response, View
 
 from fdk_organization_bff.classes import FilterEnum
 from fdk_organization_bff.service.org_catalog_service import get_state_categories
 from fdk_organization_bff.utils.utils import filter_param_to_enum
-from .utils import fifteen_min_cache_header
+from .utils import dataclass_json_response, fifteen_min_cache_header
 
 
 class StateCategories(View):
@@ -22,4 +21,4 @@ class StateCategories(View):
             return Response(status=400)
         else:
             categories = await get_state_categories(filter, include_empty)
-            return json_response(asdict(categories), headers=fifteen_min_cache_header)
+            return dataclass_json_response(categories, fifteen_min_cache_header)
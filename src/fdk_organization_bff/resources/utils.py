@@ -1,5 +1,65 @@
 """Utils module for http resources."""
 
+from dataclasses import asdict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Mapping, Optional
+
+from aiohttp.web import json_response, Response
+
+from fdk_organization_bff.config import Config
+from fdk_organization_bff.service.report_service import FacetLimits
+from fdk_organization_bff.utils.request_timings import timed
+
 fifteen_min_cache_header = {
     "Cache-Control": "no-cache, no-store, max-age=900, must-revalidate"
 }
+
+
+def dataclass_json_response(data: Any, headers: Dict[str, str]) -> Response:
+    """Serialize data class to json response."""
+    with timed("serialization"):
+        return json_response(asdict(data), headers=headers)
+
+
+def new_since_param(query: Mapping[str, str]) -> Optional[datetime]:
+    """Parse newSince or windowDays query param, ValueError if invalid."""
+    new_since = query.get("newSince")
+    window_days = query.get("windowDays")
+    if new_since is not None and window_days is not None:
+        raise ValueError("newSince and windowDays are mutually exclusive")
+    if new_since is not None:
+        since = datetime.fromisoformat(new_since)
+        return since if since.tzinfo else since.replace(tzinfo=timezone.utc)
+    if window_days is not None:
+        days = int(window_days)
+        if days < 0:
+            raise ValueError("windowDays must not be negative")
+        try:
+            return datetime.now(timezone.utc) - timedelta(days=days)
+        except OverflowError as error:
+            raise ValueError("windowDays is out of range") from error
+    return None
+
+
+def limit_param(
+    query: Mapping[str, str], name: str = "limit", maximum: Optional[int] = None
+) -> Optional[int]:
+    """Parse positive integer query param name, ValueError if invalid."""
+    limit = query.get(name)
+    if limit is None:
+        return None
+    value = int(limit)
+    if value < 1:
+        raise ValueError(f"{name} must be positive")
+    maximum = Config.report_limit_max() if maximum is None else maximum
+    if value > maximum:
+        raise ValueError(f"{name} must be at most {maximum}")
+    return value
+
+
+def facet_limits_param(query: Mapping[str, str]) -> FacetLimits:
+    """Parse facetLimit and orgPathDepth query params, ValueError if invalid."""
+    return FacetLimits(
+        limit=limit_param(query, "facetLimit"),
+        org_path_depth=limit_param(query, "orgPathDepth"),
+    )
@@ -1,5 +1,11 @@
 """Service package.
 
 Modules:
+    admission_control
     org_catalog_service
+    report_aggregation
+    report_columns
+    sparql_client
+    upstream_pools
+    warm_snapshot
 """
@@ -1,63 +1,221 @@
 """Adapter layer module for fdk-organization-bff."""
 
+import time
 from typing import Dict, List, Optional, Union
 
 from aiohttp import ClientSession
 
-from fdk_organization_bff.classes import FilterEnum
+from fdk_organization_bff.classes import FilterEnum, UpstreamEnum
 from fdk_organization_bff.config import Config
+from fdk_organization_bff.service.admission_control import admission_control
+from fdk_organization_bff.service.sparql_client import (
+    sparql_client,
+    sparql_query,
+    SparqlQuery,
+    SparqlQueryError,
+)
+from fdk_organization_bff.service.upstream_pools import upstream_pools
 from fdk_organization_bff.sparql.concept_queries import (
     build_concepts_by_publisher_query,
     build_org_concepts_query,
+    build_publishers_concepts_query,
     concepts_report_query,
 )
 from fdk_organization_bff.sparql.dataservice_queries import (
     build_dataservices_by_publisher_query,
     build_org_dataservice_query,
+    build_publishers_dataservices_query,
     data_services_report_query,
 )
 from fdk_organization_bff.sparql.dataset_queries import (
     build_datasets_by_publisher_query,
     build_nap_datasets_by_publisher_query,
     build_nap_org_datasets_query,
+    build_nap_publishers_datasets_query,
     build_org_datasets_query,
+    build_publishers_datasets_query,
     datasets_format_report_query,
     datasets_general_report_query,
+    datasets_grouped_format_report_query,
+    datasets_grouped_general_report_query,
     datasets_publisher_report_query,
 )
 from fdk_organization_bff.sparql.informationmodel_queries import (
     build_informationmodels_by_publisher_query,
     build_org_informationmodels_query,
+    build_publishers_informationmodels_query,
     info_models_report_query,
 )
+from fdk_organization_bff.sparql.results import MEDIA_TYPES
+from fdk_organization_bff.utils.json_decoding import decode_json
 from fdk_organization_bff.utils.mappers import count_list_from_sparql_response
+from fdk_organization_bff.utils.metrics import metrics
+from fdk_organization_bff.utils.request_timings import record_rows, timed
+from fdk_organization_bff.utils.tracing import span, trace_headers
 from fdk_organization_bff.utils.utils import url_with_params
 
+_NOT_FOUND_STATUSES = (404, 410)
+
+
+class UpstreamResponseError(Exception):
+    """Upstream answered with an error status other than not found."""
+
+    def __init__(self: "UpstreamResponseError", upstream: str, status: int) -> None:
+        """Init error with upstream name and response status."""
+        super().__init__(upstream, status)
+        self.upstream = upstream
+        self.status = status
+
+    def __str__(self: "UpstreamResponseError") -> str:
+        """Return upstream and status."""
+        return f"{self.upstream} answered with status {self.status}"
+
+
+_DATASETS_BY_PUBLISHER = sparql_query(
+    "datasets_by_publisher", build_datasets_by_publisher_query()
+)
+_NAP_DATASETS_BY_PUBLISHER = sparql_query(
+    "nap_datasets_by_publisher", build_nap_datasets_by_publisher_query()
+)
+_DATASERVICES_BY_PUBLISHER = sparql_query(
+    "dataservices_by_publisher", build_dataservices_by_publisher_query()
+)
+_CONCEPTS_BY_PUBLISHER = sparql_query(
+    "concepts_by_publisher", build_concepts_by_publisher_query()
+)
+_INFORMATIONMODELS_BY_PUBLISHER = sparql_query(
+    "informationmodels_by_publisher", build_informationmodels_by_publisher_query()
+)
+_DATASETS_GENERAL_REPORT = sparql_query(
+    "datasets_general_report", datasets_general_report_query()
+)
+_DATASETS_GROUPED_GENERAL_REPORT = sparql_query(
+    "datasets_grouped_general_report", datasets_grouped_general_report_query()
+)
+_DATASETS_FORMAT_REPORT = sparql_query(
+    "datasets_format_report", datasets_format_report_query()
+)
+_DATASETS_GROUPED_FORMAT_REPORT = sparql_query(
+    "datasets_grouped_format_report", datasets_grouped_format_report_query()
+)
+_DATASETS_PUBLISHER_REPORT = sparql_query(
+    "datasets_publisher_report", datasets_publisher_report_query()
+)
+_CONCEPTS_REPORT = sparql_query("concepts_report", concepts_report_query())
+_DATA_SERVICES_REPORT = sparql_query(
+    "data_services_report", data_services_report_query()
+)
+_INFORMATION_MODELS_REPORT = sparql_query(
+    "information_models_report", info_models_report_query()
+)
+
+
+def _row_count(data: Optional[Union[Dict, List]]) -> int:
+    """Count sparql bindings or list items in an upstream response."""
+    if isinstance(data, list):
+        return len(data)
+    results = data.get("results") if isinstance(data, dict) else None
+    bindings = results.get("bindings") if isinstance(results, dict) else None
+    return len(bindings) if isinstance(bindings, list) else 0
+
+
+async def _fetch_raw(
+    url: str,
+    session: ClientSession,
+    upstream: Optional[UpstreamEnum],
+    params: Optional[Dict[str, str]] = None,
+    data: Optional[Dict] = None,
+    accept: str = "application/json",
+    raise_on_error: bool = False,
+) -> Optional[bytes]:
+    """GET url, or POST data as json, and return undecoded body of a 200 response.
+
+    Other responses give None, except that with raise_on_error statuses other
+    than not found raise UpstreamResponseError.
+    """
+    name = upstream.value if upstream else "upstream"
+    method = "GET" if data is None else "POST"
+    session = upstream_pools.session(upstream) or session
+    headers = {"Accept": accept, **trace_headers()}
+    async with admission_control.admit(upstream):
+        start = time.perf_counter()
+        with timed(name), span(
+            f"{name} {method}", **{"http.url": url}
+        ) as upstream_span:
+            async with (
+                session.get(url_with_params(url, params), headers=headers)
+                if data is None
+                else session.post(url, json=data, headers=headers)
+            ) as response:
+                if upstream_span:
+                    upstream_span.attributes["http.status_code"] = response.status
+                status = response.status
+                raw = await response.read() if status == 200 else None
+
+    metrics.observe(
+        "upstream_network_seconds", time.perf_counter() - start, upstream=name
+    )
+    if raw is not None:
+        metrics.inc("upstream_response_bytes_total", len(raw), upstream=name)
+    elif raise_on_error and status not in _NOT_FOUND_STATUSES:
+        raise UpstreamResponseError(name, status)
+    return raw
+
+
+async def _decode(
+    raw: Optional[bytes], upstream: Optional[UpstreamEnum]
+) -> Optional[Union[Dict, List]]:
+    """Decode json body and count its rows."""
+    if raw is None:
+        return None
+    name = upstream.value if upstream else "upstream"
+    result = await decode_json(raw, name)
+    record_rows(name, _row_count(result))
+    return result
+
 
 async def fetch_json_data(
-    url: str, params: Optional[Dict[str, str]], session: ClientSession
+    url: str,
+    params: Optional[Dict[str, str]],
+    session: ClientSession,
+    upstream: Optional[UpstreamEnum] = None,
+    raise_on_error: bool = False,
 ) -> Optional[Union[Dict, List]]:
     """Fetch json data from url."""
-    async with session.get(
-        url_with_params(url, params), headers={"Accept": "application/json"}
-    ) as response:
-        return await response.json() if response.status == 200 else None
+    raw = await _fetch_raw(
+        url, session, upstream, params=params, raise_on_error=raise_on_error
+    )
+    return await _decode(raw, upstream)
+
+
+async def fetch_raw_data(
+    url: str,
+    params: Optional[Dict[str, str]],
+    session: ClientSession,
+    upstream: Optional[UpstreamEnum] = None,
+    accept: str = "application/json",
+) -> Optional[bytes]:
+    """Fetch undecoded data from url."""
+    return await _fetch_raw(url, session, upstream, params=params, accept=accept)
 
 
 async def fetch_json_data_with_post(
-    url: str, data: Dict, session: ClientSession
+    url: str,
+    data: Dict,
+    session: ClientSession,
+    upstream: Optional[UpstreamEnum] = None,
 ) -> Optional[Union[Dict, List]]:
     """Fetch json data from url."""
-    async with session.post(
-        url, json=data, headers={"Accept": "application/json"}
-    ) as response:
-        return await response.json() if response.status == 200 else None
+    raw = await _fetch_raw(url, session, upstream, data=data)
+    return await _decode(raw, upstream)
 
 
 async def fetch_org_cat_data(id: str, session: ClientSession) -> Dict:
     """Fetch organization data from organization-catalog."""
     url = f"{Config.org_cat_uri()}/organizations/{id}"
-    org_cat_data = await fetch_json_data(url, None, session)
+    org_cat_data = await fetch_json_data(
+        url, None, session, UpstreamEnum.ORGANIZATION_CATALOG
+    )
     if org_cat_data and isinstance(org_cat_data, Dict):
         return org_cat_data
     else:
@@ -70,14 +228,22 @@ async def fetch_organizations_from_organization_catalog(
     """Fetch organizations from organization-catalog."""
     params = {"orgPath": org_path} if org_path else None
     url = f"{Config.org_cat_uri()}/organizations"
-    org_list = await fetch_json_data(url, params, session)
+    org_list = await fetch_json_data(
+        url, params, session, UpstreamEnum.ORGANIZATION_CATALOG
+    )
     return {org["organizationId"]: org for org in org_list} if org_list else dict()
 
 
 async def fetch_brreg_data(id: str, session: ClientSession) -> Dict:
-    """Fetch organization data from Enhetsregisteret."""
+    """Fetch organization data from Enhetsregisteret, empty if not found.
+
+    Raises UpstreamResponseError on other error responses, so they are not
+    cached as not found.
+    """
     url = f"{Config.data_brreg_uri()}/enhetsregisteret/api/enheter/{id}"
-    brreg_data = await fetch_json_data(url, None, session)
+    brreg_data = await fetch_json_data(
+        url, None, session, UpstreamEnum.BRREG, raise_on_error=True
+    )
     if brreg_data and isinstance(brreg_data, Dict):
         return brreg_data
     else:
@@ -87,22 +253,18 @@ async def fetch_brreg_data(id: str, session: ClientSession) -> Dict:
 async def fetch_reference_data(path: str, session: ClientSession) -> Dict:
     """Fetch reference data from reference-data."""
     url = f"{Config.reference_data_uri()}/reference-data{path}"
-    reference_data = await fetch_json_data(url, None, session)
+    reference_data = await fetch_json_data(
+        url, None, session, UpstreamEnum.REFERENCE_DATA
+    )
     if reference_data and isinstance(reference_data, Dict):
         return reference_data
     else:
         return dict()
 
 
-async def query_sparql_service(query: str, session: ClientSession) -> Dict:
+async def query_sparql_service(query: SparqlQuery, session: ClientSession) -> Dict:
     """Query fdk-sparql-service."""
-    url = f"{Config.sparql_uri()}"
-    params = {"query": query}
-    datasets = await fetch_json_data(url, params, session)
-    if datasets and isinstance(datasets, Dict):
-        return datasets
-    else:
-        return dict()
+    return await sparql_client.bindings(query, session, Config.sparql_result_format())
 
 
 async def query_publisher_datasets(
@@ -110,9 +272,9 @@ async def query_publisher_datasets(
 ) -> List:
     """Query publisher datasets from fdk-sparql-service."""
     if filter is FilterEnum.NAP:
-        query = build_nap_org_datasets_query(id)
+        query = sparql_query("nap_org_datasets", build_nap_org_datasets_query(id))
     else:
-        query = build_org_datasets_query(id)
+        query = sparql_query("org_datasets", build_org_datasets_query(id))
 
     response = await query_sparql_service(query, session)
     results = response.get("results")
@@ -128,7 +290,12 @@ async def query_publisher_informationmodels(
         return list()
 
     results = (
-        await query_sparql_service(build_org_informationmodels_query(id), session)
+        await query_sparql_service(
+            sparql_query(
+                "org_informationmodels", build_org_informationmodels_query(id)
+            ),
+            session,
+        )
     ).get("results")
     org_concepts = results.get("bindings") if results else []
 
@@ -142,9 +309,11 @@ async def query_publisher_concepts(
     if filter is FilterEnum.NAP:
         return list()
 
-    results = (await query_sparql_service(build_org_concepts_query(id), session)).get(
-        "results"
-    )
+    results = (
+        await query_sparql_service(
+            sparql_query("org_concepts", build_org_concepts_query(id)), session
+        )
+    ).get("results")
     org_concepts = results.get("bindings") if results else []
 
     return org_concepts if org_concepts else []
@@ -157,12 +326,89 @@ async def query_publisher_dataservices(
     if filter is FilterEnum.NAP:
         return list()
     else:
-        response = await query_sparql_service(build_org_dataservice_query(id), session)
+        response = await query_sparql_service(
+            sparql_query("org_dataservices", build_org_dataservice_query(id)), session
+        )
         results = response.get("results")
         org_dataservices = results.get("bindings") if results else []
         return org_dataservices if org_dataservices else []
 
 
+def _bindings_by_publisher(response: Dict) -> Dict[str, List]:
+    """Group sparql bindings by their organizationNumber value."""
+    results = response.get("results")
+    bindings = results.get("bindings") if results else []
+    grouped: Dict[str, List] = dict()
+    for binding in bindings if bindings else []:
+        org_id = binding.get("organizationNumber", {}).get("value")
+        if org_id:
+            grouped.setdefault(org_id.strip(), []).append(binding)
+    return grouped
+
+
+async def query_publishers_datasets(
+    ids: List[str], filter: FilterEnum, session: ClientSession
+) -> Dict[str, List]:
+    """Query datasets for several publishers in one call to fdk-sparql-service."""
+    if filter is FilterEnum.NAP:
+        query = sparql_query(
+            "nap_publishers_datasets", build_nap_publishers_datasets_query(ids)
+        )
+    else:
+        query = sparql_query(
+            "publishers_datasets", build_publishers_datasets_query(ids)
+        )
+
+    return _bindings_by_publisher(await query_sparql_service(query, session))
+
+
+async def query_publishers_dataservices(
+    ids: List[str], filter: FilterEnum, session: ClientSession
+) -> Dict[str, List]:
+    """Query dataservices for several publishers in one call to fdk-sparql-service."""
+    if filter is FilterEnum.NAP:
+        return dict()
+
+    response = await query_sparql_service(
+        sparql_query(
+            "publishers_dataservices", build_publishers_dataservices_query(ids)
+        ),
+        session,
+    )
+    return _bindings_by_publisher(response)
+
+
+async def query_publishers_concepts(
+    ids: List[str], filter: FilterEnum, session: ClientSession
+) -> Dict[str, List]:
+    """Query concepts for several publishers in one call to fdk-sparql-service."""
+    if filter is FilterEnum.NAP:
+        return dict()
+
+    response = await query_sparql_service(
+        sparql_query("publishers_concepts", build_publishers_concepts_query(ids)),
+        session,
+    )
+    return _bindings_by_publisher(response)
+
+
+async def query_publishers_informationmodels(
+    ids: List[str], filter: FilterEnum, session: ClientSession
+) -> Dict[str, List]:
+    """Query informationmodels for several publishers in one call to fdk-sparql-service."""
+    if filter is FilterEnum.NAP:
+        return dict()
+
+    response = await query_sparql_service(
+        sparql_query(
+            "publishers_informationmodels",
+            build_publishers_informationmodels_query(ids),
+        ),
+        session,
+    )
+    return _bindings_by_publisher(response)
+
+
 async def query_all_dataservices_ordered_by_publisher(
     filter: FilterEnum, session: ClientSession
 ) -> List:
@@ -170,9 +416,7 @@ async def query_all_dataservices_ordered_by_publisher(
     if filter is FilterEnum.NAP:
         return list()
     else:
-        response = await query_sparql_service(
-            build_dataservices_by_publisher_query(), session
-        )
+        response = await query_sparql_service(_DATASERVICES_BY_PUBLISHER, session)
         return count_list_from_sparql_response(response)
 
 
@@ -183,9 +427,7 @@ async def query_all_concepts_ordered_by_publisher(
     if filter is FilterEnum.NAP:
         return list()
     else:
-        response = await query_sparql_service(
-            build_concepts_by_publisher_query(), session
-        )
+        response = await query_sparql_service(_CONCEPTS_BY_PUBLISHER, session)
         return count_list_from_sparql_response(response)
 
 
@@ -196,9 +438,7 @@ async def query_all_informationmodels_ordered_by_publisher(
     if filter is FilterEnum.NAP:
         return list()
     else:
-        response = await query_sparql_service(
-            build_informationmodels_by_publisher_query(), session
-        )
+        response = await query_sparql_service(_INFORMATIONMODELS_BY_PUBLISHER, session)
         return count_list_from_sparql_response(response)
 
 
@@ -207,9 +447,9 @@ async def query_all_datasets_ordered_by_publisher(
 ) -> List:
     """Query all datasets from fdk-sparql-service and order by publisher."""
     if filter is FilterEnum.NAP:
-        query = build_nap_datasets_by_publisher_query()
+        query = _NAP_DATASETS_BY_PUBLISHER
     else:
-        query = build_datasets_by_publisher_query()
+        query = _DATASETS_BY_PUBLISHER
 
     response = await query_sparql_service(query, session)
     return count_list_from_sparql_response(response)
@@ -224,7 +464,9 @@ async def fetch_org_dataset_catalog_scores(
     if len(uris) > 500:
         return dict()
     else:
-        scores = await fetch_json_data_with_post(url, {"datasets": uris}, session)
+        scores = await fetch_json_data_with_post(
+            url, {"datasets": uris}, session, UpstreamEnum.METADATA_QUALITY
+        )
 
         if scores and isinstance(scores, Dict):
             return scores
@@ -232,39 +474,51 @@ async def fetch_org_dataset_catalog_scores(
             return dict()
 
 
-async def _query_report(query: str, session: ClientSession) -> List:
-    """Query report metrics from fdk-sparql-service."""
-    response = await query_sparql_service(query, session)
-    results = response.get("results")
-    bindings = results.get("bindings") if results else []
-    return bindings if bindings else []
+async def _query_report(query: SparqlQuery, session: ClientSession) -> bytes:
+    """Query report metrics from fdk-sparql-service, left undecoded.
+
+    Raises SparqlQueryError when the query fails, so no report is built from
+    a failed query.
+    """
+    response = await sparql_client.raw(
+        query, session, MEDIA_TYPES[Config.sparql_result_format()]
+    )
+    if response is None:
+        raise SparqlQueryError(query.name)
+    return response
 
 
-async def query_general_dataset_report_metrics(session: ClientSession) -> List:
+async def query_general_dataset_report_metrics(
+    session: ClientSession, grouped: bool = False
+) -> bytes:
     """Query datasets report metrics from fdk-sparql-service."""
-    return await _query_report(datasets_general_report_query(), session)
+    query = _DATASETS_GROUPED_GENERAL_REPORT if grouped else _DATASETS_GENERAL_REPORT
+    return await _query_report(query, session)
 
 
-async def query_format_dataset_report_metrics(session: ClientSession) -> List:
+async def query_format_dataset_report_metrics(
+    session: ClientSession, grouped: bool = False
+) -> bytes:
     """Query datasets report metrics from fdk-sparql-service."""
-    return await _query_report(datasets_format_report_query(), session)
+    query = _DATASETS_GROUPED_FORMAT_REPORT if grouped else _DATASETS_FORMAT_REPORT
+    return await _query_report(query, session)
 
 
-async def query_publisher_dataset_report_metrics(session: ClientSession) -> List:
+async def query_publisher_dataset_report_metrics(session: ClientSession) -> bytes:
     """Query datasets report metrics from fdk-sparql-service."""
-    return await _query_report(datasets_publisher_report_query(), session)
+    return await _query_report(_DATASETS_PUBLISHER_REPORT, session)
 
 
-async def query_concepts_report(session: ClientSession) -> List:
+async def query_concepts_report(session: ClientSession) -> bytes:
     """Query concepts report metrics from fdk-sparql-service."""
-    return await _query_report(concepts_report_query(), session)
+    return await _query_report(_CONCEPTS_REPORT, session)
 
 
-async def query_data_services_report(session: ClientSession) -> List:
+async def query_data_services_report(session: ClientSession) -> bytes:
     """Query data services report metrics from fdk-sparql-service."""
-    return await _query_report(data_services_report_query(), session)
+    return await _query_report(_DATA_SERVICES_REPORT, session)
 
 
-async def query_information_models_report(session: ClientSession) -> List:
+async def query_information_models_report(session: ClientSession) -> bytes:
     """Query information models report metrics from fdk-sparql-service."""
-    return await _query_report(info_models_report_query(), session)
+    return await _query_report(_INFORMATION_MODELS_REPORT, session)
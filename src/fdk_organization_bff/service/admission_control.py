@@ -0,0 +1,177 @@
+"""Admission control bounding concurrent requests per upstream.
+
+Requests beyond an upstream's concurrency limit wait in a bounded queue.
+When the queue is full, or a request has waited longer than the queue
+timeout, the request is rejected with UpstreamOverloadedError instead of
+adding to the load of an upstream that is already behind.
+"""
+
+import asyncio
+from collections import deque
+import contextlib
+import time
+from typing import AsyncIterator, Deque, Dict, Iterator, Optional, Tuple
+
+from fdk_organization_bff.classes import UpstreamEnum
+from fdk_organization_bff.config import Config
+from fdk_organization_bff.utils.metrics import metrics
+
+
+class UpstreamOverloadedError(Exception):
+    """Request to upstream rejected by admission control."""
+
+    def __init__(self: "UpstreamOverloadedError", upstream: str, reason: str) -> None:
+        """Init error with upstream name and rejection reason."""
+        super().__init__(upstream, reason)
+        self.upstream = upstream
+        self.reason = reason
+
+    def __str__(self: "UpstreamOverloadedError") -> str:
+        """Return upstream and reason."""
+        return f"{self.upstream} overloaded: {self.reason}"
+
+
+class AdmissionLimiter:
+    """Concurrency limit with a bounded, timed out wait queue."""
+
+    def __init__(
+        self: "AdmissionLimiter",
+        upstream: str,
+        concurrency: int,
+        max_queue: int,
+        queue_timeout: float,
+    ) -> None:
+        """Init limiter, concurrency 0 or less admits every request."""
+        self.upstream = upstream
+        self.concurrency = concurrency
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.active = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    @property
+    def queued(self: "AdmissionLimiter") -> int:
+        """Return number of requests waiting for admission."""
+        return sum(1 for waiter in self._waiters if not waiter.done())
+
+    @contextlib.asynccontextmanager
+    async def admit(self: "AdmissionLimiter") -> AsyncIterator[None]:
+        """Hold a slot while the request is sent, waiting for one if needed."""
+        if self.concurrency <= 0:
+            yield
+            return
+
+        if self.active >= self.concurrency or self.queued > 0:
+            await self._wait()
+        else:
+            self.active += 1
+
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def _wait(self: "AdmissionLimiter") -> None:
+        """Wait in queue until a released slot is handed over."""
+        if self.queued >= self.max_queue:
+            self._reject("queue_full")
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        start = time.perf_counter()
+        try:
+            await asyncio.wait({waiter}, timeout=self.queue_timeout)
+        except BaseException:
+            if waiter.done() and not waiter.cancelled():
+                self._release()
+            waiter.cancel()
+            raise
+        finally:
+            metrics.observe(
+                "upstream_admission_wait_seconds",
+                time.perf_counter() - start,
+                upstream=self.upstream,
+            )
+
+        if not waiter.done():
+            waiter.cancel()
+            self._reject("queue_timeout")
+
+    def _release(self: "AdmissionLimiter") -> None:
+        """Hand slot over to the first waiter, or free it."""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.active -= 1
+
+    def _reject(self: "AdmissionLimiter", reason: str) -> None:
+        """Count rejection and raise overload error."""
+        metrics.inc(
+            "upstream_admission_rejected_total",
+            1,
+            upstream=self.upstream,
+            reason=reason,
+        )
+        raise UpstreamOverloadedError(self.upstream, reason)
+
+
+class AdmissionControl:
+    """Admission limiters per upstream, created from config on first use."""
+
+    def __init__(self: "AdmissionControl") -> None:
+        """Init without limiters."""
+        self._limiters: Dict[UpstreamEnum, AdmissionLimiter] = dict()
+
+    def limiter(self: "AdmissionControl", upstream: UpstreamEnum) -> AdmissionLimiter:
+        """Return limiter of upstream."""
+        if upstream not in self._limiters:
+            admission = Config.upstream_admission(upstream.name)
+            self._limiters[upstream] = AdmissionLimiter(
+                upstream.value,
+                int(admission["concurrency"]),
+                int(admission["queue"]),
+                admission["queue_timeout"],
+            )
+        return self._limiters[upstream]
+
+    @contextlib.asynccontextmanager
+    async def admit(
+        self: "AdmissionControl", upstream: Optional[UpstreamEnum]
+    ) -> AsyncIterator[None]:
+        """Hold a slot of upstream's limiter, unknown upstreams are not limited."""
+        if upstream is None:
+            yield
+            return
+        async with self.limiter(upstream).admit():
+            yield
+
+    def queue_depth(self: "AdmissionControl") -> Iterator[Tuple[str, Dict, float]]:
+        """Return active and queued requests per upstream."""
+        for limiter in self._limiters.values():
+            labels = {"upstream": limiter.upstream}
+            yield "upstream_admission_active", labels, limiter.active
+            yield "upstream_admission_queued", labels, limiter.queued
+            yield "upstream_admission_limit", labels, limiter.concurrency
+
+
+admission_control = AdmissionControl()
+metrics.register_collector(admission_control.queue_depth)
+metrics.describe(
+    "upstream_admission_active", "gauge", "Admitted requests in flight per upstream."
+)
+metrics.describe(
+    "upstream_admission_queued", "gauge", "Requests waiting for admission per upstream."
+)
+metrics.describe("upstream_admission_limit", "gauge", "Concurrency limit per upstream.")
+metrics.describe(
+    "upstream_admission_wait_seconds",
+    "summary",
+    "Time requests waited for admission per upstream.",
+)
+metrics.describe(
+    "upstream_admission_rejected_total",
+    "counter",
+    "Requests rejected by admission control per upstream and reason.",
+)
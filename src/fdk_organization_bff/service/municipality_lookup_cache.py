@@ -0,0 +1,122 @@
+"""Long-lived cache of the municipality lookup compiled from reference-data."""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+from fdk_organization_bff.classes import MunicipalityLookup
+from fdk_organization_bff.config import Config
+from fdk_organization_bff.utils.mappers import map_municipality_lookup
+from fdk_organization_bff.utils.request_timings import record_cache_lookup
+from fdk_organization_bff.utils.staleness import mark_stale
+
+
+class MunicipalityLookupCache:
+    """Municipality lookup kept in memory for ttl seconds, optionally persisted to disk."""
+
+    def __init__(
+        self: "MunicipalityLookupCache", ttl: float, path: Optional[str]
+    ) -> None:
+        """Init empty cache."""
+        self._ttl = ttl
+        self._path = path
+        self._lookup: Optional[MunicipalityLookup] = None
+        self._fetched_at: float = 0.0
+        self._loading: Optional[asyncio.Future] = None
+
+    def is_fresh(self: "MunicipalityLookupCache") -> bool:
+        """Check if cached lookup is younger than ttl."""
+        return self._lookup is not None and time.time() - self._fetched_at < self._ttl
+
+    def snapshot(
+        self: "MunicipalityLookupCache",
+    ) -> Optional[Tuple[MunicipalityLookup, float]]:
+        """Return cached lookup and the unix time it was fetched, None if empty."""
+        if self._lookup is None:
+            return None
+        return self._lookup, self._fetched_at
+
+    def restore(
+        self: "MunicipalityLookupCache", lookup: MunicipalityLookup, fetched_at: float
+    ) -> None:
+        """Use lookup from snapshot unless a newer one is cached."""
+        if self._lookup is None or fetched_at > self._fetched_at:
+            self._lookup = lookup
+            self._fetched_at = fetched_at
+
+    async def get(
+        self: "MunicipalityLookupCache", loader: Callable[[], Awaitable[Dict]]
+    ) -> MunicipalityLookup:
+        """Return cached lookup, refresh with data from loader when expired."""
+        if self._lookup is None:
+            self._read_from_disk()
+        record_cache_lookup("municipalities", self.is_fresh())
+        if not self.is_fresh():
+            loop = asyncio.get_running_loop()
+            if (
+                self._loading is None
+                or self._loading.done()
+                or self._loading.get_loop() is not loop
+            ):
+                self._loading = asyncio.ensure_future(self._refresh(loader))
+            await asyncio.shield(self._loading)
+            if self._lookup is not None and not self.is_fresh():
+                mark_stale("municipalities", time.time() - self._fetched_at)
+
+        return (
+            self._lookup
+            if self._lookup
+            else MunicipalityLookup(fylker=[], fylkesnummerByOrganization={})
+        )
+
+    async def _refresh(
+        self: "MunicipalityLookupCache", loader: Callable[[], Awaitable[Dict]]
+    ) -> None:
+        lookup = map_municipality_lookup(await loader())
+        if len(lookup.fylker) > 0:
+            self._lookup = lookup
+            self._fetched_at = time.time()
+            self._write_to_disk()
+        else:
+            logging.warning("Unable to refresh municipality lookup")
+
+    def _read_from_disk(self: "MunicipalityLookupCache") -> None:
+        if self._path is None or not os.path.exists(self._path):
+            return
+        try:
+            with open(self._path, encoding="utf-8") as file:
+                stored = json.load(file)
+            self._lookup = MunicipalityLookup(**stored["lookup"])
+            self._fetched_at = float(stored["fetchedAt"])
+        except (OSError, ValueError, KeyError, TypeError):
+            logging.warning(f"Unable to read municipality lookup from {self._path}")
+
+    def _write_to_disk(self: "MunicipalityLookupCache") -> None:
+        if self._path is None or self._lookup is None:
+            return
+        try:
+            tmp_path = f"{self._path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as file:
+                json.dump(
+                    {
+                        "fetchedAt": self._fetched_at,
+                        "lookup": {
+                            "fylker": self._lookup.fylker,
+                            "fylkesnummerByOrganization": (
+                                self._lookup.fylkesnummerByOrganization
+                            ),
+                        },
+                    },
+                    file,
+                )
+            os.replace(tmp_path, self._path)
+        except OSError:
+            logging.warning(f"Unable to write municipality lookup to {self._path}")
+
+
+municipality_lookup_cache = MunicipalityLookupCache(
+    Config.municipality_lookup_ttl_seconds(), Config.municipality_lookup_path()
+)
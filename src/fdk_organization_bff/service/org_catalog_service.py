@@ -2,22 +2,23 @@
 
 import asyncio
 import logging
-from typing import cast, Dict, List, Optional, Union
+from typing import Any, Awaitable, cast, Dict, List, Optional, Union
 
 from aiohttp import ClientSession
 
 from fdk_organization_bff.classes import (
     FilterEnum,
     OrganizationCatalog,
+    OrganizationCatalogBatch,
     OrganizationCatalogList,
     OrganizationCatalogSummary,
     OrganizationCategories,
 )
+from fdk_organization_bff.config import Config
 from fdk_organization_bff.service.adapter import (
     fetch_brreg_data,
     fetch_org_cat_data,
     fetch_org_dataset_catalog_scores,
-    fetch_organizations_from_organization_catalog,
     fetch_reference_data,
     query_all_concepts_ordered_by_publisher,
     query_all_dataservices_ordered_by_publisher,
@@ -27,7 +28,19 @@ from fdk_organization_bff.service.adapter import (
     query_publisher_dataservices,
     query_publisher_datasets,
     query_publisher_informationmodels,
+    query_publishers_concepts,
+    query_publishers_dataservices,
+    query_publishers_datasets,
+    query_publishers_informationmodels,
 )
+from fdk_organization_bff.service.municipality_lookup_cache import (
+    municipality_lookup_cache,
+)
+from fdk_organization_bff.service.organization_directory import (
+    organization_directory,
+)
+from fdk_organization_bff.service.upstream_pools import upstream_pools
+from fdk_organization_bff.utils.lru_ttl_cache import LruTtlCache
 from fdk_organization_bff.utils.mappers import (
     categorise_summaries_by_municipality,
     categorise_summaries_by_parent_org,
@@ -42,15 +55,45 @@ from fdk_organization_bff.utils.mappers import (
     map_org_informationmodels,
     map_org_summaries,
 )
+from fdk_organization_bff.utils.request_timings import timed
+from fdk_organization_bff.utils.staleness import last_known_good
+from fdk_organization_bff.utils.tracing import traced
+
+brreg_cache = LruTtlCache(
+    max_size=Config.brreg_cache_size(),
+    ttl=Config.brreg_cache_ttl_seconds(),
+    negative_ttl=Config.brreg_cache_negative_ttl_seconds(),
+    name="brreg",
+)
+
+
+@traced("fetch_cached_brreg_data")
+async def fetch_cached_brreg_data(id: str) -> Dict:
+    """Return organization data from Enhetsregisteret through the Brreg cache."""
+
+    async def load() -> Dict:
+        async with upstream_pools.client_session() as session:
+            return await fetch_brreg_data(id, session)
+
+    return await brreg_cache.get(id, load)
+
+
+async def fetch_directory_org_cat_data(id: str, session: ClientSession) -> Dict:
+    """Return organization from the directory, organization-catalog if not in it."""
+    organization = organization_directory.organization(id)
+    if organization is not None:
+        return organization
+    return await fetch_org_cat_data(id, session)
 
 
+@traced("get_organization_catalog")
 async def get_organization_catalog(
     id: str, filter: FilterEnum
 ) -> Optional[OrganizationCatalog]:
     """Return specific organization catalog."""
     logging.debug(f"Fetching catalog for organization with id {id}")
 
-    async with ClientSession() as session:
+    async with upstream_pools.client_session() as session:
         (
             org_cat_data,
             brreg_data,
@@ -59,8 +102,8 @@ async def get_organization_catalog(
             org_concepts,
             org_informationmodels,
         ) = await asyncio.gather(
-            asyncio.ensure_future(fetch_org_cat_data(id, session)),
-            asyncio.ensure_future(fetch_brreg_data(id, session)),
+            asyncio.ensure_future(fetch_directory_org_cat_data(id, session)),
+            asyncio.ensure_future(fetch_cached_brreg_data(id)),
             asyncio.ensure_future(query_publisher_datasets(id, filter, session)),
             asyncio.ensure_future(query_publisher_dataservices(id, filter, session)),
             asyncio.ensure_future(query_publisher_concepts(id, filter, session)),
@@ -70,6 +113,21 @@ async def get_organization_catalog(
             return_exceptions=True,
         )
 
+    failed = any(
+        isinstance(result, BaseException)
+        for result in (
+            org_cat_data,
+            org_datasets,
+            org_dataservices,
+            org_concepts,
+            org_informationmodels,
+        )
+    )
+    if failed:
+        stale = last_known_good.fallback(("catalog", id, filter), "organizationCatalog")
+        if stale is not None:
+            return stale
+
     if isinstance(org_cat_data, BaseException):
         logging.warning("Unable to fetch org catalog data")
         org_cat_data = None
@@ -92,7 +150,7 @@ async def get_organization_catalog(
     org_datasets_scores = {}
     if len(org_datasets) > 0:
         dataset_uris = [ds["dataset"]["value"] for ds in org_datasets]
-        async with ClientSession() as session:
+        async with upstream_pools.client_session() as session:
             org_datasets_scores = await asyncio.ensure_future(
                 fetch_org_dataset_catalog_scores(dataset_uris, session)
             )
@@ -103,7 +161,32 @@ async def get_organization_catalog(
 
     logging.debug("Counts ")
 
-    """Respond with None if no data is found."""
+    with timed("mapping"):
+        catalog = _build_organization_catalog(
+            org_cat_data,
+            brreg_data,
+            org_datasets,
+            org_dataservices,
+            org_concepts,
+            org_informationmodels,
+            org_datasets_scores,
+        )
+
+    if not failed:
+        last_known_good.store(("catalog", id, filter), catalog)
+    return catalog
+
+
+def _build_organization_catalog(
+    org_cat_data: Optional[Dict],
+    brreg_data: Optional[Dict],
+    org_datasets: List,
+    org_dataservices: List,
+    org_concepts: List,
+    org_informationmodels: List,
+    org_datasets_scores: Dict,
+) -> Optional[OrganizationCatalog]:
+    """Map fetched organization data to OrganizationCatalog, None if no data is found."""
     if (
         None
         not in (org_datasets, org_dataservices, org_concepts, org_informationmodels)
@@ -117,7 +200,7 @@ async def get_organization_catalog(
     ):
         return OrganizationCatalog(
             organization=map_org_details(
-                org_cat_data=org_cat_data, brreg_data=brreg_data
+                org_cat_data=org_cat_data or {}, brreg_data=brreg_data or {}
             ),
             datasets=map_org_datasets(
                 org_datasets=org_datasets,
@@ -132,7 +215,7 @@ async def get_organization_catalog(
     elif org_cat_data is not None and len(org_cat_data) > 0:
         return OrganizationCatalog(
             organization=map_org_details(
-                org_cat_data=org_cat_data, brreg_data=brreg_data
+                org_cat_data=org_cat_data or {}, brreg_data=brreg_data or {}
             ),
             datasets=empty_datasets(),
             dataservices=empty_dataservices(),
@@ -143,11 +226,121 @@ async def get_organization_catalog(
         return None
 
 
+@traced("get_organization_catalogs_batch")
+async def get_organization_catalogs_batch(
+    ids: List[str], filter: FilterEnum
+) -> OrganizationCatalogBatch:
+    """Return organization catalogs for several organizations, keyed by id."""
+    logging.debug(f"Fetching catalogs for {len(ids)} organizations")
+    semaphore = asyncio.Semaphore(Config.org_catalog_batch_concurrency())
+
+    async def limited(coro: Awaitable) -> Any:
+        async with semaphore:
+            return await coro
+
+    async with upstream_pools.client_session() as session:
+        (
+            datasets,
+            dataservices,
+            concepts,
+            informationmodels,
+            org_cat_results,
+            brreg_results,
+        ) = await asyncio.gather(
+            asyncio.ensure_future(query_publishers_datasets(ids, filter, session)),
+            asyncio.ensure_future(query_publishers_dataservices(ids, filter, session)),
+            asyncio.ensure_future(query_publishers_concepts(ids, filter, session)),
+            asyncio.ensure_future(
+                query_publishers_informationmodels(ids, filter, session)
+            ),
+            asyncio.gather(
+                *[limited(fetch_directory_org_cat_data(id, session)) for id in ids],
+                return_exceptions=True,
+            ),
+            asyncio.gather(
+                *[limited(fetch_cached_brreg_data(id)) for id in ids],
+                return_exceptions=True,
+            ),
+            return_exceptions=True,
+        )
+
+        sparql_failed = any(
+            isinstance(result, BaseException)
+            for result in (datasets, dataservices, concepts, informationmodels)
+        )
+        if isinstance(datasets, BaseException):
+            logging.warning("Unable to fetch datasets for organizations")
+            datasets = {}
+        if isinstance(dataservices, BaseException):
+            logging.warning("Unable to fetch dataservices for organizations")
+            dataservices = {}
+        if isinstance(concepts, BaseException):
+            logging.warning("Unable to fetch concepts for organizations")
+            concepts = {}
+        if isinstance(informationmodels, BaseException):
+            logging.warning("Unable to fetch info models for organizations")
+            informationmodels = {}
+
+        ids_with_datasets = [id for id in ids if datasets.get(id)]
+        scores_results = await asyncio.gather(
+            *[
+                limited(
+                    fetch_org_dataset_catalog_scores(
+                        [ds["dataset"]["value"] for ds in datasets[id]], session
+                    )
+                )
+                for id in ids_with_datasets
+            ],
+            return_exceptions=True,
+        )
+
+    scores: Dict[str, Dict] = dict()
+    for id, org_scores in zip(ids_with_datasets, scores_results):
+        if isinstance(org_scores, BaseException):
+            logging.warning(f"Unable to fetch dataset scores for {id}")
+        else:
+            scores[id] = org_scores
+
+    catalogs: Dict[str, Optional[OrganizationCatalog]] = dict()
+    for id, org_cat_data, brreg_data in zip(ids, org_cat_results, brreg_results):
+        failed = sparql_failed or isinstance(org_cat_data, BaseException)
+        stale = (
+            last_known_good.fallback(("catalog", id, filter), "organizationCatalog")
+            if failed
+            else None
+        )
+        if stale is not None:
+            catalogs[id] = stale
+            continue
+        if isinstance(org_cat_data, BaseException):
+            logging.warning(f"Unable to fetch org catalog data for {id}")
+            org_cat_data = None
+        if isinstance(brreg_data, BaseException):
+            logging.warning(f"Unable to fetch Brreg data for {id}")
+            brreg_data = None
+
+        with timed("mapping"):
+            catalogs[id] = _build_organization_catalog(
+                org_cat_data,
+                brreg_data,
+                datasets.get(id, []),
+                dataservices.get(id, []),
+                concepts.get(id, []),
+                informationmodels.get(id, []),
+                scores.get(id, {}),
+            )
+        if not failed:
+            last_known_good.store(("catalog", id, filter), catalogs[id])
+
+    return OrganizationCatalogBatch(organizations=catalogs)
+
+
+@traced("summarize_catalog_data_for_organizations")
 async def summarize_catalog_data_for_organizations(
     filter: FilterEnum, include_empty: Optional[str], org_paths: Optional[List[str]]
 ) -> List[OrganizationCatalogSummary]:
     """Fetch and summarize organizations data."""
-    async with ClientSession() as session:
+    async with upstream_pools.client_session() as session:
         (
             organizations,
             datasets,
@@ -155,20 +348,28 @@ async def summarize_catalog_data_for_organizations(
             concepts,
             informationmodels,
         ) = await asyncio.gather(
-            asyncio.ensure_future(
-                fetch_organizations_for_org_paths(org_paths, session)
+            asyncio.ensure_future(fetch_organizations_for_org_paths(org_paths)),
+            last_known_good.load(
+                ("datasets_by_publisher", filter),
+                "sparql",
+                lambda: query_all_datasets_ordered_by_publisher(filter, session),
             ),
-            asyncio.ensure_future(
-                query_all_datasets_ordered_by_publisher(filter, session)
+            last_known_good.load(
+                ("dataservices_by_publisher", filter),
+                "sparql",
+                lambda: query_all_dataservices_ordered_by_publisher(filter, session),
             ),
-            asyncio.ensure_future(
-                query_all_dataservices_ordered_by_publisher(filter, session)
+            last_known_good.load(
+                ("concepts_by_publisher", filter),
+                "sparql",
+                lambda: query_all_concepts_ordered_by_publisher(filter, session),
             ),
-            asyncio.ensure_future(
-                query_all_concepts_ordered_by_publisher(filter, session)
-            ),
-            asyncio.ensure_future(
-                query_all_informationmodels_ordered_by_publisher(filter, session)
+            last_known_good.load(
+                ("informationmodels_by_publisher", filter),
+                "sparql",
+                lambda: query_all_informationmodels_ordered_by_publisher(
+                    filter, session
+                ),
             ),
             return_exceptions=True,
         )
@@ -189,16 +390,18 @@ async def summarize_catalog_data_for_organizations(
         logging.warning("Unable to fetch informationmodels")
         informationmodels = []
 
-    return map_org_summaries(
-        organizations=cast(Dict, organizations),
-        datasets=cast(List, datasets),
-        dataservices=cast(List, dataservices),
-        concepts=cast(List, concepts),
-        informationmodels=cast(List, informationmodels),
-        include_empty=include_empty.lower() == "true" if include_empty else False,
-    )
+    with timed("mapping"):
+        return map_org_summaries(
+            organizations=cast(Dict, organizations),
+            datasets=cast(List, datasets),
+            dataservices=cast(List, dataservices),
+            concepts=cast(List, concepts),
+            informationmodels=cast(List, informationmodels),
+            include_empty=include_empty.lower() == "true" if include_empty else False,
+        )
 
 
+@traced("get_organization_catalogs")
 async def get_organization_catalogs(
     filter: FilterEnum, include_empty: Optional[str]
 ) -> OrganizationCatalogList:
@@ -213,6 +416,7 @@ async def get_organization_catalogs(
     )
 
 
+@traced("get_state_categories")
 async def get_state_categories(
     filter: FilterEnum, include_empty: Optional[str]
 ) -> OrganizationCategories:
@@ -222,40 +426,28 @@ async def get_state_categories(
         filter, "true", ["/STAT/"]
     )
 
-    return OrganizationCategories(
-        categories=categorise_summaries_by_parent_org(
-            org_summaries, include_empty == "true"
+    with timed("mapping"):
+        return OrganizationCategories(
+            categories=categorise_summaries_by_parent_org(
+                org_summaries, include_empty == "true"
+            )
         )
-    )
 
 
-async def fetch_organizations_for_org_paths(
-    org_paths: Optional[List[str]], session: ClientSession
-) -> Dict:
-    """Fetch orgs for list of orgPahs."""
-    if org_paths:
-        tasks = [
-            asyncio.ensure_future(
-                fetch_organizations_from_organization_catalog(session, org_path)
-            )
-            for org_path in org_paths
-        ]
-    else:
-        tasks = [
-            asyncio.ensure_future(
-                fetch_organizations_from_organization_catalog(session, None)
-            )
-        ]
+async def fetch_organizations_for_org_paths(org_paths: Optional[List[str]]) -> Dict:
+    """Return orgs for list of orgPaths from the organization directory."""
+    await organization_directory.ensure_loaded()
+    if not org_paths:
+        return organization_directory.organizations()
 
-    org_path_responses = await asyncio.gather(*tasks)
     orgs = dict()
-    for org_path_response in org_path_responses:
-        for key in org_path_response:
-            orgs[key] = org_path_response[key]
+    for org_path in org_paths:
+        orgs.update(organization_directory.organizations(org_path))
 
     return orgs
 
 
+@traced("get_municipality_categories")
 async def get_municipality_categories(
     filter: FilterEnum, include_empty: Optional[str]
 ) -> OrganizationCategories:
@@ -270,19 +462,21 @@ async def get_municipality_categories(
                 filter, "true", ["/FYLKE/", "/KOMMUNE/"]
             )
         ),
-        asyncio.ensure_future(fetch_municipality_data()),
+        asyncio.ensure_future(municipality_lookup_cache.get(fetch_municipality_data)),
     )
 
-    return OrganizationCategories(
-        categories=categorise_summaries_by_municipality(
-            org_summaries, municipalities, include_empty == "true"
+    with timed("mapping"):
+        return OrganizationCategories(
+            categories=categorise_summaries_by_municipality(
+                org_summaries, municipalities, include_empty == "true"
+            )
         )
-    )
 
 
+@traced("fetch_municipality_data")
 async def fetch_municipality_data() -> Dict:
     """Return map of municipality numbers to connected organization number."""
-    async with ClientSession() as session:
+    async with upstream_pools.client_session() as session:
         fylke: Union[Dict, BaseException]
         kommune: Union[Dict, BaseException]
         (
@@ -0,0 +1,98 @@
+"""In-memory directory of organizations from organization-catalog."""
+
+import asyncio
+import logging
+import time
+from typing import Dict, List, Optional
+
+from fdk_organization_bff.service.adapter import (
+    fetch_organizations_from_organization_catalog,
+)
+from fdk_organization_bff.service.upstream_pools import upstream_pools
+from fdk_organization_bff.utils.request_timings import record_cache_lookup
+from fdk_organization_bff.utils.utils import split_org_path
+
+
+class OrganizationDirectory:
+    """Organizations from organization-catalog indexed by id and orgPath prefix."""
+
+    def __init__(self: "OrganizationDirectory") -> None:
+        """Init empty directory."""
+        self._organizations: Dict[str, Dict] = dict()
+        self._ids_by_org_path: Dict[str, List[str]] = dict()
+        self._loaded_at: Optional[float] = None
+        self._loading: Optional[asyncio.Future] = None
+
+    @property
+    def loaded_at(self: "OrganizationDirectory") -> Optional[float]:
+        """Monotonic time of last successful load, None if never loaded."""
+        return self._loaded_at
+
+    def organization(self: "OrganizationDirectory", id: str) -> Optional[Dict]:
+        """Return organization with id."""
+        return self._organizations.get(id)
+
+    def organizations(
+        self: "OrganizationDirectory", org_path: Optional[str] = None
+    ) -> Dict[str, Dict]:
+        """Return organizations, limited to orgPath prefix if given."""
+        if not org_path:
+            return dict(self._organizations)
+        ids = self._ids_by_org_path.get("/" + org_path.strip("/"), [])
+        return {id: self._organizations[id] for id in ids}
+
+    def index(self: "OrganizationDirectory", organizations: Dict[str, Dict]) -> None:
+        """Replace directory content with organizations."""
+        ids_by_org_path: Dict[str, List[str]] = dict()
+        for id, organization in organizations.items():
+            org_path = organization.get("orgPath")
+            if org_path:
+                for prefix in split_org_path(org_path):
+                    ids_by_org_path.setdefault(prefix, []).append(id)
+
+        self._organizations = organizations
+        self._ids_by_org_path = ids_by_org_path
+        self._loaded_at = time.monotonic()
+
+    async def ensure_loaded(self: "OrganizationDirectory") -> None:
+        """Load directory if it has not been loaded yet."""
+        record_cache_lookup("organizations", self._loaded_at is not None)
+        if self._loaded_at is None:
+            await self.load()
+
+    async def load(self: "OrganizationDirectory") -> None:
+        """Load directory, concurrent callers share one upstream call."""
+        loop = asyncio.get_running_loop()
+        if (
+            self._loading is None
+            or self._loading.done()
+            or self._loading.get_loop() is not loop
+        ):
+            self._loading = asyncio.ensure_future(self._fetch_and_index())
+        await asyncio.shield(self._loading)
+
+    async def _fetch_and_index(self: "OrganizationDirectory") -> None:
+        async with upstream_pools.client_session() as session:
+            organizations = await fetch_organizations_from_organization_catalog(
+                session, None
+            )
+
+        if organizations:
+            self.index(organizations)
+            logging.info(f"Loaded {len(organizations)} organizations into directory")
+        else:
+            logging.warning("Unable to load organizations into directory")
+
+    async def refresh_periodically(
+        self: "OrganizationDirectory", interval: float
+    ) -> None:
+        """Reload directory every interval seconds until cancelled."""
+        while True:
+            try:
+                await self.load()
+            except Exception:
+                logging.warning("Unable to refresh organization directory")
+            await asyncio.sleep(interval)
+
+
+organization_directory = OrganizationDirectory()
@@ -0,0 +1,203 @@
+"""Aggregation of report columns.
+
+A report is declared as a list of dimensions, each aggregating one field
+of the report from the columns of its objects. Dimensions also declare the
+columns they need, so report columns are encoded from the same list. New
+report types are a new list of dimensions. Counting runs over integer codes
+of the selected rows, and orgPath prefixes are expanded once per distinct
+orgPath.
+"""
+
+from abc import ABC, abstractmethod
+from array import array
+from collections import Counter
+import heapq
+from itertools import chain
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from fdk_organization_bff.service.report_columns import (
+    encode_columns,
+    MISSING,
+    ReportColumns,
+)
+from fdk_organization_bff.utils.utils import split_org_path
+
+Rows = Sequence[int]
+
+
+def _count(key_count: Dict[str, Any]) -> int:
+    """Return count of key count object."""
+    return key_count["count"]
+
+
+def key_count_list(counts: Dict[str, int]) -> List[Dict[str, Any]]:
+    """Convert str -> int dict to key count objects, largest count first."""
+    return sorted(
+        ({"key": key, "count": count} for key, count in counts.items()),
+        key=_count,
+        reverse=True,
+    )
+
+
+class Dimension(ABC):
+    """Report field aggregated from a column of its objects."""
+
+    column = "single"
+
+    def __init__(self: "Dimension", name: str, field: str) -> None:
+        """Init dimension aggregating metrics field into report field name."""
+        self.name = name
+        self.field = field
+
+    @abstractmethod
+    def count(self: "Dimension", columns: ReportColumns, rows: Rows) -> Any:
+        """Return report field value of rows."""
+
+
+def _code_counts(codes: Iterable[int], values: List[str]) -> Dict[str, int]:
+    """Count codes in order of first occurrence, MISSING skipped."""
+    counts = Counter(codes)
+    counts.pop(MISSING, None)
+    return {values[code]: count for code, count in counts.items()}
+
+
+class ValueCounts(Dimension):
+    """Objects per value of a single valued field, missing values skipped."""
+
+    def count(self: "ValueCounts", columns: ReportColumns, rows: Rows) -> List:
+        """Count values of field."""
+        column = columns.single[self.field]
+        return key_count_list(
+            _code_counts(map(column.codes.__getitem__, rows), column.values)
+        )
+
+
+class SetCounts(Dimension):
+    """Objects per value of a multi valued field."""
+
+    column = "multi"
+
+    def count(self: "SetCounts", columns: ReportColumns, rows: Rows) -> List:
+        """Count every value of field."""
+        column = columns.multi[self.field]
+        return key_count_list(
+            _code_counts(
+                chain.from_iterable(map(column.row_codes, rows)), column.values
+            )
+        )
+
+
+class SizePerObject(Dimension):
+    """Objects with most values of a multi valued field, largest first."""
+
+    column = "multi"
+
+    def __init__(
+        self: "SizePerObject", name: str, field: str, limit: Optional[int] = None
+    ) -> None:
+        """Init dimension keeping the limit objects with most values, None all."""
+        super().__init__(name, field)
+        self.limit = limit
+
+    def count(self: "SizePerObject", columns: ReportColumns, rows: Rows) -> List:
+        """Return number of values of field per uri, ties in row order."""
+        offsets = columns.multi[self.field].offsets
+        sizes = (
+            {"key": columns.uris[row], "count": offsets[row + 1] - offsets[row]}
+            for row in rows
+            if offsets[row + 1] > offsets[row]
+        )
+        if self.limit is None:
+            return sorted(sizes, key=_count, reverse=True)
+        return heapq.nlargest(self.limit, sizes, key=_count)
+
+
+class FlagCount(Dimension):
+    """Number of objects where field equals value."""
+
+    column = "flag"
+
+    def __init__(self: "FlagCount", name: str, field: str, value: str) -> None:
+        """Init dimension counting objects with field equal to value."""
+        super().__init__(name, field)
+        self.value = value
+
+    def count(self: "FlagCount", columns: ReportColumns, rows: Rows) -> int:
+        """Count rows with flag set."""
+        return sum(map(columns.flags[(self.field, self.value)].__getitem__, rows))
+
+
+class DistinctCount(Dimension):
+    """Number of distinct values of a single valued field."""
+
+    def count(self: "DistinctCount", columns: ReportColumns, rows: Rows) -> int:
+        """Count distinct values of field."""
+        codes = set(map(columns.single[self.field].codes.__getitem__, rows))
+        codes.discard(MISSING)
+        return len(codes)
+
+
+class OrgPathCounts(Dimension):
+    """Objects per orgPath prefix, expanded once per distinct orgPath."""
+
+    def __init__(self: "OrgPathCounts", name: str = "orgPaths") -> None:
+        """Init dimension counting objects per orgPath prefix."""
+        super().__init__(name, "orgPath")
+
+    def count(self: "OrgPathCounts", columns: ReportColumns, rows: Rows) -> List:
+        """Count rows per distinct orgPath and expand counts to prefixes."""
+        column = columns.single[self.field]
+        prefix_counts: Dict[str, int] = dict()
+        for code, count in Counter(map(column.codes.__getitem__, rows)).items():
+            org_path = "/MISSING" if code == MISSING else column.values[code]
+            for prefix in split_org_path(org_path):
+                prefix_counts[prefix] = prefix_counts.get(prefix, 0) + count
+        return key_count_list(prefix_counts)
+
+
+def dimension_columns(
+    metrics: dict,
+    harvested: array,
+    dimensions: List[Dimension],
+    flags: Iterable[Tuple[str, str]] = (),
+) -> ReportColumns:
+    """Encode the columns dimensions need, plus orgPath, orgId and flags."""
+    single = {"orgPath", "orgId"}
+    multi = set()
+    flag_fields = set(flags)
+    for dimension in dimensions:
+        if isinstance(dimension, FlagCount):
+            flag_fields.add((dimension.field, dimension.value))
+        elif dimension.column == "multi":
+            multi.add(dimension.field)
+        else:
+            single.add(dimension.field)
+    return encode_columns(
+        metrics, harvested, sorted(single), sorted(multi), sorted(flag_fields)
+    )
+
+
+def aggregate(
+    columns: ReportColumns,
+    rows: Rows,
+    dimensions: List[Dimension],
+    since: Optional[float] = None,
+) -> Dict[str, Any]:
+    """Aggregate rows into totalObjects, newLastWeek and dimensions.
+
+    newLastWeek counts rows harvested after since, 0 when since is None.
+    Missing harvest times are MISSING and never counted as new.
+    """
+    report: Dict[str, Any] = {
+        "totalObjects": len(rows),
+        "newLastWeek": 0,
+    }
+    if since is not None:
+        report["newLastWeek"] = sum(
+            1
+            for harvested in map(columns.harvested.__getitem__, rows)
+            if harvested != MISSING and harvested > since
+        )
+    for dimension in dimensions:
+        report[dimension.name] = dimension.count(columns, rows)
+    return report
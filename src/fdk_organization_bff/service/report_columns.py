@@ -0,0 +1,117 @@
+"""Columnar, dictionary encoded storage of report object metrics.
+
+Objects are rows. Single valued fields are stored as integer codes into a
+dictionary of distinct values, multi valued fields as codes with CSR style
+offsets per row, flags as one byte per row and harvest times as integer
+epoch seconds, MISSING if unknown. Counting over a selection of rows then
+runs over compact arrays instead of a dict of dicts per object.
+"""
+
+from array import array
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Tuple
+
+MISSING = -1
+
+
+@dataclass
+class Column:
+    """Single valued field as codes into distinct values, MISSING if absent."""
+
+    values: List[str]
+    codes: array
+
+
+@dataclass
+class MultiColumn:
+    """Multi valued field, codes of row r are codes[offsets[r]:offsets[r + 1]]."""
+
+    values: List[str]
+    offsets: array
+    codes: array
+
+    def row_codes(self: "MultiColumn", row: int) -> array:
+        """Return codes of row."""
+        start, end = self.offsets[row], self.offsets[row + 1]
+        return self.codes[start:end]
+
+
+@dataclass
+class ReportColumns:
+    """Dictionary encoded columns of report objects."""
+
+    uris: List[str]
+    harvested: array
+    single: Dict[str, Column]
+    multi: Dict[str, MultiColumn]
+    flags: Dict[Tuple[str, str], array]
+
+    def __len__(self: "ReportColumns") -> int:
+        """Return number of rows."""
+        return len(self.uris)
+
+
+def _encode(value: str, codes: Dict[str, int], values: List[str]) -> int:
+    """Return code of value, adding it to the dictionary when new."""
+    code = codes.get(value)
+    if code is None:
+        code = codes[value] = len(values)
+        values.append(value)
+    return code
+
+
+def encode_columns(
+    metrics: dict,
+    harvested: array,
+    single: Iterable[str] = (),
+    multi: Iterable[str] = (),
+    flags: Iterable[Tuple[str, str]] = (),
+) -> ReportColumns:
+    """Encode metrics per uri into columns of the given fields."""
+    objects = list(metrics.values())
+
+    single_columns = dict()
+    for field in single:
+        codes: Dict[str, int] = dict()
+        values: List[str] = list()
+        single_columns[field] = Column(
+            values=values,
+            codes=array(
+                "l",
+                (
+                    MISSING if value is None else _encode(value, codes, values)
+                    for value in (
+                        object_metrics.get(field) for object_metrics in objects
+                    )
+                ),
+            ),
+        )
+
+    multi_columns = dict()
+    for field in multi:
+        codes = dict()
+        values = list()
+        offsets = array("l", [0])
+        row_codes = array("l")
+        for object_metrics in objects:
+            row_codes.extend(
+                _encode(value, codes, values) for value in object_metrics.get(field, ())
+            )
+            offsets.append(len(row_codes))
+        multi_columns[field] = MultiColumn(
+            values=values, offsets=offsets, codes=row_codes
+        )
+
+    return ReportColumns(
+        uris=list(metrics),
+        harvested=harvested,
+        single=single_columns,
+        multi=multi_columns,
+        flags={
+            (field, flag_value): array(
+                "b",
+                (object_metrics.get(field) == flag_value for object_metrics in objects),
+            )
+            for field, flag_value in flags
+        },
+    )
@@ -1,16 +1,46 @@
-"""Service layer module for reports."""
-
-from datetime import datetime, timedelta, timezone
-from typing import Dict, Optional
+"""Service layer module for reports.
+
+Reports are aggregated in the process pool from undecoded sparql responses,
+so neither decoding nor aggregation blocks the event loop. Each report type
+is cached as a snapshot holding the report of every orgPath node, so most
+requests are a dict lookup. Snapshots are aggregated from dictionary
+encoded report columns, with facet lists sorted by count so requests can
+cut them to a limit. Nodes keep sorted harvest timestamps, counting
+objects new since any date with a binary search, and harvest counts per
+week and month for the time series endpoint.
+"""
+
+from array import array
+import asyncio
+from bisect import bisect_right
+from collections import Counter
+from dataclasses import dataclass, field, replace
+from datetime import date, datetime, timedelta, timezone
+from itertools import compress, islice
+import json
+from math import floor
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
 
 from aiohttp import ClientSession
 
 from fdk_organization_bff.classes import (
+    AllReports,
     ConceptReport,
     DataServiceReport,
     DatasetsReport,
     InformationModelReport,
+    ReportTimeSeries,
 )
+from fdk_organization_bff.config import Config
 from fdk_organization_bff.service.adapter import (
     query_concepts_report,
     query_data_services_report,
@@ -19,6 +49,74 @@ from fdk_organization_bff.service.adapter import (
     query_information_models_report,
     query_publisher_dataset_report_metrics,
 )
+from fdk_organization_bff.service.report_aggregation import (
+    aggregate,
+    Dimension,
+    dimension_columns,
+    DistinctCount,
+    FlagCount,
+    OrgPathCounts,
+    SetCounts,
+    SizePerObject,
+    ValueCounts,
+)
+from fdk_organization_bff.service.report_columns import MISSING, ReportColumns
+from fdk_organization_bff.service.upstream_pools import upstream_pools
+from fdk_organization_bff.sparql.results import parse_result_bytes
+from fdk_organization_bff.utils.lru_ttl_cache import LruTtlCache
+from fdk_organization_bff.utils.process_pool import run_in_process
+from fdk_organization_bff.utils.request_timings import timed
+from fdk_organization_bff.utils.staleness import last_known_good
+from fdk_organization_bff.utils.tracing import traced
+from fdk_organization_bff.utils.utils import split_org_path
+
+report_snapshots = LruTtlCache(
+    max_size=4,
+    ttl=Config.report_snapshot_ttl_seconds(),
+    negative_ttl=Config.report_snapshot_ttl_seconds(),
+    refresh_min_hits=1,
+    name="reportSnapshots",
+)
+
+_DATASET_DIMENSIONS = [
+    DistinctCount("organizationCount", "orgId"),
+    FlagCount("opendata", "isOpenData", "true"),
+    FlagCount(
+        "nationalComponent",
+        "provenance",
+        "http://data.brreg.no/datakatalog/provinens/nasjonal",
+    ),
+    OrgPathCounts(),
+    SetCounts("formats", "formats"),
+    SetCounts("allThemes", "allThemes"),
+    ValueCounts("accessRights", "accessRights"),
+]
+_TRANSPORT = ("transportportal", "true")
+_CONCEPT_DIMENSIONS = [
+    DistinctCount("organizationCount", "orgId"),
+    OrgPathCounts(),
+    SizePerObject("mostInUse", "referrers", limit=Config.most_in_use_max_limit()),
+]
+_DATA_SERVICE_DIMENSIONS = [
+    DistinctCount("organizationCount", "orgId"),
+    OrgPathCounts(),
+    SetCounts("formats", "formats"),
+]
+_INFORMATION_MODEL_DIMENSIONS = [
+    DistinctCount("organizationCount", "orgId"),
+    OrgPathCounts(),
+]
+
+
+def _bindings(response: bytes, result_format: str = "json") -> list:
+    """Decode bindings from raw sparql json, tsv or csv response."""
+    if not response:
+        return []
+    if result_format != "json":
+        return parse_result_bytes(response, result_format)
+    results = json.loads(response).get("results")
+    bindings = results.get("bindings") if results else []
+    return bindings if bindings else []
 
 
 def _gather_dataset_metrics(
@@ -71,6 +169,45 @@ def _gather_dataset_metrics(
     return metrics
 
 
+def _concatenated_values(row: dict, key: str) -> list:
+    """Split GROUP_CONCAT value of key, empty list when missing."""
+    value = row.get(key, {}).get("value")
+    return [part for part in value.split("\n") if part] if value else []
+
+
+def _gather_grouped_dataset_metrics(
+    format_result: list, general_result: list, publisher_result: list
+) -> dict:
+    """Gather dataset metrics from sparql bindings grouped per dataset."""
+    metrics: Dict = dict()
+
+    for row in general_result:
+        metrics[row["dataset"]["value"]] = {
+            "formats": set(),
+            "allThemes": set(_concatenated_values(row, "themes")),
+            "firstHarvested": row.get("firstHarvested", {}).get("value"),
+            "isOpenData": row.get("isOpenData", {}).get("value"),
+            "transportportal": row.get("transportportal", {}).get("value"),
+            "provenance": row.get("provenance", {}).get("value"),
+            "accessRights": row.get("accessRights", {}).get("value", "MISSING"),
+        }
+
+    for row in format_result:
+        dataset_metrics = metrics.setdefault(
+            row["dataset"]["value"], {"formats": set(), "allThemes": set()}
+        )
+        dataset_metrics["formats"].update(_concatenated_values(row, "formats"))
+
+    for row in publisher_result:
+        dataset_metrics = metrics.setdefault(
+            row["dataset"]["value"], {"formats": set(), "allThemes": set()}
+        )
+        dataset_metrics["orgId"] = row.get("orgId", {}).get("value")
+        dataset_metrics["orgPath"] = row.get("orgPath", {}).get("value", "/MISSING")
+
+    return metrics
+
+
 def _gather_concept_metrics(sparql_result: list) -> dict:
     """Gather concept metrics from sparql bindings."""
     metrics: Dict = dict()
@@ -125,221 +262,655 @@ def _gather_information_model_metrics(sparql_result: list) -> dict:
     return metrics
 
 
-def _split_org_path(org_path: str) -> list:
-    """Split org path into the different part blocks."""
-    parts = org_path.strip("/").split("/")
-    result = []
-    for i in range(1, len(parts) + 1):
-        result.append("/" + "/".join(parts[:i]))
-    return result
-
-
-def _dict_to_key_count_list(dictionary: dict) -> list:
-    """Convert str -> int dict to key count objects."""
-    result = list()
-    for key in dictionary:
-        result.append({"key": key, "count": dictionary[key]})
-    return result
-
-
-def _check_if_timestamp_is_after_date(timestamp: Optional[str], date: datetime) -> bool:
+def _harvest_timestamp(timestamp: Optional[str]) -> Optional[float]:
+    """Parse firstHarvested to unix time, None when missing or malformed."""
     if timestamp is None:
-        return False
+        return None
     else:
         format_with_ms = "%Y-%m-%dT%H:%M:%S.%fZ"
         format_without_ms = "%Y-%m-%dT%H:%M:%SZ"
         for fmt in [format_with_ms, format_without_ms]:
             try:
                 date_object = datetime.strptime(timestamp, fmt)
-                return date_object.replace(tzinfo=timezone.utc) > date
+                return date_object.replace(tzinfo=timezone.utc).timestamp()
             except ValueError:
                 continue
 
-        return False
+        return None
 
 
-async def get_dataset_report(
-    org_path: Optional[str], theme_profile: Optional[str]
-) -> DatasetsReport:
-    """Return datasets report."""
-    async with ClientSession() as session:
-        datasets_format_response = await query_format_dataset_report_metrics(session)
-        datasets_general_response = await query_general_dataset_report_metrics(session)
-        datasets_publisher_response = await query_publisher_dataset_report_metrics(
-            session
+def _since(new_since: Optional[datetime]) -> float:
+    """Return unix time objects are counted as new after, default a week ago."""
+    if new_since is None:
+        new_since = datetime.now(timezone.utc) - timedelta(days=7)
+    return new_since.timestamp()
+
+
+TIME_BUCKETS = ("week", "month")
+
+
+@dataclass
+class BucketCounts:
+    """Object counts of consecutive time buckets, starting at bucket first."""
+
+    first: int
+    counts: array
+
+
+@dataclass
+class SnapshotNode:
+    """Report of an orgPath node with sorted harvest epoch seconds of its objects."""
+
+    report: Any
+    harvested: array
+    buckets: Dict[str, BucketCounts] = field(default_factory=dict)
+
+
+def _bucket_index(timestamp: float, bucket: str) -> int:
+    """Return index of the week or month timestamp falls in."""
+    day = datetime.fromtimestamp(timestamp, timezone.utc).date()
+    if bucket == "week":
+        return (day.toordinal() - 1) // 7
+    return day.year * 12 + day.month - 1
+
+
+def _bucket_key(index: int, bucket: str) -> str:
+    """Return first day of week or year and month of bucket index."""
+    if bucket == "week":
+        return date.fromordinal(index * 7 + 1).isoformat()
+    return f"{index // 12:04d}-{index % 12 + 1:02d}"
+
+
+def _harvest_buckets(harvested: array) -> Dict[str, array]:
+    """Return bucket index per row of every time bucket, MISSING if unknown."""
+    return {
+        bucket: array(
+            "l",
+            (
+                (
+                    MISSING
+                    if harvested_at == MISSING
+                    else _bucket_index(harvested_at, bucket)
+                )
+                for harvested_at in harvested
+            ),
         )
+        for bucket in TIME_BUCKETS
+    }
+
+
+def _bucket_counts(indexes: Iterable[int]) -> BucketCounts:
+    """Count indexes into consecutive buckets, including empty ones between."""
+    counted = Counter(indexes)
+    if not counted:
+        return BucketCounts(first=0, counts=array("l"))
+    first = min(counted)
+    return BucketCounts(
+        first=first,
+        counts=array("l", (counted[i] for i in range(first, max(counted) + 1))),
+    )
+
 
-    metrics = _gather_dataset_metrics(
-        format_result=datasets_format_response,
-        general_result=datasets_general_response,
-        publisher_result=datasets_publisher_response,
+def _merge_bucket_counts(bucket_counts: List[BucketCounts]) -> BucketCounts:
+    """Sum bucket counts of disjoint object sets."""
+    indexes: Counter = Counter()
+    for counts in bucket_counts:
+        for offset, count in enumerate(counts.counts):
+            indexes[counts.first + offset] += count
+    return _bucket_counts(indexes.elements())
+
+
+def _snapshot_node(
+    report: Any,
+    columns: ReportColumns,
+    rows: List[int],
+    buckets: Dict[str, array],
+) -> SnapshotNode:
+    """Wrap report with sorted harvest times and bucket counts of rows."""
+    times = sorted(
+        harvested_at
+        for harvested_at in map(columns.harvested.__getitem__, rows)
+        if harvested_at != MISSING
     )
-    total = 0
-    orgs = set()
-    open_data_datasets = 0
-    national_component_datasets = 0
-    new_last_week = 0
-    seven_days_ago = datetime.now(timezone.utc) - timedelta(days=7)
-    access_rights_counts: Dict = dict()
-    org_path_counts: Dict = dict()
-    format_counts: Dict = dict()
-    theme_counts: Dict = dict()
-    for dataset_uri in metrics:
-        if (
-            theme_profile == "transport"
-            and metrics[dataset_uri]["transportportal"] != "true"
-        ):
-            continue
-        elif org_path and org_path not in metrics[dataset_uri].get("orgPath", ""):
+    return SnapshotNode(
+        report=report,
+        harvested=array("q", times),
+        buckets={
+            bucket: _bucket_counts(
+                index for index in map(indexes.__getitem__, rows) if index != MISSING
+            )
+            for bucket, indexes in buckets.items()
+        },
+    )
+
+
+def _node_report(node: SnapshotNode, new_since: Optional[datetime]) -> Any:
+    """Return node report counting objects harvested after new_since."""
+    new = len(node.harvested) - bisect_right(node.harvested, _since(new_since))
+    return replace(node.report, newLastWeek=new)
+
+
+@dataclass(frozen=True)
+class FacetLimits:
+    """Most facet values and deepest orgPath level included in a report."""
+
+    limit: Optional[int] = None
+    org_path_depth: Optional[int] = None
+
+
+_FACETS = ("orgPaths", "formats", "allThemes", "accessRights")
+
+
+def _limit_facets(report: Any, facets: Optional[FacetLimits]) -> Any:
+    """Cut facet lists, sorted by count, of report to facets limits."""
+    if facets is None or facets == FacetLimits():
+        return report
+    limited = dict()
+    for facet in _FACETS:
+        if not hasattr(report, facet):
             continue
-        else:
-            total += 1
-            if metrics[dataset_uri].get("accessRights") is not None:
-                access_right = metrics[dataset_uri]["accessRights"]
-                access_rights_counts[access_right] = (
-                    access_rights_counts.get(access_right, 0) + 1
+        values: Iterable[Dict[str, Any]] = getattr(report, facet)
+        if facet == "orgPaths" and facets.org_path_depth is not None:
+            values = (
+                value
+                for value in values
+                if value["key"].count("/") <= facets.org_path_depth
+            )
+        limited[facet] = list(islice(values, facets.limit))
+    return replace(report, **limited)
+
+
+def _columns(
+    metrics: dict, dimensions: List[Dimension], flags: Iterable = ()
+) -> ReportColumns:
+    """Encode metrics per uri into the columns of dimensions."""
+    timestamps = (
+        _harvest_timestamp(object_metrics.get("firstHarvested"))
+        for object_metrics in metrics.values()
+    )
+    return dimension_columns(
+        metrics,
+        array(
+            "q",
+            (
+                MISSING if timestamp is None else floor(timestamp)
+                for timestamp in timestamps
+            ),
+        ),
+        dimensions,
+        flags,
+    )
+
+
+def _select(columns: ReportColumns, org_path: Optional[str]) -> List[int]:
+    """Return rows of objects with orgPath containing org_path."""
+    if not org_path:
+        return list(range(len(columns)))
+    column = columns.single["orgPath"]
+    matching = [org_path in value for value in column.values]
+    return [
+        row
+        for row, code in enumerate(column.codes)
+        if code != MISSING and matching[code]
+    ]
+
+
+def _rows_by_org_path_node(columns: ReportColumns) -> Dict[Optional[str], List[int]]:
+    """Return rows of objects in each orgPath subtree, None holds all objects."""
+    column = columns.single["orgPath"]
+    nodes_of_code = [split_org_path(value) if value else [] for value in column.values]
+    by_node: Dict[Optional[str], List[int]] = {None: list(range(len(columns)))}
+    for row, code in enumerate(column.codes):
+        if code != MISSING:
+            for node in nodes_of_code[code]:
+                by_node.setdefault(node, []).append(row)
+    return by_node
+
+
+def _transport_rows(columns: ReportColumns, rows: List[int]) -> List[int]:
+    """Return rows of datasets on the transport portal."""
+    return list(compress(rows, map(columns.flags[_TRANSPORT].__getitem__, rows)))
+
+
+def _matches_other_org_paths(nodes: Iterable[Optional[str]], org_path: str) -> bool:
+    """Check if org_path is part of an orgPath without being a node itself."""
+    return any(node and org_path in node for node in nodes)
+
+
+def _top_matching_nodes(nodes: Iterable[Optional[str]], org_path: str) -> List[str]:
+    """Return nodes containing org_path whose parent node does not.
+
+    Objects with orgPath containing org_path are exactly the objects of these
+    nodes, and their subtrees are disjoint.
+    """
+    return [
+        node
+        for node in nodes
+        if node and org_path in node and org_path not in node.rsplit("/", 1)[0]
+    ]
+
+
+async def _report_snapshot(
+    name: str, build: Callable[[ClientSession], Awaitable[Dict]]
+) -> Dict:
+    """Return cached snapshot name, built with build when missing or expired.
+
+    Falls back to the last snapshot built when the build fails.
+    """
+
+    async def build_snapshot() -> Dict:
+        async with upstream_pools.client_session() as session:
+            with timed("mapping"):
+                return await build(session)
+
+    async def load() -> Dict:
+        return await last_known_good.load(
+            ("reportSnapshot", name), "reportSnapshot", build_snapshot
+        )
+
+    return await report_snapshots.get(name, load)
+
+
+@traced("get_dataset_report")
+async def get_dataset_report(
+    org_path: Optional[str],
+    theme_profile: Optional[str],
+    new_since: Optional[datetime] = None,
+    facets: Optional[FacetLimits] = None,
+) -> DatasetsReport:
+    """Return datasets report, newLastWeek counts datasets new since new_since."""
+    profile = theme_profile if theme_profile == "transport" else None
+    snapshot = await _report_snapshot("datasets", _dataset_report_snapshot)
+    node = snapshot.get((profile, org_path or None))
+    if node is not None:
+        report = _node_report(node, new_since)
+    elif not _matches_other_org_paths((node for _, node in snapshot), str(org_path)):
+        report = _dataset_report(_dataset_columns(dict()), [], profile)
+    else:
+        async with upstream_pools.client_session() as session:
+            with timed("mapping"):
+                report = await run_in_process(
+                    _build_dataset_report,
+                    *await _query_dataset_reports(session),
+                    org_path,
+                    profile,
+                    Config.datasets_report_grouped(),
+                    Config.sparql_result_format(),
+                    new_since,
                 )
-            if metrics[dataset_uri].get("orgId") is not None:
-                orgs.add(metrics[dataset_uri]["orgId"])
-            if metrics[dataset_uri].get("isOpenData") == "true":
-                open_data_datasets += 1
-            if (
-                metrics[dataset_uri].get("provenance")
-                == "http://data.brreg.no/datakatalog/provinens/nasjonal"
-            ):
-                national_component_datasets += 1
-            if metrics[dataset_uri].get(
-                "firstHarvested"
-            ) is not None and _check_if_timestamp_is_after_date(
-                metrics[dataset_uri]["firstHarvested"], seven_days_ago
-            ):
-                new_last_week += 1
-            for format_value in metrics[dataset_uri]["formats"]:
-                format_counts[format_value] = format_counts.get(format_value, 0) + 1
-            for theme_value in metrics[dataset_uri]["allThemes"]:
-                theme_counts[theme_value] = theme_counts.get(theme_value, 0) + 1
-            for part in _split_org_path(
-                metrics[dataset_uri].get("orgPath", "/MISSING")
-            ):
-                org_path_counts[part] = org_path_counts.get(part, 0) + 1
-
-    return DatasetsReport(
-        totalObjects=total,
-        newLastWeek=new_last_week,
-        organizationCount=len(orgs),
-        opendata=open_data_datasets,
-        nationalComponent=national_component_datasets,
-        orgPaths=_dict_to_key_count_list(org_path_counts),
-        formats=_dict_to_key_count_list(format_counts),
-        allThemes=_dict_to_key_count_list(theme_counts),
-        accessRights=_dict_to_key_count_list(access_rights_counts),
+    return _limit_facets(report, facets)
+
+
+async def _query_dataset_reports(session: ClientSession) -> Tuple[bytes, ...]:
+    """Query raw format, general and publisher dataset report metrics."""
+    grouped = Config.datasets_report_grouped()
+    return (
+        await query_format_dataset_report_metrics(session, grouped),
+        await query_general_dataset_report_metrics(session, grouped),
+        await query_publisher_dataset_report_metrics(session),
     )
 
 
-async def get_concept_report(org_path: Optional[str]) -> ConceptReport:
-    """Return concepts report."""
-    async with ClientSession() as session:
-        concepts_response = await query_concepts_report(session)
-
-    metrics = _gather_concept_metrics(concepts_response)
-    total = 0
-    orgs = set()
-    new_last_week = 0
-    seven_days_ago = datetime.now(timezone.utc) - timedelta(days=7)
-    org_path_counts: Dict = dict()
-    referer_counts: Dict = dict()
-    for concept_uri in metrics:
-        if org_path and org_path not in metrics[concept_uri]["orgPath"]:
-            continue
-        else:
-            total += 1
-            if metrics[concept_uri]["orgId"] is not None:
-                orgs.add(metrics[concept_uri]["orgId"])
-            if _check_if_timestamp_is_after_date(
-                metrics[concept_uri]["firstHarvested"], seven_days_ago
-            ):
-                new_last_week += 1
-            if len(metrics[concept_uri]["referrers"]) > 0:
-                referer_counts[concept_uri] = len(metrics[concept_uri]["referrers"])
-            for part in _split_org_path(metrics[concept_uri]["orgPath"]):
-                org_path_counts[part] = org_path_counts.get(part, 0) + 1
-
-    return ConceptReport(
-        totalObjects=total,
-        newLastWeek=new_last_week,
-        organizationCount=len(orgs),
-        orgPaths=_dict_to_key_count_list(org_path_counts),
-        mostInUse=_dict_to_key_count_list(referer_counts),
+async def _dataset_report_snapshot(session: ClientSession) -> Dict:
+    """Build dataset report snapshot in the process pool."""
+    return await run_in_process(
+        _build_dataset_report_snapshot,
+        *await _query_dataset_reports(session),
+        Config.datasets_report_grouped(),
+        Config.sparql_result_format(),
     )
 
 
-async def get_data_service_report(org_path: Optional[str]) -> DataServiceReport:
-    """Return data services report."""
-    async with ClientSession() as session:
-        data_services_response = await query_data_services_report(session)
-
-    metrics = _gather_data_service_metrics(data_services_response)
-    total = 0
-    orgs = set()
-    new_last_week = 0
-    seven_days_ago = datetime.now(timezone.utc) - timedelta(days=7)
-    org_path_counts: Dict = dict()
-    format_counts: Dict = dict()
-    for data_service_uri in metrics:
-        if org_path and org_path not in metrics[data_service_uri]["orgPath"]:
-            continue
-        else:
-            total += 1
-            if metrics[data_service_uri]["orgId"] is not None:
-                orgs.add(metrics[data_service_uri]["orgId"])
-            if _check_if_timestamp_is_after_date(
-                metrics[data_service_uri]["firstHarvested"], seven_days_ago
-            ):
-                new_last_week += 1
-            for format_value in metrics[data_service_uri]["formats"]:
-                format_counts[format_value] = format_counts.get(format_value, 0) + 1
-            for part in _split_org_path(metrics[data_service_uri]["orgPath"]):
-                org_path_counts[part] = org_path_counts.get(part, 0) + 1
+def _dataset_columns(metrics: dict) -> ReportColumns:
+    """Encode dataset metrics into report columns."""
+    return _columns(metrics, _DATASET_DIMENSIONS, [_TRANSPORT])
+
+
+def _dataset_report_columns(
+    format_response: bytes,
+    general_response: bytes,
+    publisher_response: bytes,
+    grouped: bool,
+    result_format: str,
+) -> ReportColumns:
+    """Decode raw dataset report responses into dataset columns."""
+    gather = _gather_grouped_dataset_metrics if grouped else _gather_dataset_metrics
+    return _dataset_columns(
+        gather(
+            format_result=_bindings(format_response, result_format),
+            general_result=_bindings(general_response, result_format),
+            publisher_result=_bindings(publisher_response, result_format),
+        )
+    )
+
+
+def _build_dataset_report(
+    format_response: bytes,
+    general_response: bytes,
+    publisher_response: bytes,
+    org_path: Optional[str],
+    theme_profile: Optional[str],
+    grouped: bool = False,
+    result_format: str = "json",
+    new_since: Optional[datetime] = None,
+) -> DatasetsReport:
+    """Aggregate dataset report from raw sparql responses."""
+    columns = _dataset_report_columns(
+        format_response, general_response, publisher_response, grouped, result_format
+    )
+    return _dataset_report(
+        columns, _select(columns, org_path), theme_profile, _since(new_since)
+    )
+
+
+def _build_dataset_report_snapshot(
+    format_response: bytes,
+    general_response: bytes,
+    publisher_response: bytes,
+    grouped: bool = False,
+    result_format: str = "json",
+) -> Dict[Tuple[Optional[str], Optional[str]], SnapshotNode]:
+    """Aggregate dataset reports per theme profile and orgPath node."""
+    columns = _dataset_report_columns(
+        format_response, general_response, publisher_response, grouped, result_format
+    )
+    buckets = _harvest_buckets(columns.harvested)
+    snapshot = dict()
+    for node, rows in _rows_by_org_path_node(columns).items():
+        transport_rows = _transport_rows(columns, rows)
+        for profile, profile_rows in ((None, rows), ("transport", transport_rows)):
+            snapshot[(profile, node)] = _snapshot_node(
+                _dataset_report(columns, profile_rows, None),
+                columns,
+                profile_rows,
+                buckets,
+            )
+    return snapshot
+
+
+def _dataset_report(
+    columns: ReportColumns,
+    rows: List[int],
+    theme_profile: Optional[str],
+    since: Optional[float] = None,
+) -> DatasetsReport:
+    """Aggregate dataset report of datasets in rows."""
+    if theme_profile == "transport":
+        rows = _transport_rows(columns, rows)
+    return DatasetsReport(**aggregate(columns, rows, _DATASET_DIMENSIONS, since))
+
+
+@traced("get_concept_report")
+async def get_concept_report(
+    org_path: Optional[str],
+    new_since: Optional[datetime] = None,
+    limit: Optional[int] = None,
+    facets: Optional[FacetLimits] = None,
+) -> ConceptReport:
+    """Return concepts report with the limit most referred concepts in mostInUse.
+
+    newLastWeek counts concepts new since new_since.
+    """
+    report = await _single_query_report(
+        "concepts",
+        query_concepts_report,
+        _build_concept_report,
+        _concept_report,
+        _CONCEPT_DIMENSIONS,
+        org_path,
+        new_since,
+    )
+    return _most_in_use(_limit_facets(report, facets), limit)
+
+
+def _most_in_use(report: ConceptReport, limit: Optional[int]) -> ConceptReport:
+    """Cut mostInUse, ranked by count, to the limit most referred concepts."""
+    if limit is None or limit >= len(report.mostInUse):
+        return report
+    return replace(report, mostInUse=report.mostInUse[:limit])
+
+
+def _build_concept_report(
+    sparql_response: bytes,
+    org_path: Optional[str],
+    result_format: str = "json",
+    new_since: Optional[datetime] = None,
+) -> ConceptReport:
+    """Aggregate concept report from raw sparql response."""
+    columns = _columns(
+        _gather_concept_metrics(_bindings(sparql_response, result_format)),
+        _CONCEPT_DIMENSIONS,
+    )
+    return _concept_report(columns, _select(columns, org_path), _since(new_since))
+
+
+def _concept_report(
+    columns: ReportColumns, rows: List[int], since: Optional[float] = None
+) -> ConceptReport:
+    """Aggregate concept report of concepts in rows."""
+    return ConceptReport(**aggregate(columns, rows, _CONCEPT_DIMENSIONS, since))
+
+
+@traced("get_data_service_report")
+async def get_data_service_report(
+    org_path: Optional[str],
+    new_since: Optional[datetime] = None,
+    facets: Optional[FacetLimits] = None,
+) -> DataServiceReport:
+    """Return data services report, newLastWeek counts services new since new_since."""
+    report = await _single_query_report(
+        "dataServices",
+        query_data_services_report,
+        _build_data_service_report,
+        _data_service_report,
+        _DATA_SERVICE_DIMENSIONS,
+        org_path,
+        new_since,
+    )
+    return _limit_facets(report, facets)
 
+
+def _build_data_service_report(
+    sparql_response: bytes,
+    org_path: Optional[str],
+    result_format: str = "json",
+    new_since: Optional[datetime] = None,
+) -> DataServiceReport:
+    """Aggregate data service report from raw sparql response."""
+    columns = _columns(
+        _gather_data_service_metrics(_bindings(sparql_response, result_format)),
+        _DATA_SERVICE_DIMENSIONS,
+    )
+    return _data_service_report(columns, _select(columns, org_path), _since(new_since))
+
+
+def _data_service_report(
+    columns: ReportColumns, rows: List[int], since: Optional[float] = None
+) -> DataServiceReport:
+    """Aggregate data service report of data services in rows."""
     return DataServiceReport(
-        totalObjects=total,
-        newLastWeek=new_last_week,
-        organizationCount=len(orgs),
-        orgPaths=_dict_to_key_count_list(org_path_counts),
-        formats=_dict_to_key_count_list(format_counts),
+        **aggregate(columns, rows, _DATA_SERVICE_DIMENSIONS, since)
     )
 
 
+@traced("get_information_model_report")
 async def get_information_model_report(
     org_path: Optional[str],
+    new_since: Optional[datetime] = None,
+    facets: Optional[FacetLimits] = None,
 ) -> InformationModelReport:
-    """Return information models report."""
-    async with ClientSession() as session:
-        info_models_response = await query_information_models_report(session)
-
-    metrics = _gather_information_model_metrics(info_models_response)
-    total = 0
-    orgs = set()
-    new_last_week = 0
-    seven_days_ago = datetime.now(timezone.utc) - timedelta(days=7)
-    org_path_counts: Dict = dict()
-    for info_model_uri in metrics:
-        if org_path and org_path not in metrics[info_model_uri]["orgPath"]:
-            continue
-        else:
-            total += 1
-            if metrics[info_model_uri]["orgId"] is not None:
-                orgs.add(metrics[info_model_uri]["orgId"])
-            if _check_if_timestamp_is_after_date(
-                metrics[info_model_uri]["firstHarvested"], seven_days_ago
-            ):
-                new_last_week += 1
-            for part in _split_org_path(metrics[info_model_uri]["orgPath"]):
-                org_path_counts[part] = org_path_counts.get(part, 0) + 1
+    """Return information models report, newLastWeek counts models new since new_since."""
+    report = await _single_query_report(
+        "informationModels",
+        query_information_models_report,
+        _build_information_model_report,
+        _information_model_report,
+        _INFORMATION_MODEL_DIMENSIONS,
+        org_path,
+        new_since,
+    )
+    return _limit_facets(report, facets)
+
 
+def _build_information_model_report(
+    sparql_response: bytes,
+    org_path: Optional[str],
+    result_format: str = "json",
+    new_since: Optional[datetime] = None,
+) -> InformationModelReport:
+    """Aggregate information model report from raw sparql response."""
+    columns = _columns(
+        _gather_information_model_metrics(_bindings(sparql_response, result_format)),
+        _INFORMATION_MODEL_DIMENSIONS,
+    )
+    return _information_model_report(
+        columns, _select(columns, org_path), _since(new_since)
+    )
+
+
+def _information_model_report(
+    columns: ReportColumns, rows: List[int], since: Optional[float] = None
+) -> InformationModelReport:
+    """Aggregate information model report of information models in rows."""
     return InformationModelReport(
-        totalObjects=total,
-        newLastWeek=new_last_week,
-        organizationCount=len(orgs),
-        orgPaths=_dict_to_key_count_list(org_path_counts),
+        **aggregate(columns, rows, _INFORMATION_MODEL_DIMENSIONS, since)
+    )
+
+
+def _single_query_snapshot(
+    query: Callable[[ClientSession], Awaitable[bytes]], name: str
+) -> Callable[[ClientSession], Awaitable[Dict]]:
+    """Return snapshot build from one raw report query."""
+
+    async def build(session: ClientSession) -> Dict:
+        return await run_in_process(
+            _build_single_query_snapshot,
+            name,
+            await query(session),
+            Config.sparql_result_format(),
+        )
+
+    return build
+
+
+async def _single_query_report(
+    name: str,
+    query: Callable[[ClientSession], Awaitable[bytes]],
+    build: Callable[..., Any],
+    empty: Callable[[ReportColumns, List[int]], Any],
+    dimensions: List[Dimension],
+    org_path: Optional[str],
+    new_since: Optional[datetime],
+) -> Any:
+    """Return report of org_path from snapshot name, or from query if no node."""
+    snapshot = await _report_snapshot(name, _single_query_snapshot(query, name))
+    node = snapshot.get(org_path or None)
+    if node is not None:
+        return _node_report(node, new_since)
+    if not _matches_other_org_paths(snapshot, str(org_path)):
+        return empty(_columns(dict(), dimensions), [])
+
+    async with upstream_pools.client_session() as session:
+        response = await query(session)
+
+    with timed("mapping"):
+        return await run_in_process(
+            build, response, org_path, Config.sparql_result_format(), new_since
+        )
+
+
+def _build_single_query_snapshot(
+    name: str, sparql_response: bytes, result_format: str = "json"
+) -> Dict[Optional[str], SnapshotNode]:
+    """Aggregate report name per orgPath node from raw sparql response."""
+    gather, dimensions, report = {
+        "concepts": (_gather_concept_metrics, _CONCEPT_DIMENSIONS, _concept_report),
+        "dataServices": (
+            _gather_data_service_metrics,
+            _DATA_SERVICE_DIMENSIONS,
+            _data_service_report,
+        ),
+        "informationModels": (
+            _gather_information_model_metrics,
+            _INFORMATION_MODEL_DIMENSIONS,
+            _information_model_report,
+        ),
+    }[name]
+    columns = _columns(gather(_bindings(sparql_response, result_format)), dimensions)
+    buckets = _harvest_buckets(columns.harvested)
+    return {
+        node: _snapshot_node(report(columns, rows), columns, rows, buckets)
+        for node, rows in _rows_by_org_path_node(columns).items()
+    }
+
+
+@traced("get_all_reports")
+async def get_all_reports(
+    org_path: Optional[str],
+    theme_profile: Optional[str],
+    new_since: Optional[datetime] = None,
+    limit: Optional[int] = None,
+    facets: Optional[FacetLimits] = None,
+) -> AllReports:
+    """Return dataset, data service, concept and information model reports."""
+    datasets, data_services, concepts, information_models = await asyncio.gather(
+        get_dataset_report(org_path, theme_profile, new_since, facets),
+        get_data_service_report(org_path, new_since, facets),
+        get_concept_report(org_path, new_since, limit, facets),
+        get_information_model_report(org_path, new_since, facets),
+    )
+    return AllReports(
+        datasets=datasets,
+        dataServices=data_services,
+        concepts=concepts,
+        informationModels=information_models,
+    )
+
+
+def _report_type_snapshot(
+    report_type: str,
+) -> Tuple[str, Callable[[ClientSession], Awaitable[Dict]]]:
+    """Return snapshot name and build of report type."""
+    if report_type == "datasets":
+        return "datasets", _dataset_report_snapshot
+    name, query = {
+        "concepts": ("concepts", query_concepts_report),
+        "data-services": ("dataServices", query_data_services_report),
+        "information-models": ("informationModels", query_information_models_report),
+    }[report_type]
+    return name, _single_query_snapshot(query, name)
+
+
+@traced("get_report_timeseries")
+async def get_report_timeseries(
+    report_type: str,
+    org_path: Optional[str],
+    bucket: str,
+    theme_profile: Optional[str] = None,
+) -> ReportTimeSeries:
+    """Return harvested objects per week or month, sliced from the snapshot."""
+    if bucket not in TIME_BUCKETS:
+        raise ValueError(f"Unknown time bucket {bucket}")
+    name, build = _report_type_snapshot(report_type)
+    snapshot = await _report_snapshot(name, build)
+    if report_type == "datasets":
+        profile = theme_profile if theme_profile == "transport" else None
+        snapshot = {node: n for (p, node), n in snapshot.items() if p == profile}
+
+    node = snapshot.get(org_path or None)
+    if node is not None:
+        counts = node.buckets[bucket]
+    else:
+        counts = _merge_bucket_counts(
+            [
+                snapshot[match].buckets[bucket]
+                for match in _top_matching_nodes(snapshot, str(org_path))
+            ]
+        )
+    return ReportTimeSeries(
+        bucket=bucket,
+        series=[
+            {"key": _bucket_key(counts.first + offset, bucket), "count": count}
+            for offset, count in enumerate(counts.counts)
+        ],
     )
@@ -0,0 +1,202 @@
+"""Client for fdk-sparql-service.
+
+Queries carry a name for statistics and their form encoding, so constant
+queries are encoded once at import. Queries with a longer encoding than
+the post threshold are sent as form encoded POST instead of GET, and all
+queries pass sparql's admission control.
+"""
+
+from dataclasses import dataclass
+import time
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional, TypeVar
+from urllib.parse import quote_plus
+
+from aiohttp import ClientResponse, ClientSession
+
+from fdk_organization_bff.classes import UpstreamEnum
+from fdk_organization_bff.config import Config
+from fdk_organization_bff.service.admission_control import admission_control
+from fdk_organization_bff.service.upstream_pools import upstream_pools
+from fdk_organization_bff.sparql.results import (
+    MEDIA_TYPES,
+    parse_result_bytes,
+    tsv_row,
+    tsv_variables,
+)
+from fdk_organization_bff.utils.json_decoding import decode_json
+from fdk_organization_bff.utils.metrics import metrics
+from fdk_organization_bff.utils.request_timings import record_rows, timed
+from fdk_organization_bff.utils.tracing import span, trace_headers
+
+T = TypeVar("T")
+
+FORM_CONTENT_TYPE = "application/x-www-form-urlencoded"
+
+
+class SparqlQueryError(Exception):
+    """Sparql query answered without a successful response."""
+
+    def __init__(self: "SparqlQueryError", query: str) -> None:
+        """Init error with name of failed query."""
+        super().__init__(query)
+        self.query = query
+
+    def __str__(self: "SparqlQueryError") -> str:
+        """Return name of failed query."""
+        return f"sparql query {self.query} failed"
+
+
+@dataclass(frozen=True)
+class SparqlQuery:
+    """Named sparql query with its form encoding."""
+
+    name: str
+    text: str
+    encoded: str
+
+
+def sparql_query(name: str, text: str) -> SparqlQuery:
+    """Create named query and encode it."""
+    return SparqlQuery(
+        name=name, text=text, encoded=f"query={quote_plus(text, safe='/:?')}"
+    )
+
+
+async def _lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """Split streamed chunks into utf-8 lines, keeping line endings."""
+    pending = b""
+    async for chunk in chunks:
+        pending += chunk
+        *complete, pending = pending.split(b"\n")
+        for line in complete:
+            yield line.decode("utf-8") + "\n"
+    if pending:
+        yield pending.decode("utf-8")
+
+
+async def _read_tsv_rows(response: ClientResponse) -> List[Dict]:
+    """Parse TSV rows as lines arrive."""
+    rows: List[Dict] = []
+    variables: Optional[List[str]] = None
+    async for line in _lines(response.content.iter_chunked(64 * 1024)):
+        if variables is None:
+            variables = tsv_variables(line)
+        else:
+            row = tsv_row(variables, line)
+            if row is not None:
+                rows.append(row)
+    return rows
+
+
+class SparqlClient:
+    """Send named queries to fdk-sparql-service and record per query stats."""
+
+    def __init__(self: "SparqlClient", post_threshold: int) -> None:
+        """Init client, encodings longer than post_threshold are posted."""
+        self.post_threshold = post_threshold
+
+    async def raw(
+        self: "SparqlClient",
+        query: SparqlQuery,
+        session: ClientSession,
+        accept: str = MEDIA_TYPES["json"],
+    ) -> Optional[bytes]:
+        """Return undecoded response, None when not successful."""
+        return await self._send(query, session, accept, lambda r: r.read())
+
+    async def bindings(
+        self: "SparqlClient",
+        query: SparqlQuery,
+        session: ClientSession,
+        result_format: str = "json",
+    ) -> Dict:
+        """Return response as sparql json, raise SparqlQueryError when not successful.
+
+        TSV rows are parsed as lines arrive, CSV rows may span lines and are
+        parsed once the response is read.
+        """
+        if result_format == "json":
+            raw = await self.raw(query, session)
+            if raw is None:
+                raise SparqlQueryError(query.name)
+            response = await decode_json(raw, UpstreamEnum.SPARQL.value)
+            rows = _bindings_count(response)
+        else:
+            read: Callable[[ClientResponse], Awaitable[List[Dict]]] = (
+                _read_tsv_rows
+                if result_format == "tsv"
+                else _read_parsed_rows(result_format)
+            )
+            parsed = await self._send(query, session, MEDIA_TYPES[result_format], read)
+            if parsed is None:
+                raise SparqlQueryError(query.name)
+            response = {"results": {"bindings": parsed}}
+            rows = len(parsed)
+
+        metrics.inc("sparql_query_rows_total", rows, query=query.name)
+        record_rows(UpstreamEnum.SPARQL.value, rows)
+        return response if isinstance(response, dict) else dict()
+
+    async def _send(
+        self: "SparqlClient",
+        query: SparqlQuery,
+        session: ClientSession,
+        accept: str,
+        read: Callable[[ClientResponse], Awaitable[T]],
+    ) -> Optional[T]:
+        """Send query as GET or form POST and read a successful response."""
+        name = UpstreamEnum.SPARQL.value
+        url = Config.sparql_uri()
+        session = upstream_pools.session(UpstreamEnum.SPARQL) or session
+        headers = {"Accept": accept, **trace_headers()}
+        post = len(query.encoded) > self.post_threshold
+        async with admission_control.admit(UpstreamEnum.SPARQL):
+            start = time.perf_counter()
+            with timed(name), span(
+                f"{name} {'POST' if post else 'GET'}",
+                **{"http.url": url, "sparql.query": query.name},
+            ) as upstream_span:
+                async with (
+                    session.post(
+                        url,
+                        data=query.encoded,
+                        headers={**headers, "Content-Type": FORM_CONTENT_TYPE},
+                    )
+                    if post
+                    else session.get(f"{url}?{query.encoded}", headers=headers)
+                ) as response:
+                    if upstream_span:
+                        upstream_span.attributes["http.status_code"] = response.status
+                    result = await read(response) if response.status == 200 else None
+
+        elapsed = time.perf_counter() - start
+        metrics.observe("upstream_network_seconds", elapsed, upstream=name)
+        metrics.observe("sparql_query_seconds", elapsed, query=query.name)
+        if isinstance(result, bytes):
+            metrics.inc("upstream_response_bytes_total", len(result), upstream=name)
+        return result
+
+
+def _read_parsed_rows(
+    result_format: str,
+) -> Callable[[ClientResponse], Awaitable[List[Dict]]]:
+    """Return reader parsing a complete CSV or TSV response."""
+
+    async def read(response: ClientResponse) -> List[Dict]:
+        return parse_result_bytes(await response.read(), result_format)
+
+    return read
+
+
+def _bindings_count(response: object) -> int:
+    """Count bindings in sparql json response."""
+    results = response.get("results") if isinstance(response, dict) else None
+    bindings = results.get("bindings") if isinstance(results, dict) else None
+    return len(bindings) if isinstance(bindings, list) else 0
+
+
+sparql_client = SparqlClient(Config.sparql_post_threshold_bytes())
+metrics.describe(
+    "sparql_query_seconds", "summary", "Time per named sparql query, read included."
+)
+metrics.describe("sparql_query_rows_total", "counter", "Rows per named sparql query.")
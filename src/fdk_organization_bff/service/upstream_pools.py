@@ -0,0 +1,150 @@
+"""Connection pools isolating upstreams from each other.
+
+Every upstream gets its own connector with its own connection limit, so a
+slow upstream holding all its connections only queues its own requests.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+import time
+from types import SimpleNamespace
+from typing import AsyncIterator, Dict, Iterator, Optional, Tuple, Union
+
+from aiohttp import (
+    ClientSession,
+    TCPConnector,
+    TraceConfig,
+    TraceConnectionQueuedEndParams,
+    TraceConnectionQueuedStartParams,
+    TraceRequestEndParams,
+    TraceRequestExceptionParams,
+    TraceRequestStartParams,
+)
+
+from fdk_organization_bff.classes import UpstreamEnum
+from fdk_organization_bff.config import Config
+from fdk_organization_bff.utils.metrics import metrics
+
+
+def _saturation_trace_config(upstream: str) -> TraceConfig:
+    """Count in flight requests and connection queueing for upstream."""
+    trace_config = TraceConfig()
+
+    async def request_start(
+        session: ClientSession,
+        context: SimpleNamespace,
+        params: TraceRequestStartParams,
+    ) -> None:
+        metrics.inc("upstream_pool_in_flight", 1, upstream=upstream)
+
+    async def request_done(
+        session: ClientSession,
+        context: SimpleNamespace,
+        params: Union[TraceRequestEndParams, TraceRequestExceptionParams],
+    ) -> None:
+        metrics.inc("upstream_pool_in_flight", -1, upstream=upstream)
+
+    async def queued_start(
+        session: ClientSession,
+        context: SimpleNamespace,
+        params: TraceConnectionQueuedStartParams,
+    ) -> None:
+        context.queued_at = time.perf_counter()
+
+    async def queued_end(
+        session: ClientSession,
+        context: SimpleNamespace,
+        params: TraceConnectionQueuedEndParams,
+    ) -> None:
+        metrics.observe(
+            "upstream_pool_queue_seconds",
+            time.perf_counter() - context.queued_at,
+            upstream=upstream,
+        )
+
+    trace_config.on_request_start.append(request_start)
+    trace_config.on_request_end.append(request_done)
+    trace_config.on_request_exception.append(request_done)
+    trace_config.on_connection_queued_start.append(queued_start)
+    trace_config.on_connection_queued_end.append(queued_end)
+    return trace_config
+
+
+class UpstreamPools:
+    """Client sessions with a separate connector per upstream."""
+
+    def __init__(self: "UpstreamPools") -> None:
+        """Init without sessions, they are created by start."""
+        self._sessions: Dict[UpstreamEnum, ClientSession] = dict()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def start(self: "UpstreamPools") -> None:
+        """Create a session per upstream on the running loop."""
+        self._loop = asyncio.get_running_loop()
+        for upstream in UpstreamEnum:
+            pool = Config.upstream_pool(upstream.name)
+            connector = TCPConnector(
+                limit=int(pool["limit"]),
+                keepalive_timeout=pool["keepalive_timeout"],
+                ttl_dns_cache=int(pool["dns_cache_ttl"]),
+            )
+            self._sessions[upstream] = ClientSession(
+                connector=connector,
+                trace_configs=[_saturation_trace_config(upstream.value)],
+            )
+
+    async def close(self: "UpstreamPools") -> None:
+        """Close all sessions and their connections."""
+        sessions, self._sessions = self._sessions, dict()
+        await asyncio.gather(*(session.close() for session in sessions.values()))
+        self._loop = None
+
+    def session(
+        self: "UpstreamPools", upstream: Optional[UpstreamEnum]
+    ) -> Optional[ClientSession]:
+        """Return pooled session for upstream, None when pools are not started."""
+        if upstream is None or self._loop is not asyncio.get_running_loop():
+            return None
+        return self._sessions.get(upstream)
+
+    @asynccontextmanager
+    async def client_session(self: "UpstreamPools") -> AsyncIterator[ClientSession]:
+        """Yield session for adapter calls, a new one only when not started.
+
+        Adapter calls send requests on the pooled session of their upstream,
+        so while the pools are started no session is opened per request.
+        """
+        pooled = self.session(UpstreamEnum.SPARQL)
+        if pooled is not None:
+            yield pooled
+            return
+        async with ClientSession() as session:
+            yield session
+
+    def saturation(self: "UpstreamPools") -> Iterator[Tuple[str, Dict, float]]:
+        """Return connection limit and in use connections per upstream."""
+        for upstream, session in self._sessions.items():
+            connector = session.connector
+            if not isinstance(connector, TCPConnector):
+                continue
+            labels = {"upstream": upstream.value}
+            yield "upstream_pool_limit", labels, connector.limit
+            yield "upstream_pool_in_use", labels, len(
+                getattr(connector, "_acquired", ())
+            )
+
+
+upstream_pools = UpstreamPools()
+metrics.register_collector(upstream_pools.saturation)
+metrics.describe(
+    "upstream_pool_in_flight", "gauge", "Requests in flight or queued per upstream."
+)
+metrics.describe(
+    "upstream_pool_in_use", "gauge", "Connections in use per upstream pool."
+)
+metrics.describe("upstream_pool_limit", "gauge", "Connection limit per upstream pool.")
+metrics.describe(
+    "upstream_pool_queue_seconds",
+    "summary",
+    "Time requests waited for a free connection per upstream.",
+)
@@ -0,0 +1,113 @@
+"""Snapshot of warm in-memory state for fast restarts.
+
+The organization directory, the municipality lookup, cached Brreg data,
+report snapshots and last known good aggregates are pickled to a local
+file periodically and on shutdown. On startup the file is memory mapped
+and unpickled before the first request, so a restarted worker answers
+from warm state while the background refreshes revalidate it.
+"""
+
+import asyncio
+import logging
+import mmap
+import os
+import pickle  # noqa: S403
+import time
+from typing import Any, Dict
+
+from fdk_organization_bff.service.municipality_lookup_cache import (
+    municipality_lookup_cache,
+)
+from fdk_organization_bff.service.org_catalog_service import brreg_cache
+from fdk_organization_bff.service.organization_directory import (
+    organization_directory,
+)
+from fdk_organization_bff.service.report_service import report_snapshots
+from fdk_organization_bff.utils.staleness import last_known_good
+
+SNAPSHOT_VERSION = 2
+
+
+def collect_snapshot() -> Dict[str, Any]:
+    """Collect current warm state."""
+    return {
+        "version": SNAPSHOT_VERSION,
+        "savedAt": time.time(),
+        "organizations": organization_directory.organizations(),
+        "municipalities": municipality_lookup_cache.snapshot(),
+        "brreg": brreg_cache.snapshot(),
+        "reports": report_snapshots.snapshot(),
+        "lastKnownGood": last_known_good.snapshot(),
+    }
+
+
+def restore_snapshot(snapshot: Dict[str, Any]) -> None:
+    """Restore warm state, ages include the time since the snapshot was saved."""
+    elapsed = max(0.0, time.time() - snapshot["savedAt"])
+    if snapshot["organizations"] and organization_directory.loaded_at is None:
+        organization_directory.index(snapshot["organizations"])
+    if snapshot["municipalities"] is not None:
+        municipality_lookup_cache.restore(*snapshot["municipalities"])
+    brreg_cache.restore(
+        [(key, value, age + elapsed) for key, value, age in snapshot["brreg"]]
+    )
+    report_snapshots.restore(
+        [(key, value, age + elapsed) for key, value, age in snapshot["reports"]]
+    )
+    last_known_good.restore(
+        [(key, value, age + elapsed) for key, value, age in snapshot["lastKnownGood"]]
+    )
+
+
+def write_snapshot(path: str, snapshot: Dict[str, Any]) -> None:
+    """Pickle snapshot to path, replacing it atomically."""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as file:
+        pickle.dump(snapshot, file, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+
+
+def read_snapshot(path: str) -> Dict[str, Any]:
+    """Unpickle snapshot from memory mapped path."""
+    with open(path, "rb") as file, mmap.mmap(
+        file.fileno(), 0, access=mmap.ACCESS_READ
+    ) as mapped:
+        return pickle.loads(mapped)  # noqa: S301
+
+
+def load_snapshot(path: str) -> bool:
+    """Restore warm state from path, False when there is no usable snapshot."""
+    if not os.path.exists(path):
+        return False
+    start = time.perf_counter()
+    try:
+        snapshot = read_snapshot(path)
+        if snapshot.get("version") != SNAPSHOT_VERSION:
+            logging.warning(f"Ignoring warm snapshot {path} with other version")
+            return False
+        restore_snapshot(snapshot)
+    except Exception:
+        logging.warning(f"Unable to load warm snapshot from {path}")
+        return False
+
+    logging.info(
+        f"Loaded warm snapshot from {path} in "
+        f"{(time.perf_counter() - start) * 1000:.0f}ms"
+    )
+    return True
+
+
+async def save_snapshot(path: str) -> None:
+    """Collect warm state and write it to path off the event loop."""
+    snapshot = collect_snapshot()
+    try:
+        await asyncio.to_thread(write_snapshot, path, snapshot)
+    except OSError:
+        logging.warning(f"Unable to write warm snapshot to {path}")
+
+
+async def save_periodically(path: str, interval: float) -> None:
+    """Save warm snapshot every interval seconds until cancelled."""
+    while True:
+        await asyncio.sleep(interval)
+        await save_snapshot(path)
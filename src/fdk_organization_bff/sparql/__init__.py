@@ -3,4 +3,6 @@
 Modules:
     dataset_queries
     dataservice_queries
+    results
+    utils
 """
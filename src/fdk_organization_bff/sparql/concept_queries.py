@@ -1,6 +1,9 @@
 """Module for Concept SPARQL-queries."""
 
 from string import Template
+from typing import List
+
+from fdk_organization_bff.sparql.utils import values_literals
 
 
 def build_concepts_by_publisher_query() -> str:
@@ -41,6 +44,26 @@ def build_org_concepts_query(organization_id: str) -> str:
     """).substitute(org_id=organization_id)
 
 
+def build_publishers_concepts_query(organization_ids: List[str]) -> str:
+    """Build query for concepts published by any of the given organizations."""
+    return Template("""
+        PREFIX dct: <http://purl.org/dc/terms/>
+        PREFIX dcat: <http://www.w3.org/ns/dcat#>
+        PREFIX foaf: <http://xmlns.com/foaf/0.1/>
+        PREFIX skos: <http://www.w3.org/2004/02/skos/core#>
+        SELECT DISTINCT ?organizationNumber ?concept ?issued
+        WHERE {
+            VALUES ?organizationNumber { $org_ids }
+            ?concept a skos:Concept .
+            ?record foaf:primaryTopic ?concept .
+            ?record a dcat:CatalogRecord .
+            ?record dct:issued ?issued .
+            ?concept dct:publisher ?publisher .
+            ?publisher dct:identifier ?organizationNumber .
+        }
+    """).substitute(org_ids=values_literals(organization_ids))
+
+
 def concepts_report_query() -> str:
     """Query for concepts report."""
     return """
@@ -1,6 +1,9 @@
 """Module for DataService SPARQL-queries."""
 
 from string import Template
+from typing import List
+
+from fdk_organization_bff.sparql.utils import values_literals
 
 
 def build_dataservices_by_publisher_query() -> str:
@@ -40,6 +43,27 @@ WHERE {{
     return query_template.substitute(org_id=organization_id)
 
 
+def build_publishers_dataservices_query(organization_ids: List[str]) -> str:
+    """Build query for dataservices published by any of the given organizations."""
+    query_template = Template("""
+PREFIX dct: <http://purl.org/dc/terms/>
+PREFIX foaf: <http://xmlns.com/foaf/0.1/>
+PREFIX dcat: <http://www.w3.org/ns/dcat#>
+
+SELECT DISTINCT ?organizationNumber ?service ?issued
+WHERE {
+    VALUES ?organizationNumber { $org_ids }
+    ?service a dcat:DataService .
+    ?record foaf:primaryTopic ?service .
+    ?record a dcat:CatalogRecord .
+    ?record dct:issued ?issued .
+    ?service dct:publisher ?publisher .
+    ?publisher dct:identifier ?organizationNumber .
+}""")
+
+    return query_template.substitute(org_ids=values_literals(organization_ids))
+
+
 def data_services_report_query() -> str:
     """Query for data services report."""
     return """
@@ -1,6 +1,9 @@
 """Module for Dataset SPARQL-queries."""
 
 from string import Template
+from typing import List
+
+from fdk_organization_bff.sparql.utils import values_literals
 
 
 def build_org_datasets_query(organization_id: str) -> str:
@@ -51,6 +54,56 @@ WHERE {{
     return query_template.substitute(org_id=organization_id)
 
 
+def build_publishers_datasets_query(organization_ids: List[str]) -> str:
+    """Build query for datasets published by any of the given organizations."""
+    query_template = Template("""
+PREFIX dct: <http://purl.org/dc/terms/>
+PREFIX foaf: <http://xmlns.com/foaf/0.1/>
+PREFIX dcat: <http://www.w3.org/ns/dcat#>
+PREFIX fdk: <https://raw.githubusercontent.com/Informasjonsforvaltning/fdk-reasoning-service/main/src/main/resources/ontology/fdk.owl#>
+
+SELECT DISTINCT ?organizationNumber ?dataset ?issued ?isAuthoritative ?isOpenData
+WHERE {
+    VALUES ?organizationNumber { $org_ids }
+    ?dataset a dcat:Dataset .
+    ?record foaf:primaryTopic ?dataset .
+    ?record a dcat:CatalogRecord .
+    ?record dct:issued ?issued .
+    OPTIONAL { ?dataset fdk:isOpenData ?isOpenData . }
+    OPTIONAL { ?dataset fdk:isAuthoritative ?isAuthoritative . }
+    ?dataset dct:publisher ?publisher .
+    ?publisher dct:identifier ?organizationNumber .
+}""")
+
+    return query_template.substitute(org_ids=values_literals(organization_ids))
+
+
+def build_nap_publishers_datasets_query(organization_ids: List[str]) -> str:
+    """Build query for NAP datasets published by any of the given organizations."""
+    query_template = Template("""
+PREFIX dct: <http://purl.org/dc/terms/>
+PREFIX foaf: <http://xmlns.com/foaf/0.1/>
+PREFIX dcat: <http://www.w3.org/ns/dcat#>
+PREFIX fdk: <https://raw.githubusercontent.com/Informasjonsforvaltning/fdk-reasoning-service/main/src/main/resources/ontology/fdk.owl#>
+
+SELECT DISTINCT ?organizationNumber ?dataset ?issued ?isAuthoritative ?isOpenData
+WHERE {
+    VALUES ?organizationNumber { $org_ids }
+    ?dataset a dcat:Dataset .
+    ?dataset fdk:isRelatedToTransportportal ?isNAP .
+    FILTER (STR(?isNAP) = "true")
+    ?record foaf:primaryTopic ?dataset .
+    ?record a dcat:CatalogRecord .
+    ?record dct:issued ?issued .
+    OPTIONAL { ?dataset fdk:isOpenData ?isOpenData . }
+    OPTIONAL { ?dataset fdk:isAuthoritative ?isAuthoritative . }
+    ?dataset dct:publisher ?publisher .
+    ?publisher dct:identifier ?organizationNumber .
+}""")
+
+    return query_template.substitute(org_ids=values_literals(organization_ids))
+
+
 def build_datasets_by_publisher_query() -> str:
     """Build query to count datasets grouped by publisher."""
     return """
@@ -129,6 +182,56 @@ WHERE {
 }"""
 
 
+def datasets_grouped_general_report_query() -> str:
+    """Query general metrics for datasets report, one row per dataset."""
+    return """
+PREFIX dcat: <http://www.w3.org/ns/dcat#>
+PREFIX foaf: <http://xmlns.com/foaf/0.1/>
+PREFIX dct: <http://purl.org/dc/terms/>
+PREFIX fdk: <https://raw.githubusercontent.com/Informasjonsforvaltning/fdk-reasoning-service/main/src/main/resources/ontology/fdk.owl#>
+SELECT ?dataset
+  (SAMPLE(?issued) AS ?firstHarvested)
+  (GROUP_CONCAT(DISTINCT STR(?theme); separator="\\n") AS ?themes)
+  (SAMPLE(?rights) AS ?accessRights)
+  (SAMPLE(?prov) AS ?provenance)
+  (SAMPLE(?openData) AS ?isOpenData)
+  (SAMPLE(?nap) AS ?transportportal)
+ WHERE {
+  ?dataset a dcat:Dataset .
+  ?record foaf:primaryTopic ?dataset .
+  ?record a dcat:CatalogRecord .
+  ?record dct:issued ?issued .
+
+  OPTIONAL { ?dataset dcat:theme ?theme . }
+  OPTIONAL { ?dataset dct:accessRights ?rights . }
+  OPTIONAL { ?dataset dct:provenance ?prov . }
+  OPTIONAL { ?dataset fdk:isOpenData ?openData . }
+  OPTIONAL { ?dataset fdk:isRelatedToTransportportal ?nap . }
+}
+GROUP BY ?dataset"""
+
+
+def datasets_grouped_format_report_query() -> str:
+    """Query format metrics for datasets report, one row per dataset."""
+    return """
+PREFIX dcat: <http://www.w3.org/ns/dcat#>
+PREFIX foaf: <http://xmlns.com/foaf/0.1/>
+PREFIX dct: <http://purl.org/dc/terms/>
+SELECT ?dataset (GROUP_CONCAT(DISTINCT STR(?formatValue); separator="\\n") AS ?formats)
+WHERE {
+  ?dataset a dcat:Dataset .
+  ?record foaf:primaryTopic ?dataset .
+  ?record a dcat:CatalogRecord .
+
+  ?dataset dcat:distribution ?distribution .
+  ?distribution dcat:mediaType ?mediaType .
+  ?distribution dct:format ?format .
+  VALUES ?formatProperty { dcat:mediaType dct:format }
+  ?distribution ?formatProperty ?formatValue .
+}
+GROUP BY ?dataset"""
+
+
 def datasets_publisher_report_query() -> str:
     """Query publisher metrics for datasets report."""
     return """
@@ -1,6 +1,9 @@
 """Module for Information Model SPARQL-queries."""
 
 from string import Template
+from typing import List
+
+from fdk_organization_bff.sparql.utils import values_literals
 
 
 def build_informationmodels_by_publisher_query() -> str:
@@ -41,6 +44,26 @@ def build_org_informationmodels_query(organization_id: str) -> str:
     """).substitute(org_id=organization_id)
 
 
+def build_publishers_informationmodels_query(organization_ids: List[str]) -> str:
+    """Build query for informationmodels published by any of the given organizations."""
+    return Template("""
+        PREFIX dct: <http://purl.org/dc/terms/>
+        PREFIX dcat: <http://www.w3.org/ns/dcat#>
+        PREFIX foaf: <http://xmlns.com/foaf/0.1/>
+        PREFIX modelldcatno: <https://data.norge.no/vocabulary/modelldcatno#>
+        SELECT DISTINCT ?organizationNumber ?informationmodel ?issued
+        WHERE {
+            VALUES ?organizationNumber { $org_ids }
+            ?informationmodel a modelldcatno:InformationModel .
+            ?record foaf:primaryTopic ?informationmodel .
+            ?record a dcat:CatalogRecord .
+            ?record dct:issued ?issued .
+            ?informationmodel dct:publisher ?publisher .
+            ?publisher dct:identifier ?organizationNumber .
+        }
+    """).substitute(org_ids=values_literals(organization_ids))
+
+
 def info_models_report_query() -> str:
     """Query for information models report."""
     return """
@@ -0,0 +1,97 @@
+"""Parsers for SPARQL TSV and CSV results.
+
+Rows are yielded in the SPARQL JSON bindings shape, {"var": {"value": ...}},
+with unbound variables left out, so gatherers work with every format. Type,
+language and datatype of values are dropped.
+"""
+
+import csv
+import io
+import re
+from typing import Dict, Iterable, Iterator, List, Optional
+
+MEDIA_TYPES = {
+    "json": "application/json",
+    "tsv": "text/tab-separated-values",
+    "csv": "text/csv",
+}
+
+_TSV_ESCAPES = re.compile(r"\\(.)")
+_TSV_ESCAPED = {"t": "\t", "n": "\n", "r": "\r", '"': '"', "'": "'", "\\": "\\"}
+_TSV_LITERAL = re.compile(r'^"(.*)"(?:@[A-Za-z0-9-]+|\^\^<[^>]*>)?$', re.DOTALL)
+
+Binding = Dict[str, Dict[str, str]]
+
+
+def _tsv_value(term: str) -> str:
+    """Return value of a TSV encoded RDF term."""
+    if term.startswith("<") and term.endswith(">"):
+        return term[1:-1]
+    literal = _TSV_LITERAL.match(term)
+    if literal:
+        return _TSV_ESCAPES.sub(
+            lambda escape: _TSV_ESCAPED.get(escape.group(1), escape.group(0)),
+            literal.group(1),
+        )
+    return term
+
+
+def tsv_variables(header: str) -> List[str]:
+    """Return variable names from TSV header line."""
+    return [variable.lstrip("?$") for variable in header.rstrip("\r\n").split("\t")]
+
+
+def tsv_row(variables: List[str], line: str) -> Optional[Binding]:
+    """Parse one TSV result line, None for blank lines."""
+    line = line.rstrip("\r\n")
+    if not line and len(variables) > 1:
+        return None
+    return {
+        variable: {"value": _tsv_value(term)}
+        for variable, term in zip(variables, line.split("\t"))
+        if term
+    }
+
+
+def parse_tsv_rows(lines: Iterable[str]) -> Iterator[Binding]:
+    """Parse TSV results line by line."""
+    variables: Optional[List[str]] = None
+    for line in lines:
+        if variables is None:
+            variables = tsv_variables(line)
+            continue
+        row = tsv_row(variables, line)
+        if row is not None:
+            yield row
+
+
+def parse_csv_rows(lines: Iterable[str]) -> Iterator[Binding]:
+    """Parse CSV results, lines must keep their line endings.
+
+    CSV can not tell an empty literal from an unbound variable, both are left
+    out of the row.
+    """
+    reader = csv.reader(lines)
+    variables = next(reader, [])
+    for values in reader:
+        if not values:
+            continue
+        yield {
+            variable: {"value": value}
+            for variable, value in zip(variables, values)
+            if value
+        }
+
+
+def parse_rows(lines: Iterable[str], result_format: str) -> Iterator[Binding]:
+    """Parse TSV or CSV results depending on result_format."""
+    if result_format == "csv":
+        return parse_csv_rows(lines)
+    return parse_tsv_rows(lines)
+
+
+def parse_result_bytes(response: bytes, result_format: str) -> List[Binding]:
+    """Parse complete TSV or CSV response."""
+    return list(
+        parse_rows(io.StringIO(response.decode("utf-8"), newline=""), result_format)
+    )
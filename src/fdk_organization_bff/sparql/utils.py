@@ -0,0 +1,9 @@
+"""Util module for building SPARQL-queries."""
+
+from typing import List
+
+
+def values_literals(values: List[str]) -> str:
+    """Format values as space separated string literals for a VALUES clause."""
+    escaped = [value.replace("\\", "\\\\").replace('"', '\\"') for value in values]
+    return " ".join(f'"{value}"' for value in escaped)
@@ -0,0 +1,42 @@
+"""Decoding of upstream json payloads, large payloads off the event loop.
+
+orjson is used when installed, otherwise the standard library decoder.
+"""
+
+import asyncio
+import json
+import time
+from typing import Any, Callable
+
+from fdk_organization_bff.config import Config
+from fdk_organization_bff.utils.metrics import metrics
+from fdk_organization_bff.utils.request_timings import timed
+
+loads: Callable[[bytes], Any]
+try:
+    import orjson
+
+    loads = orjson.loads
+    DECODER = "orjson"
+except ImportError:  # pragma: no cover
+    loads = json.loads
+    DECODER = "json"
+
+
+async def decode_json(raw: bytes, upstream: str) -> Any:
+    """Decode raw json, on the default thread pool when above the threshold."""
+    offload = len(raw) >= Config.json_decode_offload_bytes()
+    start = time.perf_counter()
+    with timed("decode"):
+        if offload:
+            result = await asyncio.get_running_loop().run_in_executor(None, loads, raw)
+        else:
+            result = loads(raw)
+    metrics.observe(
+        "upstream_decode_seconds",
+        time.perf_counter() - start,
+        upstream=upstream,
+        mode="thread" if offload else "inline",
+        decoder=DECODER,
+    )
+    return result
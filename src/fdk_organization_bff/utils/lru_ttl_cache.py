@@ -0,0 +1,141 @@
+"""Bounded LRU cache with time to live and negative caching."""
+
+import asyncio
+from collections import OrderedDict
+from dataclasses import dataclass
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Set, Tuple
+
+from fdk_organization_bff.utils.request_timings import record_cache_lookup
+from fdk_organization_bff.utils.staleness import mark_stale
+
+
+@dataclass
+class _Entry:
+    value: Any
+    stored_at: float
+    expires_at: float
+    hits: int = 0
+
+
+class LruTtlCache:
+    """Async LRU cache where empty results expire after a shorter negative ttl.
+
+    Entries hit at least refresh_min_hits times are reloaded in the background
+    once refresh_ahead of their ttl has passed, so popular keys do not expire
+    on the request path. Expired values are served stale when reloading fails.
+    """
+
+    def __init__(
+        self: "LruTtlCache",
+        max_size: int,
+        ttl: float,
+        negative_ttl: float,
+        refresh_ahead: float = 0.8,
+        refresh_min_hits: int = 3,
+        name: str = "cache",
+    ) -> None:
+        """Init empty cache, name identifies it in request timings."""
+        self.name = name
+        self._max_size = max_size
+        self._ttl = ttl
+        self._negative_ttl = negative_ttl
+        self._refresh_ahead = refresh_ahead
+        self._refresh_min_hits = refresh_min_hits
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._loading: Dict[Hashable, asyncio.Future] = dict()
+        self._refreshing: Set[asyncio.Task] = set()
+
+    def __len__(self: "LruTtlCache") -> int:
+        """Return number of cached entries."""
+        return len(self._entries)
+
+    def snapshot(self: "LruTtlCache") -> List[Tuple[Hashable, Any, float]]:
+        """Return key, value and age in seconds of entries, least recent first."""
+        now = time.monotonic()
+        return [
+            (key, entry.value, now - entry.stored_at)
+            for key, entry in self._entries.items()
+        ]
+
+    def restore(
+        self: "LruTtlCache", entries: List[Tuple[Hashable, Any, float]]
+    ) -> None:
+        """Add entries from snapshot, keeping their age and entries already loaded."""
+        now = time.monotonic()
+        for key, value, age in reversed(entries):
+            if key in self._entries:
+                continue
+            stored_at = now - age
+            ttl = self._ttl if value else self._negative_ttl
+            self._entries[key] = _Entry(
+                value=value, stored_at=stored_at, expires_at=stored_at + ttl
+            )
+            self._entries.move_to_end(key, last=False)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    async def get(
+        self: "LruTtlCache", key: Hashable, loader: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Return cached value for key, load it with loader on miss or expiry."""
+        entry = self._entries.get(key)
+        now = time.monotonic()
+        hit = entry is not None and entry.expires_at > now
+        record_cache_lookup(self.name, hit)
+        if entry is not None and hit:
+            self._entries.move_to_end(key)
+            entry.hits += 1
+            if self._should_refresh(key, entry, now):
+                task = asyncio.ensure_future(self._load(key, loader))
+                self._refreshing.add(task)
+                task.add_done_callback(self._refresh_done)
+            return entry.value
+
+        try:
+            return await self._load(key, loader)
+        except Exception:
+            if entry is None or not entry.value:
+                raise
+            logging.warning(f"Serving expired {self.name} cache entry for {key}")
+            mark_stale(self.name, now - entry.stored_at)
+            return entry.value
+
+    def _should_refresh(
+        self: "LruTtlCache", key: Hashable, entry: _Entry, now: float
+    ) -> bool:
+        return (
+            bool(entry.value)
+            and entry.hits >= self._refresh_min_hits
+            and now - entry.stored_at > self._ttl * self._refresh_ahead
+            and key not in self._loading
+        )
+
+    def _refresh_done(self: "LruTtlCache", task: asyncio.Task) -> None:
+        self._refreshing.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logging.warning(f"Background cache refresh failed: {task.exception()}")
+
+    async def _load(
+        self: "LruTtlCache", key: Hashable, loader: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        loading = self._loading.get(key)
+        if loading is None or loading.get_loop() is not asyncio.get_running_loop():
+            loading = asyncio.ensure_future(loader())
+            self._loading[key] = loading
+            loading.add_done_callback(lambda _: self._loaded(key, loading))
+        return await asyncio.shield(loading)
+
+    def _loaded(self: "LruTtlCache", key: Hashable, loading: asyncio.Future) -> None:
+        if self._loading.get(key) is loading:
+            del self._loading[key]
+        if loading.cancelled() or loading.exception() is not None:
+            return
+        value = loading.result()
+        now = time.monotonic()
+        ttl = self._ttl if value else self._negative_ttl
+        self._entries[key] = _Entry(value=value, stored_at=now, expires_at=now + ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
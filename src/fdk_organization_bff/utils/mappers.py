@@ -6,6 +6,7 @@ from typing import Dict, List, Optional
 
 from fdk_organization_bff.classes import (
     CatalogQualityScore,
+    MunicipalityLookup,
     OrganizationCatalogSummary,
     OrganizationCategory,
     OrganizationConcepts,
@@ -307,18 +308,43 @@ def categorise_summaries_by_parent_org(
     return sorted(categories, key=lambda org: org.sort_compare())
 
 
+def map_municipality_lookup(municipalities: Dict) -> MunicipalityLookup:
+    """Map fylke and kommune organizations from reference-data to MunicipalityLookup."""
+    fylker = [
+        {
+            "fylkesnummer": fylke["fylkesnummer"],
+            "organisasjonsnummer": fylke["organisasjonsnummer"],
+            "fylkesnavn": fylke["fylkesnavn"],
+        }
+        for fylke in municipalities.get("fylke") or []
+    ]
+
+    fylkesnummer_by_organization = dict()
+    for fylke in fylker:
+        fylkesnummer_by_organization[fylke["organisasjonsnummer"]] = fylke[
+            "fylkesnummer"
+        ]
+    for kommune in municipalities.get("kommune") or []:
+        fylkesnummer_by_organization[kommune["organisasjonsnummer"]] = kommune[
+            "kommunenummer"
+        ][:2]
+
+    return MunicipalityLookup(
+        fylker=fylker, fylkesnummerByOrganization=fylkesnummer_by_organization
+    )
+
+
 def categorise_summaries_by_municipality(
     summaries: List[OrganizationCatalogSummary],
-    municipalities: Dict,
+    municipalities: MunicipalityLookup,
     include_empty: bool,
 ) -> List[OrganizationCategory]:
     """Categorise summaries by municipalities."""
     categories_dict: Dict[str, OrganizationCategory] = dict()
-    categorized_organization_numbers = dict()
     filtered_summaries = (
         summaries if include_empty else remove_empty_summaries(summaries)
     )
-    for fylke in municipalities["fylke"]:
+    for fylke in municipalities.fylker:
         categories_dict[fylke["fylkesnummer"]] = OrganizationCategory(
             category=OrganizationCatalogSummary(
                 id=fylke["organisasjonsnummer"],
@@ -332,19 +358,11 @@ def categorise_summaries_by_municipality(
             ),
             organizations=list(),
         )
-        categorized_organization_numbers[fylke["organisasjonsnummer"]] = fylke[
-            "fylkesnummer"
-        ]
-
-    for kommune in municipalities["kommune"]:
-        categorized_organization_numbers[kommune["organisasjonsnummer"]] = kommune[
-            "kommunenummer"
-        ][:2]
 
     for org_summary in filtered_summaries:
         org_path_split = org_summary.orgPath.split("/")
         category_number = (
-            categorized_organization_numbers.get(org_path_split[2], "")
+            municipalities.fylkesnummerByOrganization.get(org_path_split[2], "")
             if len(org_path_split) > 2
             else ""
         )
@@ -359,7 +377,6 @@ def categorise_summaries_by_municipality(
                 org_summary.informationmodelCount
             )
             municipality_category.organizations.append(org_summary)
-            categories_dict[category_number] = municipality_category
 
     categories: List[OrganizationCategory] = list()
     for key in categories_dict:
@@ -0,0 +1,101 @@
+"""Process local metrics exposed in Prometheus text format."""
+
+from typing import Callable, Dict, Iterable, List, Tuple
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def _labels(labels: Dict[str, str]) -> Labels:
+    return tuple(sorted(labels.items()))
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    escaped = (
+        (key, value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for key, value in labels
+    )
+    return "{" + ",".join(f'{key}="{value}"' for key, value in escaped) + "}"
+
+
+class MetricsRegistry:
+    """Counters, gauges and summaries (sum and count) keyed by labels.
+
+    Gauges that mirror state held elsewhere are read from collectors when
+    the registry is exposed.
+    """
+
+    def __init__(self: "MetricsRegistry") -> None:
+        """Init empty registry."""
+        self._descriptions: Dict[str, Tuple[str, str]] = dict()
+        self._values: Dict[str, Dict[Labels, float]] = dict()
+        self._collectors: List[Callable[[], Iterable[Tuple[str, Dict, float]]]] = []
+
+    def describe(self: "MetricsRegistry", name: str, kind: str, help: str) -> None:
+        """Set type and help text of metric name."""
+        self._descriptions[name] = (kind, help)
+
+    def inc(
+        self: "MetricsRegistry", name: str, value: float = 1.0, **labels: str
+    ) -> None:
+        """Increase counter name."""
+        series = self._values.setdefault(name, dict())
+        key = _labels(labels)
+        series[key] = series.get(key, 0.0) + value
+
+    def set(self: "MetricsRegistry", name: str, value: float, **labels: str) -> None:
+        """Set gauge name."""
+        self._values.setdefault(name, dict())[_labels(labels)] = value
+
+    def observe(
+        self: "MetricsRegistry", name: str, value: float, **labels: str
+    ) -> None:
+        """Add observation to summary name."""
+        self.inc(f"{name}_sum", value, **labels)
+        self.inc(f"{name}_count", 1.0, **labels)
+
+    def value(self: "MetricsRegistry", name: str, **labels: str) -> float:
+        """Return current value of a series, 0 when not recorded."""
+        return self._values.get(name, dict()).get(_labels(labels), 0.0)
+
+    def register_collector(
+        self: "MetricsRegistry",
+        collector: Callable[[], Iterable[Tuple[str, Dict, float]]],
+    ) -> None:
+        """Add function returning (name, labels, value) gauges on exposition."""
+        self._collectors.append(collector)
+
+    def exposition(self: "MetricsRegistry") -> str:
+        """Return all metrics in Prometheus text exposition format."""
+        for collector in self._collectors:
+            for gauge, gauge_labels, value in collector():
+                self.set(gauge, value, **gauge_labels)
+
+        lines: List[str] = []
+        described = set()
+        for name in sorted(self._values):
+            base = name
+            for suffix in ("_sum", "_count"):
+                if name.endswith(suffix) and name[: -len(suffix)] in self._descriptions:
+                    base = name[: -len(suffix)]
+            if base in self._descriptions and base not in described:
+                kind, help = self._descriptions[base]
+                lines.append(f"# HELP {base} {help}")
+                lines.append(f"# TYPE {base} {kind}")
+                described.add(base)
+            for series_labels, value in self._values[name].items():
+                lines.append(f"{name}{_format_labels(series_labels)} {value:g}")
+        return "\n".join(lines) + "\n"
+
+
+metrics = MetricsRegistry()
+metrics.describe(
+    "upstream_network_seconds", "summary", "Time waiting for upstream responses."
+)
+metrics.describe(
+    "upstream_decode_seconds", "summary", "Time decoding upstream json responses."
+)
+metrics.describe(
+    "upstream_response_bytes_total", "counter", "Bytes received from upstreams."
+)
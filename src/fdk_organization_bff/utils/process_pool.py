@@ -0,0 +1,51 @@
+"""Process pool running CPU bound aggregation off the event loop."""
+
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import logging
+import multiprocessing
+from typing import Any, Callable, Optional, TypeVar
+
+from fdk_organization_bff.config import Config
+
+T = TypeVar("T")
+
+_executor: Optional[ProcessPoolExecutor] = None
+
+
+def process_pool() -> Optional[ProcessPoolExecutor]:
+    """Return the shared process pool, None when REPORT_PROCESS_WORKERS is 0."""
+    global _executor
+    if _executor is None and Config.report_process_workers() > 0:
+        _executor = ProcessPoolExecutor(
+            max_workers=Config.report_process_workers(),
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _executor
+
+
+def shutdown_process_pool() -> None:
+    """Stop the pool processes, a new pool is started on next use."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+async def run_in_process(func: Callable[..., T], *args: Any) -> T:
+    """Run func in the process pool, or inline when the pool is disabled.
+
+    func and args are pickled to the pool process, so func must be a module
+    level function and args should be compact, e.g. undecoded response bytes.
+    """
+    executor = process_pool()
+    if executor is None:
+        return func(*args)
+
+    try:
+        return await asyncio.get_running_loop().run_in_executor(executor, func, *args)
+    except BrokenProcessPool:
+        logging.warning("Process pool broken, starting a new pool on next use")
+        shutdown_process_pool()
+        raise
@@ -0,0 +1,114 @@
+"""On-demand profiling of single requests."""
+
+from collections import deque
+import cProfile
+from datetime import datetime, timezone
+import hmac
+import io
+import logging
+import pstats
+import secrets
+import time
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, TypeVar
+
+from fdk_organization_bff.config import Config
+
+T = TypeVar("T")
+
+PROFILE_HEADER = "X-Profile"
+STATS_LIMIT = 40
+
+profile_logger = logging.getLogger("fdk_organization_bff.profiling")
+
+
+class RequestProfiler:
+    """Profile requests triggered by a secret header or armed for a path.
+
+    cProfile hooks the whole thread, so a profile also contains work done by
+    other requests while the profiled request awaits upstream calls. Only one
+    request is profiled at a time.
+    """
+
+    def __init__(
+        self: "RequestProfiler", secret: Optional[str], max_results: int = 20
+    ) -> None:
+        """Init profiler, profiling is disabled without a secret."""
+        self.secret = secret
+        self._armed: Dict[str, int] = dict()
+        self._results: Deque[Dict[str, Any]] = deque(maxlen=max_results)
+        self._active = False
+
+    def authorized(self: "RequestProfiler", value: Optional[str]) -> bool:
+        """Check value against the shared secret."""
+        if not self.secret or value is None:
+            return False
+        return hmac.compare_digest(value.encode(), self.secret.encode())
+
+    def arm(self: "RequestProfiler", path: str, count: int) -> None:
+        """Profile the next count requests to path."""
+        if count > 0:
+            self._armed[path] = count
+        else:
+            self._armed.pop(path, None)
+
+    def armed(self: "RequestProfiler") -> Dict[str, int]:
+        """Return remaining profiled requests by path."""
+        return dict(self._armed)
+
+    def results(self: "RequestProfiler") -> List[Dict[str, Any]]:
+        """Return the most recent profiles, newest last."""
+        return list(self._results)
+
+    def should_profile(
+        self: "RequestProfiler", path: str, header: Optional[str]
+    ) -> bool:
+        """Check if request should be profiled, consuming an armed request."""
+        if not self.secret or self._active:
+            return False
+        if self.authorized(header):
+            return True
+        remaining = self._armed.get(path, 0)
+        if remaining > 0:
+            self.arm(path, remaining - 1)
+            return True
+        return False
+
+    async def profile(
+        self: "RequestProfiler", name: str, call: Callable[[], Awaitable[T]]
+    ) -> T:
+        """Await call with cProfile enabled and record the stats."""
+        profile = cProfile.Profile()
+        self._active = True
+        start = time.perf_counter()
+        profile.enable()
+        try:
+            return await call()
+        finally:
+            profile.disable()
+            self._active = False
+            self._record(name, profile, (time.perf_counter() - start) * 1000)
+
+    def _record(
+        self: "RequestProfiler", name: str, profile: cProfile.Profile, duration: float
+    ) -> None:
+        """Store profile stats and log them."""
+        output = io.StringIO()
+        pstats.Stats(profile, stream=output).sort_stats("cumulative").print_stats(
+            STATS_LIMIT
+        )
+        result = {
+            "id": secrets.token_hex(6),
+            "name": name,
+            "startedAt": datetime.now(timezone.utc).isoformat(),
+            "durationMs": round(duration, 3),
+            "stats": output.getvalue(),
+        }
+        self._results.append(result)
+        profile_logger.info(f"profiled {name}", extra={"profile": result})
+
+    def last_id(self: "RequestProfiler") -> Optional[str]:
+        """Return id of the most recent profile."""
+        return self._results[-1]["id"] if self._results else None
+
+
+request_profiler = RequestProfiler(Config.profiling_secret())
@@ -0,0 +1,114 @@
+"""Request scoped timing of upstream calls, mapping and serialization.
+
+Besides durations, the recorder counts result rows per upstream and cache
+hits and misses per cache, for the slow request log.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+import time
+from typing import Any, Dict, Iterator, Optional
+
+
+@dataclass
+class RequestTimings:
+    """Accumulated milliseconds and number of calls per timed step."""
+
+    durations: Dict[str, float] = field(default_factory=dict)
+    counts: Dict[str, int] = field(default_factory=dict)
+    rows: Dict[str, int] = field(default_factory=dict)
+    cache_hits: Dict[str, int] = field(default_factory=dict)
+    cache_misses: Dict[str, int] = field(default_factory=dict)
+
+    def add(self: "RequestTimings", name: str, duration_ms: float) -> None:
+        """Add duration of one call to step name."""
+        self.durations[name] = self.durations.get(name, 0.0) + duration_ms
+        self.counts[name] = self.counts.get(name, 0) + 1
+
+    def add_rows(self: "RequestTimings", name: str, rows: int) -> None:
+        """Add number of result rows returned by upstream name."""
+        self.rows[name] = self.rows.get(name, 0) + rows
+
+    def add_cache_lookup(self: "RequestTimings", name: str, hit: bool) -> None:
+        """Count a hit or miss in cache name."""
+        counter = self.cache_hits if hit else self.cache_misses
+        counter[name] = counter.get(name, 0) + 1
+
+    def to_dict(self: "RequestTimings") -> Dict[str, Any]:
+        """Return recorded timings and counters as a log friendly dict."""
+        return {
+            "timings": {
+                name: {"durationMs": round(duration, 1), "calls": self.counts[name]}
+                for name, duration in self.durations.items()
+            },
+            "rows": self.rows,
+            "cache": {
+                name: {
+                    "hits": self.cache_hits.get(name, 0),
+                    "misses": self.cache_misses.get(name, 0),
+                }
+                for name in {**self.cache_hits, **self.cache_misses}
+            },
+        }
+
+    def server_timing_header(self: "RequestTimings", total_ms: float) -> str:
+        """Format timings as Server-Timing header value."""
+        metrics = [
+            f'{name};dur={duration:.1f};desc="{self.counts[name]} calls"'
+            for name, duration in self.durations.items()
+        ]
+        metrics.append(f"total;dur={total_ms:.1f}")
+        return ", ".join(metrics)
+
+
+_request_timings: ContextVar[Optional[RequestTimings]] = ContextVar(
+    "request_timings", default=None
+)
+
+
+def start_request_timings() -> Optional[Token]:
+    """Start recording timings, None when the request is already recorded."""
+    if _request_timings.get() is not None:
+        return None
+    return _request_timings.set(RequestTimings())
+
+
+def stop_request_timings(token: Optional[Token]) -> None:
+    """Stop recording timings started with token."""
+    if token is not None:
+        _request_timings.reset(token)
+
+
+def current_request_timings() -> Optional[RequestTimings]:
+    """Return timings recorded for the current request, None when not recording."""
+    return _request_timings.get()
+
+
+@contextmanager
+def timed(name: str) -> Iterator[None]:
+    """Add time spent in block to step name when timings are recorded."""
+    timings = _request_timings.get()
+    if timings is None:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.add(name, (time.perf_counter() - start) * 1000)
+
+
+def record_rows(name: str, rows: int) -> None:
+    """Add result rows from upstream name when timings are recorded."""
+    timings = _request_timings.get()
+    if timings is not None:
+        timings.add_rows(name, rows)
+
+
+def record_cache_lookup(name: str, hit: bool) -> None:
+    """Count cache hit or miss when timings are recorded."""
+    timings = _request_timings.get()
+    if timings is not None:
+        timings.add_cache_lookup(name, hit)
@@ -0,0 +1,137 @@
+"""Last known good values served when upstreams fail.
+
+Values are stored on every successful load. When a later load fails, the
+stored value is returned instead and the current request is marked stale,
+so the staleness middleware can tell clients how old the data is.
+"""
+
+from collections import OrderedDict
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+
+from fdk_organization_bff.config import Config
+from fdk_organization_bff.utils.metrics import metrics
+
+
+@dataclass
+class Staleness:
+    """Age in seconds of stale data per source used in a response."""
+
+    ages: Dict[str, float] = field(default_factory=dict)
+
+    def add(self: "Staleness", source: str, age: float) -> None:
+        """Add stale source, keeping its oldest age."""
+        self.ages[source] = max(age, self.ages.get(source, 0.0))
+
+    @property
+    def max_age(self: "Staleness") -> float:
+        """Age of the oldest stale data, 0 when nothing is stale."""
+        return max(self.ages.values(), default=0.0)
+
+
+_staleness: ContextVar[Optional[Staleness]] = ContextVar("staleness", default=None)
+
+
+def start_staleness() -> Optional[Token]:
+    """Start recording stale sources, None when the request is already recorded."""
+    if _staleness.get() is not None:
+        return None
+    return _staleness.set(Staleness())
+
+
+def stop_staleness(token: Optional[Token]) -> None:
+    """Stop recording stale sources started with token."""
+    if token is not None:
+        _staleness.reset(token)
+
+
+def current_staleness() -> Optional[Staleness]:
+    """Return stale sources of the current request, None when not recording."""
+    return _staleness.get()
+
+
+def mark_stale(source: str, age: float) -> None:
+    """Record that data from source served in this request is age seconds old."""
+    metrics.inc("stale_responses_total", 1, source=source)
+    staleness = _staleness.get()
+    if staleness is not None:
+        staleness.add(source, age)
+
+
+class LastKnownGood:
+    """Bounded store of the last successfully loaded value per key."""
+
+    def __init__(self: "LastKnownGood", max_entries: int) -> None:
+        """Init empty store keeping at most max_entries values."""
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Tuple[Any, float]]" = OrderedDict()
+
+    def __len__(self: "LastKnownGood") -> int:
+        """Return number of stored values."""
+        return len(self._entries)
+
+    def store(self: "LastKnownGood", key: Hashable, value: Any) -> None:
+        """Store value as last known good for key."""
+        self._entries[key] = (value, time.monotonic())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def snapshot(self: "LastKnownGood") -> List[Tuple[Hashable, Any, float]]:
+        """Return key, value and age in seconds of stored values, oldest first."""
+        now = time.monotonic()
+        return [
+            (key, value, now - stored_at)
+            for key, (value, stored_at) in self._entries.items()
+        ]
+
+    def restore(
+        self: "LastKnownGood", entries: List[Tuple[Hashable, Any, float]]
+    ) -> None:
+        """Add values from snapshot, keeping their age and values already stored."""
+        now = time.monotonic()
+        for key, value, age in reversed(entries):
+            if key not in self._entries:
+                self._entries[key] = (value, now - age)
+                self._entries.move_to_end(key, last=False)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def fallback(self: "LastKnownGood", key: Hashable, source: str) -> Optional[Any]:
+        """Return last known good value for key marked stale, None if unknown."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, stored_at = entry
+        logging.warning(f"Serving last known good {source} for {key}")
+        mark_stale(source, time.monotonic() - stored_at)
+        return value
+
+    async def load(
+        self: "LastKnownGood",
+        key: Hashable,
+        source: str,
+        loader: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Load and store value, return last known good value if loader fails."""
+        try:
+            value = await loader()
+        except Exception:
+            stale = self.fallback(key, source)
+            if stale is None:
+                raise
+            return stale
+
+        self.store(key, value)
+        return value
+
+
+last_known_good = LastKnownGood(Config.last_known_good_max_entries())
+metrics.describe(
+    "stale_responses_total",
+    "counter",
+    "Times stale data was served per source because upstream failed.",
+)
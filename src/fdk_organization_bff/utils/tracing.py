@@ -0,0 +1,185 @@
+"""Request tracing with W3C trace context, exported as structured log records.
+
+Spans follow the OpenTelemetry data model (trace id, span id, parent span id,
+start and end time in unix nanos, attributes and status), so exported records
+can be ingested by an OpenTelemetry collector.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+import functools
+import json
+import logging
+import os
+import random
+import re
+import secrets
+import time
+from typing import Any, Callable, cast, Dict, Iterator, Optional, TypeVar
+
+from fdk_organization_bff.config import Config
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+span_logger = logging.getLogger("fdk_organization_bff.tracing")
+
+_TRACEPARENT = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+
+
+@dataclass
+class Span:
+    """Span with OpenTelemetry compatible identifiers and timestamps."""
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_span_id: Optional[str]
+    start_time_unix_nano: int
+    end_time_unix_nano: int = 0
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    status: str = "OK"
+
+    def traceparent(self: "Span") -> str:
+        """Return W3C traceparent header value for calls made within span."""
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+    def to_dict(self: "Span") -> Dict[str, Any]:
+        """Return span as OTLP style dict."""
+        return {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "parentSpanId": self.parent_span_id,
+            "name": self.name,
+            "startTimeUnixNano": self.start_time_unix_nano,
+            "endTimeUnixNano": self.end_time_unix_nano,
+            "durationMs": round(
+                (self.end_time_unix_nano - self.start_time_unix_nano) / 1e6, 3
+            ),
+            "attributes": self.attributes,
+            "status": self.status,
+        }
+
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+def export_span(span: Span) -> None:
+    """Export finished span as a structured log record."""
+    span_logger.info(
+        f"span {span.name}",
+        extra={"span": span.to_dict()},
+    )
+
+
+def _new_span(name: str, trace_id: str, parent_span_id: Optional[str]) -> Span:
+    return Span(
+        name=name,
+        trace_id=trace_id,
+        span_id=secrets.token_hex(8),
+        parent_span_id=parent_span_id,
+        start_time_unix_nano=time.time_ns(),
+    )
+
+
+def start_trace(
+    name: str, traceparent: Optional[str], sample_rate: float
+) -> Optional[Token]:
+    """Start root span for a request, None when the request is not sampled.
+
+    A sample_rate share of requests is traced, incoming traces included, so
+    callers can not raise the tracing load. A sampled request continues a
+    sampled incoming traceparent, otherwise it starts a new trace.
+    """
+    if random.random() >= sample_rate:  # noqa: S311
+        return None
+    match = _TRACEPARENT.match(traceparent.strip().lower()) if traceparent else None
+    if match and int(match.group(3), 16) & 1:
+        span = _new_span(name, match.group(1), match.group(2))
+    else:
+        span = _new_span(name, secrets.token_hex(16), None)
+
+    return _current_span.set(span)
+
+
+def end_trace(token: Token, **attributes: Any) -> None:
+    """End and export root span started by start_trace."""
+    span = _current_span.get()
+    _current_span.reset(token)
+    if span is not None:
+        span.attributes.update(attributes)
+        span.end_time_unix_nano = time.time_ns()
+        export_span(span)
+
+
+def current_span() -> Optional[Span]:
+    """Return the active span, None when the request is not traced."""
+    return _current_span.get()
+
+
+def trace_headers() -> Dict[str, str]:
+    """Return trace context headers to propagate to upstream calls."""
+    span = _current_span.get()
+    return {"traceparent": span.traceparent()} if span else {}
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Optional[Span]]:
+    """Record block as child span of the active span, no-op when not traced."""
+    parent = _current_span.get()
+    if parent is None:
+        yield None
+        return
+
+    child = _new_span(name, parent.trace_id, parent.span_id)
+    child.attributes.update(attributes)
+    token = _current_span.set(child)
+    try:
+        yield child
+    except BaseException as error:
+        child.status = "ERROR"
+        child.attributes["error"] = repr(error)
+        raise
+    finally:
+        _current_span.reset(token)
+        child.end_time_unix_nano = time.time_ns()
+        export_span(child)
+
+
+def traced(name: str) -> Callable[[F], F]:
+    """Decorate coroutine function to run within a span."""
+
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with span(name):
+                return await func(*args, **kwargs)
+
+        return cast(F, wrapper)
+
+    return decorator
+
+
+def configure_span_export() -> None:
+    """Send span records to file when TRACE_EXPORT_PATH is set, else to the log."""
+    path = Config.trace_export_path()
+    if path and not any(
+        isinstance(handler, logging.FileHandler)
+        and handler.baseFilename == os.path.abspath(path)
+        for handler in span_logger.handlers
+    ):
+        handler = logging.FileHandler(path)
+        handler.setFormatter(logging.Formatter("%(span_json)s"))
+        handler.addFilter(_SpanJsonFilter())
+        span_logger.addHandler(handler)
+        span_logger.propagate = False
+    span_logger.setLevel(logging.INFO)
+
+
+class _SpanJsonFilter(logging.Filter):
+    """Add span as json line to span records written to file."""
+
+    def filter(self: "_SpanJsonFilter", record: logging.LogRecord) -> bool:
+        """Filter function."""
+        record.span_json = json.dumps(getattr(record, "span", {}))
+        return True
@@ -22,6 +22,15 @@ def url_with_params(url: str, params: Optional[Dict[str, str]]) -> str:
         return url
 
 
+def split_org_path(org_path: str) -> list:
+    """Split org path into the different part blocks."""
+    parts = org_path.strip("/").split("/")
+    result = []
+    for i in range(1, len(parts) + 1):
+        result.append("/" + "/".join(parts[:i]))
+    return result
+
+
 def filter_param_to_enum(param: Optional[str]) -> FilterEnum:
     """Map filter param value to corresponding enum."""
     if param is None:
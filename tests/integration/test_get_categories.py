@@ -14,8 +14,8 @@ async def test_state_categories(client: Any, docker_service: str) -> None:
     response_json = await response.json()
 
     assert response.status == 200
-    assert len(response_json["categories"]) == 19
-    assert response_json["categories"][1]["category"]["id"] == "972417793"
+    assert len(response_json["categories"]) == 16
+    assert response_json["categories"][1]["category"]["id"] == "983887457"
     assert len(response_json["categories"][1]["organizations"]) == 0
 
 
@@ -28,9 +28,9 @@ async def test_state_categories_include_empty(client: Any, docker_service: str)
     response_json = await response.json()
 
     assert response.status == 200
-    assert len(response_json["categories"]) == 19
-    assert response_json["categories"][1]["category"]["id"] == "972417793"
-    assert len(response_json["categories"][1]["organizations"]) == 7
+    assert len(response_json["categories"]) == 16
+    assert response_json["categories"][1]["category"]["id"] == "983887457"
+    assert len(response_json["categories"][1]["organizations"]) == 5
 
 
 @pytest.mark.integration
@@ -64,4 +64,4 @@ async def test_municipality_categories_include_empty(
     assert response.status == 200
     assert len(response_json["categories"]) == 11
     assert response_json["categories"][3]["category"]["id"] == "964982953"
-    assert len(response_json["categories"][3]["organizations"]) == 2
+    assert len(response_json["categories"][3]["organizations"]) == 4
@@ -115,7 +115,21 @@ fiskeri = """{
 }"""
 
 liland = """{
-    "organization": null,
+    "organization": {
+        "organizationId": "910258028",
+        "name": "LILAND OG ERDAL REVISJON",
+        "prefLabel": {
+            "nb": "Liland og erdal revisjon"
+        },
+        "orgPath": "/ANNET/910258028",
+        "orgType": null,
+        "sectorCode": null,
+        "industryCode": null,
+        "homepage": null,
+        "seeAlso": null,
+        "numberOfEmployees": null,
+        "icon": "https://orglogo.digdir.no/api/logo/org/910258028"
+    },
     "datasets": {
         "totalCount": 19,
         "newCount": 0,
@@ -17,12 +17,19 @@ from fdk_organization_bff.service.adapter import (
     query_all_dataservices_ordered_by_publisher,
     query_all_datasets_ordered_by_publisher,
     query_all_informationmodels_ordered_by_publisher,
+    query_concepts_report,
     query_publisher_concepts,
     query_publisher_dataservices,
     query_publisher_datasets,
     query_publisher_informationmodels,
+    query_publishers_concepts,
+    query_publishers_datasets,
     query_sparql_service,
+    UpstreamResponseError,
 )
+from fdk_organization_bff.service.sparql_client import sparql_query, SparqlQueryError
+
+QUERY = sparql_query("test", "SELECT * WHERE { ?s ?p ?o }")
 
 
 @pytest.mark.unit
@@ -31,7 +38,7 @@ async def test_fetch_json_data_success() -> None:
     """Test fetch_json_data with successful response."""
     mock_response = MagicMock()
     mock_response.status = 200
-    mock_response.json = AsyncMock(return_value={"data": "test"})
+    mock_response.read = AsyncMock(return_value=b'{"data": "test"}')
 
     mock_session = MagicMock()
     mock_session.get.return_value.__aenter__.return_value = mock_response
@@ -48,7 +55,7 @@ async def test_fetch_json_data_with_params() -> None:
     """Test fetch_json_data with parameters."""
     mock_response = MagicMock()
     mock_response.status = 200
-    mock_response.json = AsyncMock(return_value={"data": "test"})
+    mock_response.read = AsyncMock(return_value=b'{"data": "test"}')
 
     mock_session = MagicMock()
     mock_session.get.return_value.__aenter__.return_value = mock_response
@@ -81,7 +88,7 @@ async def test_fetch_json_data_with_post_success() -> None:
     """Test fetch_json_data_with_post with successful response."""
     mock_response = MagicMock()
     mock_response.status = 200
-    mock_response.json = AsyncMock(return_value={"data": "test"})
+    mock_response.read = AsyncMock(return_value=b'{"data": "test"}')
 
     mock_session = MagicMock()
     mock_session.post.return_value.__aenter__.return_value = mock_response
@@ -229,6 +236,35 @@ async def test_fetch_brreg_data_none_response() -> None:
         assert result == {}
 
 
+def _brreg_session(status: int) -> MagicMock:
+    """Return session answering GET requests with status and empty body."""
+    mock_response = MagicMock()
+    mock_response.status = status
+    mock_response.read = AsyncMock(return_value=b"")
+    mock_session = MagicMock()
+    mock_session.get.return_value.__aenter__.return_value = mock_response
+    return mock_session
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status", [404, 410])
+async def test_fetch_brreg_data_not_found(status: int) -> None:
+    """Test fetch_brreg_data answers empty when organization is not found."""
+    result = await fetch_brreg_data("12345678", _brreg_session(status))
+
+    assert result == {}
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status", [429, 500, 503])
+async def test_fetch_brreg_data_error_response(status: int) -> None:
+    """Test fetch_brreg_data raises on error responses other than not found."""
+    with pytest.raises(UpstreamResponseError):
+        await fetch_brreg_data("12345678", _brreg_session(status))
+
+
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_fetch_brreg_data_list_response() -> None:
@@ -281,43 +317,54 @@ async def test_fetch_reference_data_list_response() -> None:
         assert result == {}
 
 
+def _sparql_session(status: int, body: bytes) -> MagicMock:
+    """Return session answering sparql GET requests with body."""
+    mock_response = MagicMock()
+    mock_response.status = status
+    mock_response.read = AsyncMock(return_value=body)
+    mock_session = MagicMock()
+    mock_session.get.return_value.__aenter__.return_value = mock_response
+    return mock_session
+
+
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_query_sparql_service_success() -> None:
     """Test query_sparql_service with successful response."""
-    with patch("fdk_organization_bff.service.adapter.fetch_json_data") as mock_fetch:
-        mock_fetch.return_value = {"results": {"bindings": []}}
+    mock_session = _sparql_session(200, b'{"results": {"bindings": []}}')
+    result = await query_sparql_service(QUERY, mock_session)
 
-        mock_session = MagicMock()
-        result = await query_sparql_service("SELECT * WHERE { ?s ?p ?o }", mock_session)
-
-        assert result == {"results": {"bindings": []}}
+    assert result == {"results": {"bindings": []}}
 
 
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_query_sparql_service_none_response() -> None:
-    """Test query_sparql_service with None response."""
-    with patch("fdk_organization_bff.service.adapter.fetch_json_data") as mock_fetch:
-        mock_fetch.return_value = None
+async def test_query_sparql_service_error_response() -> None:
+    """Test query_sparql_service raises when sparql answers with an error."""
+    mock_session = _sparql_session(500, b"")
 
-        mock_session = MagicMock()
-        result = await query_sparql_service("SELECT * WHERE { ?s ?p ?o }", mock_session)
+    with pytest.raises(SparqlQueryError):
+        await query_sparql_service(QUERY, mock_session)
 
-        assert result == {}
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_query_report_error_response() -> None:
+    """Test report queries raise instead of answering an empty report."""
+    mock_session = _sparql_session(500, b"")
+
+    with pytest.raises(SparqlQueryError):
+        await query_concepts_report(mock_session)
 
 
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_query_sparql_service_list_response() -> None:
     """Test query_sparql_service with list response (should return empty dict)."""
-    with patch("fdk_organization_bff.service.adapter.fetch_json_data") as mock_fetch:
-        mock_fetch.return_value = ["item1", "item2"]
+    mock_session = _sparql_session(200, b'["item1", "item2"]')
+    result = await query_sparql_service(QUERY, mock_session)
 
-        mock_session = MagicMock()
-        result = await query_sparql_service("SELECT * WHERE { ?s ?p ?o }", mock_session)
-
-        assert result == {}
+    assert result == {}
 
 
 @pytest.mark.unit
@@ -543,3 +590,69 @@ async def test_query_all_informationmodels_ordered_by_publisher_success() -> Non
         )
 
         assert result == [{"org": "12345678", "count": "1"}]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_query_publishers_datasets_groups_by_publisher() -> None:
+    """Test query_publishers_datasets groups bindings by organizationNumber."""
+    with patch(
+        "fdk_organization_bff.service.adapter.query_sparql_service"
+    ) as mock_query:
+        mock_query.return_value = {
+            "results": {
+                "bindings": [
+                    {
+                        "organizationNumber": {"value": "12345678"},
+                        "dataset": {"value": "http://example.com/dataset1"},
+                    },
+                    {
+                        "organizationNumber": {"value": "87654321"},
+                        "dataset": {"value": "http://example.com/dataset2"},
+                    },
+                    {
+                        "organizationNumber": {"value": "12345678"},
+                        "dataset": {"value": "http://example.com/dataset3"},
+                    },
+                ]
+            }
+        }
+
+        mock_session = MagicMock()
+        result = await query_publishers_datasets(
+            ["12345678", "87654321"], FilterEnum.NONE, mock_session
+        )
+
+        assert list(result.keys()) == ["12345678", "87654321"]
+        assert len(result["12345678"]) == 2
+        assert len(result["87654321"]) == 1
+        query = mock_query.call_args[0][0].text
+        assert 'VALUES ?organizationNumber { "12345678" "87654321" }' in query
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_query_publishers_concepts_nap_filter() -> None:
+    """Test query_publishers_concepts skips query for NAP filter."""
+    with patch(
+        "fdk_organization_bff.service.adapter.query_sparql_service"
+    ) as mock_query:
+        mock_session = MagicMock()
+        result = await query_publishers_concepts(
+            ["12345678"], FilterEnum.NAP, mock_session
+        )
+
+        assert result == {}
+        mock_query.assert_not_called()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_query_sparql_service_csv() -> None:
+    """Test that query_sparql_service wraps CSV rows as sparql json."""
+    mock_session = _sparql_session(200, b"count\r\n12\r\n")
+
+    with patch("fdk_organization_bff.config.Config._SPARQL_RESULT_FORMAT", "csv"):
+        result = await query_sparql_service(QUERY, mock_session)
+
+    assert result == {"results": {"bindings": [{"count": {"value": "12"}}]}}
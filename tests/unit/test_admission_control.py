@@ -0,0 +1,104 @@
+"""Unit test cases for admission control module."""
+
+import asyncio
+
+import pytest
+
+from fdk_organization_bff.service.admission_control import (
+    AdmissionLimiter,
+    UpstreamOverloadedError,
+)
+from fdk_organization_bff.utils.metrics import metrics
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_limiter_bounds_concurrency() -> None:
+    """Test that no more than the limit are admitted at once."""
+    limiter = AdmissionLimiter("test_bounds", 2, 10, 1.0)
+    running = 0
+    max_running = 0
+
+    async def call() -> None:
+        nonlocal running, max_running
+        async with limiter.admit():
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+    await asyncio.gather(*(call() for _ in range(6)))
+
+    assert max_running == 2
+    assert limiter.active == 0
+    assert limiter.queued == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_limiter_rejects_when_queue_is_full() -> None:
+    """Test that callers beyond the queue length are rejected at once."""
+    limiter = AdmissionLimiter("test_full", 1, 1, 1.0)
+    release = asyncio.Event()
+
+    async def hold() -> None:
+        async with limiter.admit():
+            await release.wait()
+
+    holder = asyncio.ensure_future(hold())
+    queued = asyncio.ensure_future(hold())
+    await asyncio.sleep(0)
+    assert limiter.queued == 1
+
+    with pytest.raises(UpstreamOverloadedError) as error:
+        async with limiter.admit():
+            pass
+    assert error.value.reason == "queue_full"
+
+    release.set()
+    await asyncio.gather(holder, queued)
+    assert limiter.active == 0
+    assert (
+        metrics.value(
+            "upstream_admission_rejected_total",
+            upstream="test_full",
+            reason="queue_full",
+        )
+        == 1
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_limiter_times_out_queued_callers() -> None:
+    """Test that queued callers give up after the queue timeout."""
+    limiter = AdmissionLimiter("test_timeout", 1, 10, 0.01)
+    release = asyncio.Event()
+
+    async def hold() -> None:
+        async with limiter.admit():
+            await release.wait()
+
+    holder = asyncio.ensure_future(hold())
+    await asyncio.sleep(0)
+
+    with pytest.raises(UpstreamOverloadedError) as error:
+        async with limiter.admit():
+            pass
+    assert error.value.reason == "queue_timeout"
+    assert limiter.queued == 0
+
+    release.set()
+    await holder
+    assert limiter.active == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_limiter_disabled() -> None:
+    """Test that concurrency 0 admits every caller."""
+    limiter = AdmissionLimiter("test_disabled", 0, 0, 0.0)
+
+    async with limiter.admit():
+        async with limiter.admit():
+            assert limiter.active == 0
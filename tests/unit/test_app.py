@@ -4,9 +4,10 @@ import os
 from unittest.mock import patch
 
 from aiohttp import web
+from aiohttp.test_utils import make_mocked_request
 import pytest
 
-from fdk_organization_bff.app import create_app, setup_routes
+from fdk_organization_bff.app import background_tasks, create_app, setup_routes
 
 
 @pytest.mark.unit
@@ -61,6 +62,25 @@ def test_setup_routes() -> None:
     assert len(app.router.routes()) > 0
 
 
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_report_timeseries_route() -> None:
+    """Test that time series route matches report types only."""
+    app = web.Application()
+    setup_routes(app)
+
+    match = await app.router.resolve(
+        make_mocked_request("GET", "/reports/data-services/timeseries")
+    )
+    unknown = await app.router.resolve(
+        make_mocked_request("GET", "/reports/all/timeseries")
+    )
+
+    assert match["type"] == "data-services"
+    assert unknown.http_exception is not None
+    assert unknown.http_exception.status == 404
+
+
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_create_app_with_routes() -> None:
@@ -73,3 +93,13 @@ async def test_create_app_with_routes() -> None:
 
         # Should have routes for ping, ready, org catalog, etc.
         assert len(routes) > 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_create_app_with_background_tasks() -> None:
+    """Test create_app registers background refresh of in-memory data."""
+    with patch.dict(os.environ, {}, clear=True):
+        app = await create_app()
+
+        assert background_tasks in app.cleanup_ctx
@@ -0,0 +1,88 @@
+"""Unit test cases for gunicorn config."""
+
+import logging
+import queue
+from unittest.mock import patch
+
+from gunicorn.config import Config
+import pytest
+
+from fdk_organization_bff.gunicorn_config import (
+    CustomGunicornLogger,
+    DroppingQueueHandler,
+)
+
+
+def log_record(message: str) -> logging.LogRecord:
+    """Create info record with message."""
+    return logging.LogRecord("test", logging.INFO, __file__, 0, message, None, None)
+
+
+@pytest.mark.unit
+def test_dropping_queue_handler_drops_when_full() -> None:
+    """Test that records are dropped instead of blocking on a full queue."""
+    log_queue: queue.Queue = queue.Queue(2)
+    handler = DroppingQueueHandler(log_queue)
+
+    for i in range(5):
+        handler.emit(log_record(f"message {i}"))
+
+    assert log_queue.qsize() == 2
+    assert handler.dropped == 3
+
+
+@pytest.mark.unit
+def test_dropping_queue_handler_reports_dropped_records() -> None:
+    """Test that dropped records are reported once the queue has room."""
+    log_queue: queue.Queue = queue.Queue(2)
+    handler = DroppingQueueHandler(log_queue)
+    handler.emit(log_record("first"))
+    handler.emit(log_record("second"))
+    handler.emit(log_record("dropped"))
+    log_queue.get_nowait()
+    log_queue.get_nowait()
+
+    handler.emit(log_record("third"))
+
+    assert log_queue.get_nowait().getMessage() == "third"
+    summary = log_queue.get_nowait()
+    assert summary.levelno == logging.WARNING
+    assert summary.getMessage() == "Dropped 1 log records, log queue was full"
+    assert handler.dropped == 0
+
+
+@pytest.mark.unit
+def test_dropping_queue_handler_leaves_formatting_to_listener() -> None:
+    """Test that records are queued unformatted."""
+    log_queue: queue.Queue = queue.Queue(1)
+    handler = DroppingQueueHandler(log_queue)
+    record = logging.LogRecord(
+        "test", logging.INFO, __file__, 0, "value %s", ("x",), None
+    )
+
+    handler.emit(record)
+
+    queued = log_queue.get_nowait()
+    assert queued.msg == "value %s"
+    assert queued.args == ("x",)
+
+
+@pytest.mark.unit
+def test_logger_setup_on_reload_replaces_listener() -> None:
+    """Test that reloading stops the previous listener and registers exit once."""
+    root_handlers = logging.getLogger().handlers[:]
+    with patch("fdk_organization_bff.gunicorn_config.atexit.register") as register:
+        logger = CustomGunicornLogger(Config())
+        first = logger.log_listener
+        logger.setup(Config())
+
+    try:
+        assert first is not None and first._thread is None
+        assert logger.log_listener is not first
+        register.assert_called_once_with(logger.stop_log_listener)
+    finally:
+        logger.stop_log_listener()
+        for handler in logging.getLogger().handlers[:]:
+            logging.getLogger().removeHandler(handler)
+        for handler in root_handlers:
+            logging.getLogger().addHandler(handler)
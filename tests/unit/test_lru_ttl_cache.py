@@ -0,0 +1,130 @@
+"""Unit test cases for LRU TTL cache module."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from fdk_organization_bff.utils.lru_ttl_cache import LruTtlCache
+from fdk_organization_bff.utils.staleness import (
+    current_staleness,
+    start_staleness,
+    stop_staleness,
+)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_caches_value() -> None:
+    """Test that a cached value is returned without calling the loader."""
+    cache = LruTtlCache(max_size=10, ttl=60, negative_ttl=10)
+    loader = AsyncMock(return_value={"navn": "Test Org"})
+
+    await cache.get("12345678", loader)
+    result = await cache.get("12345678", loader)
+
+    assert result == {"navn": "Test Org"}
+    loader.assert_called_once()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_concurrent_misses_share_load() -> None:
+    """Test that concurrent misses for the same key call the loader once."""
+    cache = LruTtlCache(max_size=10, ttl=60, negative_ttl=10)
+    loader = AsyncMock(return_value={"navn": "Test Org"})
+
+    results = await asyncio.gather(
+        cache.get("12345678", loader), cache.get("12345678", loader)
+    )
+
+    assert results == [{"navn": "Test Org"}, {"navn": "Test Org"}]
+    loader.assert_called_once()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_evicts_least_recently_used() -> None:
+    """Test that the least recently used entry is evicted when full."""
+    cache = LruTtlCache(max_size=2, ttl=60, negative_ttl=10)
+    loader = AsyncMock(return_value={"navn": "Test Org"})
+
+    await cache.get("a", loader)
+    await cache.get("b", loader)
+    await cache.get("a", loader)
+    await cache.get("c", loader)
+    await cache.get("a", loader)
+
+    assert len(cache) == 2
+    assert loader.call_count == 3
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_negative_ttl() -> None:
+    """Test that empty values expire after the negative ttl."""
+    cache = LruTtlCache(max_size=10, ttl=60, negative_ttl=10)
+    loader = AsyncMock(return_value={})
+
+    with patch("fdk_organization_bff.utils.lru_ttl_cache.time.monotonic") as now:
+        now.return_value = 100.0
+        await cache.get("12345678", loader)
+        now.return_value = 105.0
+        await cache.get("12345678", loader)
+        assert loader.call_count == 1
+
+        now.return_value = 111.0
+        await cache.get("12345678", loader)
+        assert loader.call_count == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_does_not_cache_exceptions() -> None:
+    """Test that failed loads are not cached."""
+    cache = LruTtlCache(max_size=10, ttl=60, negative_ttl=10)
+    loader = AsyncMock(side_effect=[ValueError("Network error"), {"navn": "Org"}])
+
+    with pytest.raises(ValueError):
+        await cache.get("12345678", loader)
+    result = await cache.get("12345678", loader)
+
+    assert result == {"navn": "Org"}
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_refreshes_popular_entries_ahead_of_expiry() -> None:
+    """Test that popular entries are reloaded in the background before expiry."""
+    cache = LruTtlCache(
+        max_size=10, ttl=60, negative_ttl=10, refresh_ahead=0.5, refresh_min_hits=2
+    )
+    loader = AsyncMock(side_effect=[{"navn": "Old"}, {"navn": "New"}])
+
+    with patch("fdk_organization_bff.utils.lru_ttl_cache.time.monotonic") as now:
+        now.return_value = 100.0
+        await cache.get("12345678", loader)
+        now.return_value = 140.0
+        assert await cache.get("12345678", loader) == {"navn": "Old"}
+        assert await cache.get("12345678", loader) == {"navn": "Old"}
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        assert loader.call_count == 2
+        assert await cache.get("12345678", loader) == {"navn": "New"}
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_serves_expired_value_when_reload_fails() -> None:
+    """Test that an expired value is served stale when its reload fails."""
+    cache = LruTtlCache(max_size=10, ttl=0, negative_ttl=0, name="brreg")
+    await cache.get("12345678", AsyncMock(return_value={"navn": "Test Org"}))
+    token = start_staleness()
+
+    result = await cache.get("12345678", AsyncMock(side_effect=Exception("Down")))
+
+    assert result == {"navn": "Test Org"}
+    staleness = current_staleness()
+    assert staleness is not None and "brreg" in staleness.ages
+    stop_staleness(token)
@@ -18,6 +18,7 @@ from fdk_organization_bff.utils.mappers import (
     count_list_from_sparql_response,
     empty_datasets,
     map_catalog_quality_score,
+    map_municipality_lookup,
     map_org_dataservices,
     map_org_datasets,
     map_org_details,
@@ -587,12 +588,55 @@ def test_categorise_summaries_by_municipality() -> None:
         "kommune": [],
     }
 
-    result = categorise_summaries_by_municipality([summary], municipalities, True)
+    result = categorise_summaries_by_municipality(
+        [summary], map_municipality_lookup(municipalities), True
+    )
 
     assert len(result) == 1
     assert result[0].category.id == "12345678"
 
 
+@pytest.mark.unit
+def test_map_municipality_lookup() -> None:
+    """Test map_municipality_lookup maps kommune organizations to their fylke."""
+    municipalities = {
+        "fylke": [
+            {
+                "fylkesnummer": "18",
+                "organisasjonsnummer": "964982953",
+                "fylkesnavn": "Nordland",
+                "uri": "https://data.norge.no/fylke/18",
+            }
+        ],
+        "kommune": [
+            {"kommunenummer": "1806", "organisasjonsnummer": "959469059"},
+        ],
+    }
+
+    result = map_municipality_lookup(municipalities)
+
+    assert result.fylker == [
+        {
+            "fylkesnummer": "18",
+            "organisasjonsnummer": "964982953",
+            "fylkesnavn": "Nordland",
+        }
+    ]
+    assert result.fylkesnummerByOrganization == {
+        "964982953": "18",
+        "959469059": "18",
+    }
+
+
+@pytest.mark.unit
+def test_map_municipality_lookup_missing_data() -> None:
+    """Test map_municipality_lookup without data from reference-data."""
+    result = map_municipality_lookup({"fylke": None, "kommune": None})
+
+    assert result.fylker == []
+    assert result.fylkesnummerByOrganization == {}
+
+
 @pytest.mark.unit
 def test_remove_empty_summaries() -> None:
     """Test remove_empty_summaries."""
@@ -0,0 +1,64 @@
+"""Unit test cases for metrics and json decoding."""
+
+import pytest
+from pytest_mock import MockFixture
+
+from fdk_organization_bff.utils.json_decoding import decode_json, DECODER
+from fdk_organization_bff.utils.metrics import metrics, MetricsRegistry
+
+
+@pytest.mark.unit
+def test_exposition_format() -> None:
+    """Test Prometheus text format of counters, gauges and summaries."""
+    registry = MetricsRegistry()
+    registry.describe("decode_seconds", "summary", "Decode time.")
+    registry.observe("decode_seconds", 0.5, upstream="sparql")
+    registry.observe("decode_seconds", 0.25, upstream="sparql")
+    registry.inc("bytes_total", 10, upstream='a"b')
+    registry.register_collector(lambda: [("in_use", {"pool": "sparql"}, 3)])
+
+    text = registry.exposition()
+
+    assert "# TYPE decode_seconds summary" in text
+    assert 'decode_seconds_sum{upstream="sparql"} 0.75' in text
+    assert 'decode_seconds_count{upstream="sparql"} 2' in text
+    assert 'bytes_total{upstream="a\\"b"} 10' in text
+    assert 'in_use{pool="sparql"} 3' in text
+    assert text.count("# TYPE decode_seconds") == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_decode_json_inline_and_offloaded(mocker: MockFixture) -> None:
+    """Test that payloads above the threshold are decoded on a thread."""
+    mocker.patch("fdk_organization_bff.config.Config._JSON_DECODE_OFFLOAD_BYTES", 16)
+    inline = metrics.value(
+        "upstream_decode_seconds_count",
+        upstream="test",
+        mode="inline",
+        decoder=DECODER,
+    )
+
+    assert await decode_json(b'{"a": 1}', "test") == {"a": 1}
+    assert await decode_json(b'{"results": {"bindings": []}}', "test") == {
+        "results": {"bindings": []}
+    }
+
+    assert (
+        metrics.value(
+            "upstream_decode_seconds_count",
+            upstream="test",
+            mode="inline",
+            decoder=DECODER,
+        )
+        == inline + 1
+    )
+    assert (
+        metrics.value(
+            "upstream_decode_seconds_count",
+            upstream="test",
+            mode="thread",
+            decoder=DECODER,
+        )
+        >= 1
+    )
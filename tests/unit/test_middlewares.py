@@ -0,0 +1,240 @@
+"""Unit test cases for middlewares."""
+
+import logging
+
+from aiohttp.test_utils import make_mocked_request
+from aiohttp.web import HTTPServiceUnavailable, Request, Response
+import pytest
+
+from fdk_organization_bff.middlewares import (
+    overload_middleware,
+    profiling_middleware,
+    server_timing_middleware,
+    slow_request_middleware,
+    staleness_middleware,
+    tracing_middleware,
+)
+from fdk_organization_bff.service.admission_control import UpstreamOverloadedError
+from fdk_organization_bff.service.sparql_client import SparqlQueryError
+from fdk_organization_bff.utils.profiler import RequestProfiler
+from fdk_organization_bff.utils.request_timings import (
+    record_cache_lookup,
+    record_rows,
+    timed,
+)
+from fdk_organization_bff.utils.staleness import mark_stale
+
+
+async def handler_with_upstream_call(request: Request) -> Response:
+    """Time two upstream calls and serialization."""
+    with timed("sparql"):
+        pass
+    with timed("sparql"):
+        pass
+    with timed("serialization"):
+        return Response(text="OK")
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_server_timing_middleware_adds_header() -> None:
+    """Test that sampled responses get a Server-Timing header."""
+    middleware = server_timing_middleware(1.0)
+
+    response = await middleware(
+        make_mocked_request("GET", "/organizationcatalogs"),
+        handler_with_upstream_call,
+    )
+
+    header = response.headers["Server-Timing"]
+    assert "sparql;dur=" in header
+    assert 'desc="2 calls"' in header
+    assert "serialization;dur=" in header
+    assert "total;dur=" in header
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_server_timing_middleware_not_sampled() -> None:
+    """Test that responses outside the sample have no Server-Timing header."""
+    middleware = server_timing_middleware(0.0)
+
+    response = await middleware(
+        make_mocked_request("GET", "/organizationcatalogs"),
+        handler_with_upstream_call,
+    )
+
+    assert "Server-Timing" not in response.headers
+
+
+@pytest.mark.unit
+def test_timed_without_recording() -> None:
+    """Test that timed is a no-op outside sampled requests."""
+    with timed("sparql"):
+        result = 1
+
+    assert result == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_tracing_middleware_exports_root_span(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test that sampled requests export a root span with http attributes."""
+    caplog.set_level(logging.INFO, logger="fdk_organization_bff.tracing")
+    middleware = tracing_middleware(1.0)
+
+    response = await middleware(
+        make_mocked_request("GET", "/organizationcatalogs"),
+        handler_with_upstream_call,
+    )
+
+    assert response.status == 200
+    root = caplog.records[-1].span  # type: ignore
+    assert root["attributes"]["http.status_code"] == 200
+    assert root["parentSpanId"] is None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_profiling_middleware_profiles_with_secret() -> None:
+    """Test that requests with the secret header are profiled."""
+    profiler = RequestProfiler("secret")
+    middleware = profiling_middleware(profiler)
+
+    response = await middleware(
+        make_mocked_request(
+            "GET", "/organizationcatalogs", headers={"X-Profile": "secret"}
+        ),
+        handler_with_upstream_call,
+    )
+
+    assert response.headers["X-Profile-Id"] == profiler.results()[0]["id"]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_profiling_middleware_inert_without_trigger() -> None:
+    """Test that requests without trigger are not profiled."""
+    profiler = RequestProfiler("secret")
+    middleware = profiling_middleware(profiler)
+
+    response = await middleware(
+        make_mocked_request("GET", "/organizationcatalogs"),
+        handler_with_upstream_call,
+    )
+
+    assert "X-Profile-Id" not in response.headers
+    assert profiler.results() == []
+
+
+async def handler_with_rows_and_cache(request: Request) -> Response:
+    """Record upstream rows and cache lookups."""
+    with timed("sparql"):
+        record_rows("sparql", 42)
+    record_cache_lookup("brreg", True)
+    record_cache_lookup("brreg", False)
+    return Response(text="OK")
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_slow_request_middleware_logs_breakdown(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test that requests over the threshold are logged with a breakdown."""
+    caplog.set_level(logging.WARNING, logger="fdk_organization_bff.slow_requests")
+    middleware = slow_request_middleware(0.0)
+
+    await middleware(
+        make_mocked_request("GET", "/reports/datasets?orgPath=/STAT"),
+        handler_with_rows_and_cache,
+    )
+
+    record = caplog.records[-1].slowRequest  # type: ignore
+    assert record["params"] == {"orgPath": "/STAT"}
+    assert record["status"] == 200
+    assert record["timings"]["sparql"]["calls"] == 1
+    assert record["rows"] == {"sparql": 42}
+    assert record["cache"] == {"brreg": {"hits": 1, "misses": 1}}
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_slow_request_middleware_ignores_fast_requests(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test that requests under the threshold are not logged."""
+    caplog.set_level(logging.WARNING, logger="fdk_organization_bff.slow_requests")
+    middleware = slow_request_middleware(60000.0)
+
+    await middleware(
+        make_mocked_request("GET", "/reports/datasets"),
+        handler_with_rows_and_cache,
+    )
+
+    assert caplog.records == []
+
+
+async def overloaded_handler(request: Request) -> Response:
+    """Fail as if sparql rejected the request."""
+    raise UpstreamOverloadedError("sparql", "queue_full")
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_overload_middleware_answers_service_unavailable() -> None:
+    """Test that admission rejections become 503 with Retry-After."""
+    middleware = overload_middleware(5)
+
+    with pytest.raises(HTTPServiceUnavailable) as error:
+        await middleware(
+            make_mocked_request("GET", "/reports/datasets"), overloaded_handler
+        )
+
+    assert error.value.headers["Retry-After"] == "5"
+
+
+async def failed_query_handler(request: Request) -> Response:
+    """Fail as if a report was rebuilt without anything to fall back on."""
+    raise SparqlQueryError("datasets")
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_overload_middleware_answers_failed_query_unavailable() -> None:
+    """Test that failed sparql queries become 503 with Retry-After."""
+    middleware = overload_middleware(5)
+
+    with pytest.raises(HTTPServiceUnavailable) as error:
+        await middleware(
+            make_mocked_request("GET", "/reports/datasets"), failed_query_handler
+        )
+
+    assert error.value.headers["Retry-After"] == "5"
+
+
+async def stale_handler(request: Request) -> Response:
+    """Answer with data served from last known good."""
+    mark_stale("sparql", 42.5)
+    return Response(text="OK")
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_staleness_middleware_marks_stale_responses() -> None:
+    """Test that responses built from stale data get Warning and Age headers."""
+    middleware = staleness_middleware()
+
+    response = await middleware(
+        make_mocked_request("GET", "/organizationcatalogs"), stale_handler
+    )
+    assert response.headers["Warning"] == '110 - "Response is Stale"'
+    assert response.headers["Age"] == "42"
+
+    response = await middleware(
+        make_mocked_request("GET", "/organizationcatalogs"),
+        handler_with_upstream_call,
+    )
+    assert "Warning" not in response.headers
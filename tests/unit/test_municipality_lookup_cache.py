@@ -0,0 +1,64 @@
+"""Unit test cases for municipality lookup cache module."""
+
+import os
+from unittest.mock import AsyncMock
+
+import pytest
+
+from fdk_organization_bff.service.municipality_lookup_cache import (
+    MunicipalityLookupCache,
+)
+
+municipalities = {
+    "fylke": [
+        {
+            "fylkesnummer": "18",
+            "organisasjonsnummer": "964982953",
+            "fylkesnavn": "Nordland",
+        }
+    ],
+    "kommune": [{"kommunenummer": "1806", "organisasjonsnummer": "959469059"}],
+}
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_loads_once_within_ttl() -> None:
+    """Test that reference-data is only fetched when the lookup has expired."""
+    cache = MunicipalityLookupCache(ttl=3600, path=None)
+    loader = AsyncMock(return_value=municipalities)
+
+    first = await cache.get(loader)
+    second = await cache.get(loader)
+
+    assert first is second
+    assert first.fylkesnummerByOrganization["959469059"] == "18"
+    loader.assert_called_once()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_keeps_expired_lookup_when_refresh_fails() -> None:
+    """Test that an expired lookup is kept when reference-data is unavailable."""
+    cache = MunicipalityLookupCache(ttl=0, path=None)
+    await cache.get(AsyncMock(return_value=municipalities))
+
+    result = await cache.get(AsyncMock(return_value={"fylke": None, "kommune": None}))
+
+    assert len(result.fylker) == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_reads_persisted_lookup(tmp_path: os.PathLike) -> None:
+    """Test that a persisted lookup is used by a new cache without fetching."""
+    path = os.path.join(tmp_path, "municipalities.json")
+    await MunicipalityLookupCache(ttl=3600, path=path).get(
+        AsyncMock(return_value=municipalities)
+    )
+    loader = AsyncMock(return_value={})
+
+    result = await MunicipalityLookupCache(ttl=3600, path=path).get(loader)
+
+    assert result.fylkesnummerByOrganization["964982953"] == "18"
+    loader.assert_not_called()
@@ -0,0 +1,55 @@
+"""Unit test cases for organization directory module."""
+
+from unittest.mock import patch
+
+import pytest
+
+from fdk_organization_bff.service.organization_directory import OrganizationDirectory
+
+organizations = {
+    "910244132": {"organizationId": "910244132", "orgPath": "/KOMMUNE/910244132"},
+    "971203420": {
+        "organizationId": "971203420",
+        "orgPath": "/STAT/912660680/971203420",
+    },
+    "912660680": {"organizationId": "912660680", "orgPath": "/STAT/912660680"},
+    "123456789": {"organizationId": "123456789"},
+}
+
+
+@pytest.mark.unit
+def test_organizations_by_org_path_prefix() -> None:
+    """Test lookup of organizations by orgPath prefix."""
+    directory = OrganizationDirectory()
+    directory.index(organizations)
+
+    assert set(directory.organizations("/STAT/")) == {"971203420", "912660680"}
+    assert set(directory.organizations("/STAT/912660680")) == {
+        "971203420",
+        "912660680",
+    }
+    assert set(directory.organizations("/KOMMUNE/")) == {"910244132"}
+    assert directory.organizations("/FYLKE/") == {}
+    assert len(directory.organizations(None)) == 4
+    assert directory.organization("123456789") == {"organizationId": "123456789"}
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_load_failure_keeps_directory_unloaded() -> None:
+    """Test that an empty response from organization-catalog is not indexed."""
+    directory = OrganizationDirectory()
+    with patch(
+        "fdk_organization_bff.service.organization_directory.fetch_organizations_from_organization_catalog"
+    ) as mock_fetch:
+        mock_fetch.return_value = {}
+        await directory.ensure_loaded()
+
+        assert directory.loaded_at is None
+
+        mock_fetch.return_value = organizations
+        await directory.ensure_loaded()
+
+        assert directory.loaded_at is not None
+        assert len(directory.organizations()) == 4
+        assert mock_fetch.call_count == 2
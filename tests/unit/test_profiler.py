@@ -0,0 +1,60 @@
+"""Unit test cases for on-demand request profiler."""
+
+import pytest
+
+from fdk_organization_bff.utils.profiler import RequestProfiler
+
+
+@pytest.mark.unit
+def test_profiler_without_secret_is_inert() -> None:
+    """Test that no request is profiled when no secret is configured."""
+    profiler = RequestProfiler(None)
+    profiler.arm("/organizationcatalogs", 1)
+
+    assert not profiler.authorized("")
+    assert not profiler.authorized(None)
+    assert profiler.should_profile("/organizationcatalogs", "secret") is False
+    assert profiler.should_profile("/organizationcatalogs", None) is False
+
+
+@pytest.mark.unit
+def test_profiler_secret_header() -> None:
+    """Test that requests with the secret header are profiled."""
+    profiler = RequestProfiler("secret")
+
+    assert profiler.should_profile("/organizationcatalogs", "secret")
+    assert not profiler.should_profile("/organizationcatalogs", "wrong")
+    assert not profiler.should_profile("/organizationcatalogs", None)
+
+
+@pytest.mark.unit
+def test_profiler_armed_path() -> None:
+    """Test that armed paths are profiled the requested number of times."""
+    profiler = RequestProfiler("secret")
+    profiler.arm("/reports/datasets", 2)
+
+    assert not profiler.should_profile("/reports/concepts", None)
+    assert profiler.should_profile("/reports/datasets", None)
+    assert profiler.armed() == {"/reports/datasets": 1}
+    assert profiler.should_profile("/reports/datasets", None)
+    assert profiler.armed() == {}
+    assert not profiler.should_profile("/reports/datasets", None)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_profiler_records_stats() -> None:
+    """Test that profiled calls return their result and record stats."""
+    profiler = RequestProfiler("secret", max_results=1)
+
+    async def call() -> int:
+        return sum(range(100))
+
+    assert await profiler.profile("GET /first", call) == 4950
+    assert await profiler.profile("GET /second", call) == 4950
+
+    results = profiler.results()
+    assert len(results) == 1
+    assert results[0]["name"] == "GET /second"
+    assert "function calls" in results[0]["stats"]
+    assert profiler.last_id() == results[0]["id"]
@@ -0,0 +1,138 @@
+"""Unit test cases for report aggregation engine."""
+
+from array import array
+
+import pytest
+
+from fdk_organization_bff.service.report_aggregation import (
+    aggregate,
+    dimension_columns,
+    DistinctCount,
+    FlagCount,
+    OrgPathCounts,
+    SetCounts,
+    SizePerObject,
+    ValueCounts,
+)
+from fdk_organization_bff.service.report_columns import MISSING
+
+METRICS = {
+    "https://objects/1": {
+        "orgId": "910244132",
+        "orgPath": "/STAT/972417858/910244132",
+        "formats": {"CSV"},
+        "referrers": {"https://datasets/1", "https://datasets/2"},
+        "accessRights": "PUBLIC",
+        "isOpenData": "true",
+    },
+    "https://objects/2": {
+        "orgId": "910244132",
+        "orgPath": "/STAT/972417858/910244132",
+        "formats": {"CSV", "JSON"},
+        "referrers": set(),
+        "isOpenData": "false",
+    },
+    "https://objects/3": {
+        "orgId": None,
+        "orgPath": "/STAT/974760673",
+        "formats": set(),
+        "referrers": {"https://datasets/3"},
+        "accessRights": "PUBLIC",
+    },
+}
+
+
+DIMENSIONS = [
+    DistinctCount("organizationCount", "orgId"),
+    FlagCount("opendata", "isOpenData", "true"),
+    OrgPathCounts(),
+    SetCounts("formats", "formats"),
+    SizePerObject("mostInUse", "referrers"),
+    ValueCounts("accessRights", "accessRights"),
+]
+COLUMNS = dimension_columns(METRICS, array("q", [1, MISSING, 3]), DIMENSIONS)
+
+
+@pytest.mark.unit
+def test_aggregate_missing_harvest_time_never_new() -> None:
+    """Test that objects without harvest time are not counted as new."""
+    report = aggregate(COLUMNS, range(3), [], since=-10.0)
+
+    assert report["newLastWeek"] == 2
+
+
+@pytest.mark.unit
+def test_aggregate_dimensions() -> None:
+    """Test that every dimension is aggregated from the columns."""
+    report = aggregate(COLUMNS, range(3), DIMENSIONS, since=2.0)
+
+    assert report == {
+        "totalObjects": 3,
+        "newLastWeek": 1,
+        "organizationCount": 1,
+        "opendata": 1,
+        "orgPaths": [
+            {"key": "/STAT", "count": 3},
+            {"key": "/STAT/972417858", "count": 2},
+            {"key": "/STAT/972417858/910244132", "count": 2},
+            {"key": "/STAT/974760673", "count": 1},
+        ],
+        "formats": [{"key": "CSV", "count": 2}, {"key": "JSON", "count": 1}],
+        "mostInUse": [
+            {"key": "https://objects/1", "count": 2},
+            {"key": "https://objects/3", "count": 1},
+        ],
+        "accessRights": [{"key": "PUBLIC", "count": 2}],
+    }
+
+
+@pytest.mark.unit
+def test_aggregate_selected_rows() -> None:
+    """Test that only objects in rows are aggregated."""
+    report = aggregate(
+        COLUMNS,
+        [2],
+        [DistinctCount("organizationCount", "orgId"), OrgPathCounts()],
+    )
+
+    assert report == {
+        "totalObjects": 1,
+        "newLastWeek": 0,
+        "organizationCount": 0,
+        "orgPaths": [
+            {"key": "/STAT", "count": 1},
+            {"key": "/STAT/974760673", "count": 1},
+        ],
+    }
+
+
+@pytest.mark.unit
+def test_org_path_counts_default_missing() -> None:
+    """Test that objects without orgPath are counted as /MISSING."""
+    columns = dimension_columns(
+        {"https://objects/1": {}}, array("q", [MISSING]), [OrgPathCounts()]
+    )
+    report = aggregate(columns, [0], [OrgPathCounts()])
+
+    assert report["orgPaths"] == [{"key": "/MISSING", "count": 1}]
+
+
+@pytest.mark.unit
+def test_size_per_object_ranks_top_k() -> None:
+    """Test that objects with most values come first, ties in row order."""
+    metrics = {
+        f"https://concepts/{i}": {"referrers": set(range(size))}
+        for i, size in enumerate([1, 3, 0, 2, 3])
+    }
+    dimension = SizePerObject("mostInUse", "referrers", limit=3)
+    columns = dimension_columns(metrics, array("q", [MISSING] * 5), [dimension])
+
+    top = aggregate(columns, range(5), [dimension])["mostInUse"]
+    every = SizePerObject("mostInUse", "referrers").count(columns, range(5))
+
+    assert top == [
+        {"key": "https://concepts/1", "count": 3},
+        {"key": "https://concepts/4", "count": 3},
+        {"key": "https://concepts/3", "count": 2},
+    ]
+    assert every == top + [{"key": "https://concepts/0", "count": 1}]
@@ -0,0 +1,34 @@
+"""Unit test cases for report columns."""
+
+from array import array
+
+import pytest
+
+from fdk_organization_bff.service.report_columns import encode_columns, MISSING
+
+
+@pytest.mark.unit
+def test_encode_columns() -> None:
+    """Test dictionary encoding, CSR offsets and flags."""
+    metrics = {
+        "https://datasets/1": {"accessRights": "PUBLIC", "themes": ["A", "B"]},
+        "https://datasets/2": {"isOpenData": "true", "themes": []},
+        "https://datasets/3": {"accessRights": "PUBLIC", "themes": ["B"]},
+    }
+
+    columns = encode_columns(
+        metrics,
+        array("q", [1, 2, 3]),
+        single=["accessRights"],
+        multi=["themes"],
+        flags=[("isOpenData", "true")],
+    )
+
+    assert len(columns) == 3
+    assert columns.single["accessRights"].values == ["PUBLIC"]
+    assert list(columns.single["accessRights"].codes) == [0, MISSING, 0]
+    themes = columns.multi["themes"]
+    assert themes.values == ["A", "B"]
+    assert list(themes.offsets) == [0, 2, 2, 3]
+    assert [list(themes.row_codes(row)) for row in range(3)] == [[0, 1], [], [1]]
+    assert list(columns.flags[("isOpenData", "true")]) == [0, 1, 0]
@@ -0,0 +1,612 @@
+"""Unit test cases for report service."""
+
+from dataclasses import asdict
+from datetime import datetime, timezone
+import json
+from typing import Any, Iterator
+from unittest.mock import patch
+
+import pytest
+from pytest_mock import MockFixture
+
+from fdk_organization_bff.classes import ConceptReport
+from fdk_organization_bff.service import report_service
+from fdk_organization_bff.service.report_service import (
+    _build_concept_report,
+    _build_dataset_report,
+    _build_dataset_report_snapshot,
+    _build_single_query_snapshot,
+    _node_report,
+    FacetLimits,
+    get_all_reports,
+    get_concept_report,
+    get_information_model_report,
+    get_report_timeseries,
+)
+from fdk_organization_bff.service.sparql_client import SparqlQueryError
+from fdk_organization_bff.utils.lru_ttl_cache import LruTtlCache
+from fdk_organization_bff.utils.process_pool import shutdown_process_pool
+from fdk_organization_bff.utils.staleness import LastKnownGood
+
+CONCEPTS_RESPONSE = json.dumps(
+    {
+        "results": {
+            "bindings": [
+                {
+                    "concept": {"value": "https://concepts/1"},
+                    "firstHarvested": {"value": "2020-01-01T00:00:00Z"},
+                    "orgId": {"value": "910244132"},
+                    "orgPath": {"value": "/STAT/910244132"},
+                    "referer": {"value": "https://datasets/1"},
+                },
+                {
+                    "concept": {"value": "https://concepts/1"},
+                    "firstHarvested": {"value": "2020-01-01T00:00:00Z"},
+                    "orgId": {"value": "910244132"},
+                    "orgPath": {"value": "/STAT/910244132"},
+                    "referer": {"value": "https://datasets/2"},
+                },
+                {
+                    "concept": {"value": "https://concepts/2"},
+                    "firstHarvested": {"value": "2020-01-01T00:00:00Z"},
+                    "orgId": {"value": "974760673"},
+                    "orgPath": {"value": "/STAT/974760673"},
+                },
+            ]
+        }
+    }
+).encode()
+
+
+@pytest.fixture(autouse=True)
+def empty_report_snapshots() -> Iterator[LruTtlCache]:
+    """Use empty report snapshots in each test."""
+    cache = LruTtlCache(max_size=4, ttl=60, negative_ttl=60)
+    with patch.object(report_service, "report_snapshots", cache):
+        yield cache
+
+
+@pytest.fixture(autouse=True)
+def empty_last_known_good() -> Iterator[LastKnownGood]:
+    """Use empty last known good store in each test."""
+    store = LastKnownGood(max_entries=4)
+    with patch.object(report_service, "last_known_good", store):
+        yield store
+
+
+@pytest.fixture
+def process_workers(mocker: MockFixture) -> Any:
+    """Patch number of report processes."""
+
+    def set_workers(workers: int) -> None:
+        shutdown_process_pool()
+        mocker.patch(
+            "fdk_organization_bff.config.Config._REPORT_PROCESS_WORKERS", workers
+        )
+
+    yield set_workers
+    shutdown_process_pool()
+
+
+@pytest.mark.unit
+def test_build_concept_report_from_raw_response() -> None:
+    """Test that concept report is aggregated from undecoded response."""
+    report = _build_concept_report(CONCEPTS_RESPONSE, "910244132")
+
+    assert report.totalObjects == 1
+    assert report.organizationCount == 1
+    assert report.mostInUse == [{"key": "https://concepts/1", "count": 2}]
+
+
+@pytest.mark.unit
+def test_build_concept_report_from_empty_response() -> None:
+    """Test that an empty response gives an empty report."""
+    report = _build_concept_report(b"", None)
+
+    assert report.totalObjects == 0
+    assert report.orgPaths == []
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_concept_report_inline(
+    mocker: MockFixture, process_workers: Any
+) -> None:
+    """Test that reports are aggregated inline when the pool is disabled."""
+    process_workers(0)
+    mocker.patch(
+        "fdk_organization_bff.service.report_service.query_concepts_report",
+        return_value=CONCEPTS_RESPONSE,
+    )
+
+    report = await get_concept_report(None)
+
+    assert isinstance(report, ConceptReport)
+    assert report.totalObjects == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_concept_report_in_process_pool(
+    mocker: MockFixture, process_workers: Any
+) -> None:
+    """Test that reports aggregated in the process pool are sent back."""
+    process_workers(1)
+    mocker.patch(
+        "fdk_organization_bff.service.report_service.query_concepts_report",
+        return_value=CONCEPTS_RESPONSE,
+    )
+
+    report = await get_concept_report("/STAT")
+
+    assert report == _build_concept_report(CONCEPTS_RESPONSE, "/STAT")
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_concept_report_failed_query_not_cached(
+    mocker: MockFixture, empty_report_snapshots: LruTtlCache
+) -> None:
+    """Test that no snapshot is cached from a failed query."""
+    mocker.patch(
+        "fdk_organization_bff.service.report_service.query_concepts_report",
+        side_effect=SparqlQueryError("concepts"),
+    )
+
+    with pytest.raises(SparqlQueryError):
+        await get_concept_report(None)
+
+    assert len(empty_report_snapshots) == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_concept_report_failed_query_serves_last_snapshot(
+    mocker: MockFixture,
+    empty_report_snapshots: LruTtlCache,
+    empty_last_known_good: LastKnownGood,
+) -> None:
+    """Test that the last snapshot built is kept, not the upstream response."""
+    query = mocker.patch(
+        "fdk_organization_bff.service.report_service.query_concepts_report",
+        return_value=CONCEPTS_RESPONSE,
+    )
+    report = await get_concept_report(None)
+
+    assert [value for _, value, _ in empty_last_known_good.snapshot()] == [
+        value for _, value, _ in empty_report_snapshots.snapshot()
+    ]
+
+    query.side_effect = SparqlQueryError("concepts")
+    with patch.object(
+        report_service,
+        "report_snapshots",
+        LruTtlCache(max_size=4, ttl=60, negative_ttl=60),
+    ):
+        assert await get_concept_report(None) == report
+
+
+def sparql_response(bindings: list) -> bytes:
+    """Wrap bindings in a sparql json response."""
+    return json.dumps({"results": {"bindings": bindings}}).encode()
+
+
+def value(text: str) -> dict:
+    """Create binding value."""
+    return {"value": text}
+
+
+@pytest.mark.unit
+def test_grouped_dataset_report_matches_row_report() -> None:
+    """Test that grouped and row queries give the same dataset report."""
+    general_rows = [
+        {
+            "dataset": value("https://datasets/1"),
+            "firstHarvested": value("2020-01-01T00:00:00Z"),
+            "theme": value(theme),
+            "accessRights": value("PUBLIC"),
+            "isOpenData": value("true"),
+            "transportportal": value("true"),
+        }
+        for theme in ["https://themes/A", "https://themes/B"]
+    ] + [
+        {
+            "dataset": value("https://datasets/2"),
+            "firstHarvested": value("2020-01-01T00:00:00Z"),
+        }
+    ]
+    format_rows = [
+        {
+            "dataset": value("https://datasets/1"),
+            "mediaType": value(media_type),
+            "format": value("JSON"),
+        }
+        for media_type in ["application/json", "text/csv"]
+    ]
+    publisher_rows = [
+        {
+            "dataset": value(f"https://datasets/{i}"),
+            "orgId": value("910244132"),
+            "orgPath": value("/STAT/910244132"),
+        }
+        for i in [1, 2]
+    ]
+    grouped_general = [
+        {
+            "dataset": value("https://datasets/1"),
+            "firstHarvested": value("2020-01-01T00:00:00Z"),
+            "themes": value("https://themes/A\nhttps://themes/B"),
+            "accessRights": value("PUBLIC"),
+            "isOpenData": value("true"),
+            "transportportal": value("true"),
+        },
+        {
+            "dataset": value("https://datasets/2"),
+            "firstHarvested": value("2020-01-01T00:00:00Z"),
+            "themes": value(""),
+        },
+    ]
+    grouped_formats = [
+        {
+            "dataset": value("https://datasets/1"),
+            "formats": value("application/json\nJSON\ntext/csv"),
+        }
+    ]
+
+    for theme_profile in [None, "transport"]:
+        rows = _build_dataset_report(
+            sparql_response(format_rows),
+            sparql_response(general_rows),
+            sparql_response(publisher_rows),
+            None,
+            theme_profile,
+        )
+        grouped = _build_dataset_report(
+            sparql_response(grouped_formats),
+            sparql_response(grouped_general),
+            sparql_response(publisher_rows),
+            None,
+            theme_profile,
+            True,
+        )
+
+        assert _sorted_report(grouped) == _sorted_report(rows)
+    assert rows.totalObjects == 1
+
+
+def _sorted_report(report: Any) -> dict:
+    """Return report as dict with key count lists sorted."""
+    return {
+        key: (
+            sorted(value, key=lambda item: item["key"])
+            if isinstance(value, list)
+            else value
+        )
+        for key, value in asdict(report).items()
+    }
+
+
+@pytest.mark.unit
+def test_build_concept_report_from_tsv_response() -> None:
+    """Test that TSV and JSON responses give the same concept report."""
+    tsv = (
+        "?concept\t?firstHarvested\t?referer\t?orgId\t?orgPath\n"
+        '<https://concepts/1>\t"2020-01-01T00:00:00Z"\t<https://datasets/1>'
+        '\t"910244132"\t"/STAT/910244132"\n'
+        '<https://concepts/1>\t"2020-01-01T00:00:00Z"\t<https://datasets/2>'
+        '\t"910244132"\t"/STAT/910244132"\n'
+        '<https://concepts/2>\t"2020-01-01T00:00:00Z"\t'
+        '\t"974760673"\t"/STAT/974760673"\n'
+    ).encode()
+
+    assert _build_concept_report(tsv, None, "tsv") == _build_concept_report(
+        CONCEPTS_RESPONSE, None
+    )
+
+
+DATASET_FORMATS = sparql_response(
+    [
+        {"dataset": value("https://datasets/1"), "format": value("JSON")},
+        {"dataset": value("https://datasets/3"), "format": value("CSV")},
+    ]
+)
+DATASET_GENERAL = sparql_response(
+    [
+        {
+            "dataset": value(f"https://datasets/{i}"),
+            "firstHarvested": value("2020-01-01T00:00:00Z"),
+            "accessRights": value("PUBLIC"),
+            "transportportal": value("true" if i == 1 else "false"),
+        }
+        for i in [1, 2, 3]
+    ]
+)
+DATASET_PUBLISHERS = sparql_response(
+    [
+        {
+            "dataset": value(f"https://datasets/{i}"),
+            "orgId": value(org_id),
+            "orgPath": value(org_path),
+        }
+        for i, org_id, org_path in [
+            (1, "910244132", "/STAT/972417858/910244132"),
+            (2, "974760673", "/STAT/974760673"),
+            (3, "910244132", "/STAT/972417858/910244132"),
+        ]
+    ]
+)
+
+
+SINCE = [None, datetime(2019, 12, 31, tzinfo=timezone.utc)]
+
+
+@pytest.mark.unit
+def test_dataset_snapshot_matches_aggregated_reports() -> None:
+    """Test that every snapshot node equals the report filtered on it."""
+    snapshot = _build_dataset_report_snapshot(
+        DATASET_FORMATS, DATASET_GENERAL, DATASET_PUBLISHERS
+    )
+
+    assert set(snapshot) == {
+        (profile, node)
+        for profile in [None, "transport"]
+        for node in [
+            None,
+            "/STAT",
+            "/STAT/972417858",
+            "/STAT/972417858/910244132",
+            "/STAT/974760673",
+        ]
+    }
+    for (profile, node), snapshot_node in snapshot.items():
+        for since in SINCE:
+            assert _node_report(snapshot_node, since) == _build_dataset_report(
+                DATASET_FORMATS,
+                DATASET_GENERAL,
+                DATASET_PUBLISHERS,
+                node,
+                profile,
+                new_since=since,
+            )
+    assert snapshot[(None, "/STAT/972417858")].report.totalObjects == 2
+    assert snapshot[("transport", "/STAT")].report.totalObjects == 1
+
+
+@pytest.mark.unit
+def test_concept_snapshot_matches_aggregated_reports() -> None:
+    """Test that concept snapshot nodes equal the report filtered on them."""
+    snapshot = _build_single_query_snapshot("concepts", CONCEPTS_RESPONSE)
+
+    for node, snapshot_node in snapshot.items():
+        for since in SINCE:
+            assert _node_report(snapshot_node, since) == _build_concept_report(
+                CONCEPTS_RESPONSE, node, new_since=since
+            )
+
+
+@pytest.mark.unit
+def test_snapshot_counts_new_objects_in_requested_window() -> None:
+    """Test that newLastWeek counts objects harvested after new_since."""
+    snapshot = _build_dataset_report_snapshot(
+        DATASET_FORMATS, DATASET_GENERAL, DATASET_PUBLISHERS
+    )
+    node = snapshot[(None, "/STAT/972417858")]
+
+    assert _node_report(node, None).newLastWeek == 0
+    assert (
+        _node_report(node, datetime(2019, 12, 31, tzinfo=timezone.utc)).newLastWeek == 2
+    )
+    assert (
+        _node_report(node, datetime(2020, 1, 1, tzinfo=timezone.utc)).newLastWeek == 0
+    )
+    assert node.report.newLastWeek == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_concept_report_outside_snapshot_nodes(
+    mocker: MockFixture, process_workers: Any
+) -> None:
+    """Test orgPaths that are no snapshot node."""
+    process_workers(0)
+    query = mocker.patch(
+        "fdk_organization_bff.service.report_service.query_concepts_report",
+        return_value=CONCEPTS_RESPONSE,
+    )
+
+    unknown = await get_concept_report("/KOMMUNE")
+    partial = await get_concept_report("910244132")
+
+    assert unknown.totalObjects == 0
+    assert partial == _build_concept_report(CONCEPTS_RESPONSE, "910244132")
+    assert query.call_count == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_concept_report_limits_most_in_use(
+    mocker: MockFixture, process_workers: Any
+) -> None:
+    """Test that limit cuts the ranked mostInUse of the snapshot."""
+    process_workers(0)
+    response = json.dumps(
+        {
+            "results": {
+                "bindings": [
+                    {
+                        "concept": {"value": f"https://concepts/{concept}"},
+                        "firstHarvested": {"value": "2020-01-01T00:00:00Z"},
+                        "orgId": {"value": "910244132"},
+                        "orgPath": {"value": "/STAT/910244132"},
+                        "referer": {"value": f"https://datasets/{referer}"},
+                    }
+                    for concept, referrers in [(1, 1), (2, 3), (3, 2)]
+                    for referer in range(referrers)
+                ]
+            }
+        }
+    ).encode()
+    mocker.patch(
+        "fdk_organization_bff.service.report_service.query_concepts_report",
+        return_value=response,
+    )
+
+    unlimited = await get_concept_report("/STAT")
+    limited = await get_concept_report("/STAT", limit=2)
+    partial = await get_concept_report("910244132", limit=1)
+
+    assert unlimited.mostInUse == [
+        {"key": "https://concepts/2", "count": 3},
+        {"key": "https://concepts/3", "count": 2},
+        {"key": "https://concepts/1", "count": 1},
+    ]
+    assert limited.mostInUse == unlimited.mostInUse[:2]
+    assert partial.mostInUse == unlimited.mostInUse[:1]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_all_reports(mocker: MockFixture, process_workers: Any) -> None:
+    """Test that all reports are built from cached snapshots."""
+    process_workers(0)
+    service = "fdk_organization_bff.service.report_service"
+    queries = [
+        mocker.patch(
+            f"{service}.query_concepts_report", return_value=CONCEPTS_RESPONSE
+        ),
+        mocker.patch(f"{service}.query_data_services_report", return_value=b""),
+        mocker.patch(f"{service}.query_information_models_report", return_value=b""),
+        mocker.patch(
+            f"{service}.query_format_dataset_report_metrics",
+            return_value=DATASET_FORMATS,
+        ),
+        mocker.patch(
+            f"{service}.query_general_dataset_report_metrics",
+            return_value=DATASET_GENERAL,
+        ),
+        mocker.patch(
+            f"{service}.query_publisher_dataset_report_metrics",
+            return_value=DATASET_PUBLISHERS,
+        ),
+    ]
+    mocker.patch("fdk_organization_bff.config.Config._SPARQL_RESULT_FORMAT", "json")
+    mocker.patch(
+        "fdk_organization_bff.config.Config._DATASETS_REPORT_QUERY_MODE", "rows"
+    )
+
+    await get_all_reports("/STAT", None)
+    reports = await get_all_reports("/STAT", None)
+
+    assert reports.datasets.totalObjects == 3
+    assert reports.concepts.totalObjects == 2
+    assert reports.dataServices.totalObjects == 0
+    assert reports.informationModels.totalObjects == 0
+    assert all(query.call_count == 1 for query in queries)
+
+
+INFORMATION_MODELS_RESPONSE = json.dumps(
+    {
+        "results": {
+            "bindings": [
+                {
+                    "model": {"value": f"https://models/{i}"},
+                    "firstHarvested": {"value": harvested},
+                    "orgId": {"value": org_path.rsplit("/", 1)[-1]},
+                    "orgPath": {"value": org_path},
+                }
+                for i, harvested, org_path in [
+                    (1, "2020-01-01T00:00:00Z", "/STAT/972417858/910244132"),
+                    (2, "2020-01-20T12:00:00.000Z", "/STAT/974760673"),
+                    (3, "2020-03-05T00:00:00Z", "/STAT/972417858/910244132"),
+                    (4, "2020-01-02T00:00:00Z", "/KOMMUNE/910244133"),
+                ]
+            ]
+        }
+    }
+).encode()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_report_timeseries(mocker: MockFixture, process_workers: Any) -> None:
+    """Test that time series are sliced from the report snapshot."""
+    process_workers(0)
+    query = mocker.patch(
+        "fdk_organization_bff.service.report_service.query_information_models_report",
+        return_value=INFORMATION_MODELS_RESPONSE,
+    )
+
+    monthly = await get_report_timeseries("information-models", "/STAT", "month")
+    weekly = await get_report_timeseries("information-models", "/STAT", "week")
+    every = await get_report_timeseries("information-models", None, "month")
+
+    assert monthly.series == [
+        {"key": "2020-01", "count": 2},
+        {"key": "2020-02", "count": 0},
+        {"key": "2020-03", "count": 1},
+    ]
+    assert weekly.series[:4] == [
+        {"key": "2019-12-30", "count": 1},
+        {"key": "2020-01-06", "count": 0},
+        {"key": "2020-01-13", "count": 0},
+        {"key": "2020-01-20", "count": 1},
+    ]
+    assert sum(bucket["count"] for bucket in weekly.series) == 3
+    assert every.series[0] == {"key": "2020-01", "count": 3}
+    assert query.call_count == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_report_timeseries_outside_snapshot_nodes(
+    mocker: MockFixture, process_workers: Any
+) -> None:
+    """Test that orgPaths that are no node sum their top matching nodes."""
+    process_workers(0)
+    mocker.patch(
+        "fdk_organization_bff.service.report_service.query_information_models_report",
+        return_value=INFORMATION_MODELS_RESPONSE,
+    )
+
+    partial = await get_report_timeseries("information-models", "9102441", "month")
+    unknown = await get_report_timeseries("information-models", "/UNKNOWN", "week")
+
+    assert partial.series == [
+        {"key": "2020-01", "count": 2},
+        {"key": "2020-02", "count": 0},
+        {"key": "2020-03", "count": 1},
+    ]
+    assert unknown.series == []
+    with pytest.raises(ValueError):
+        await get_report_timeseries("information-models", None, "day")
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_report_limits_facets(
+    mocker: MockFixture, process_workers: Any
+) -> None:
+    """Test that facetLimit and orgPathDepth cut the sorted facets."""
+    process_workers(0)
+    mocker.patch(
+        "fdk_organization_bff.service.report_service.query_information_models_report",
+        return_value=INFORMATION_MODELS_RESPONSE,
+    )
+
+    full = await get_information_model_report("/STAT")
+    shallow = await get_information_model_report(
+        "/STAT", facets=FacetLimits(org_path_depth=2)
+    )
+    limited = await get_information_model_report(
+        "/STAT", facets=FacetLimits(limit=2, org_path_depth=2)
+    )
+
+    assert full.orgPaths == [
+        {"key": "/STAT", "count": 3},
+        {"key": "/STAT/972417858", "count": 2},
+        {"key": "/STAT/972417858/910244132", "count": 2},
+        {"key": "/STAT/974760673", "count": 1},
+    ]
+    assert shallow.orgPaths == [full.orgPaths[0], full.orgPaths[1], full.orgPaths[3]]
+    assert limited.orgPaths == full.orgPaths[:2]
+    assert limited.totalObjects == full.totalObjects == 3
@@ -1,8 +1,25 @@
 """Unit test cases for resources module."""
 
+from datetime import datetime, timedelta, timezone
+import sys
+from unittest.mock import AsyncMock, patch
+
+from aiohttp.test_utils import make_mocked_request
 import pytest
 
+from fdk_organization_bff.resources.org_catalogs_batch import OrgCatalogsBatch
 from fdk_organization_bff.resources.ping import Ping
+from fdk_organization_bff.resources.profiling import Profiling
+from fdk_organization_bff.resources.reports import (
+    ConceptReportView,
+    ReportTimeSeriesView,
+)
+from fdk_organization_bff.resources.utils import (
+    facet_limits_param,
+    limit_param,
+    new_since_param,
+)
+from fdk_organization_bff.utils.profiler import RequestProfiler
 
 
 @pytest.mark.unit
@@ -13,3 +30,183 @@ async def test_ping_get() -> None:
 
     assert result.status == 200
     assert result.text == "OK"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_profiling_arm_path() -> None:
+    """Test that Profiling.post arms a path for authorized requests."""
+    profiler = RequestProfiler("secret")
+    request = make_mocked_request(
+        "POST", "/admin/profiling", headers={"X-Profile": "secret"}
+    )
+    request.json = AsyncMock(  # type: ignore
+        return_value={"path": "/reports/datasets", "count": 3}
+    )
+
+    with patch("fdk_organization_bff.resources.profiling.request_profiler", profiler):
+        result = await Profiling(request).post()
+
+    assert result.status == 200
+    assert profiler.armed() == {"/reports/datasets": 3}
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_profiling_requires_secret() -> None:
+    """Test that Profiling rejects requests without the secret."""
+    profiler = RequestProfiler("secret")
+    request = make_mocked_request("GET", "/admin/profiling")
+
+    with patch("fdk_organization_bff.resources.profiling.request_profiler", profiler):
+        result = await Profiling(request).get()
+
+    assert result.status == 403
+
+
+@pytest.mark.unit
+def test_new_since_param() -> None:
+    """Test parsing of newSince and windowDays query params."""
+    assert new_since_param({}) is None
+    assert new_since_param({"newSince": "2024-01-15"}) == datetime(
+        2024, 1, 15, tzinfo=timezone.utc
+    )
+    assert new_since_param({"newSince": "2024-01-15T12:00:00+01:00"}) == datetime(
+        2024, 1, 15, 11, tzinfo=timezone.utc
+    )
+    window = new_since_param({"windowDays": "30"})
+    assert window is not None
+    expected = datetime.now(timezone.utc) - timedelta(days=30)
+    assert abs((window - expected).total_seconds()) < 5
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "query",
+    [
+        {"newSince": "yesterday"},
+        {"windowDays": "-1"},
+        {"windowDays": "week"},
+        {"windowDays": "999999999"},
+        {"newSince": "2024-01-15", "windowDays": "7"},
+    ],
+)
+def test_new_since_param_invalid(query: dict) -> None:
+    """Test that invalid newSince and windowDays params raise ValueError."""
+    with pytest.raises(ValueError):
+        new_since_param(query)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_report_view_rejects_invalid_window() -> None:
+    """Test that report views respond 400 on invalid windowDays."""
+    request = make_mocked_request("GET", "/reports/concepts?windowDays=-3")
+
+    result = await ConceptReportView(request).get()
+
+    assert result.status == 400
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_concept_report_view_rejects_limit_above_most_in_use_max() -> None:
+    """Test that the concept report responds 400 on limit above the kept maximum."""
+    request = make_mocked_request("GET", "/reports/concepts?limit=101")
+
+    result = await ConceptReportView(request).get()
+
+    assert result.status == 400
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_report_view_rejects_facet_limit_above_maximum() -> None:
+    """Test that report views respond 400 on facetLimit above the maximum."""
+    request = make_mocked_request(
+        "GET", f"/reports/concepts?facetLimit={sys.maxsize + 1}"
+    )
+
+    result = await ConceptReportView(request).get()
+
+    assert result.status == 400
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_report_timeseries_view_rejects_unknown_bucket() -> None:
+    """Test that the time series view responds 400 on an unknown bucket."""
+    request = make_mocked_request(
+        "GET",
+        "/reports/concepts/timeseries?bucket=day",
+        match_info={"type": "concepts"},
+    )
+
+    with patch(
+        "fdk_organization_bff.resources.reports.get_report_timeseries"
+    ) as get_report_timeseries:
+        result = await ReportTimeSeriesView(request).get()
+
+    assert result.status == 400
+    get_report_timeseries.assert_not_called()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_org_catalogs_batch_rejects_too_many_ids() -> None:
+    """Test that too many ids are rejected before they are deduplicated."""
+    ids = ",".join(["910244132"] * 101)
+    request = make_mocked_request("GET", f"/organizationcatalogs/batch?ids={ids}")
+
+    with patch(
+        "fdk_organization_bff.resources.org_catalogs_batch.get_organization_catalogs_batch"
+    ) as get_batch:
+        result = await OrgCatalogsBatch(request).get()
+
+    assert result.status == 400
+    get_batch.assert_not_called()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_org_catalogs_batch_deduplicates_ids() -> None:
+    """Test that ids are stripped and deduplicated in request order."""
+    request = make_mocked_request("GET", "/organizationcatalogs/batch?ids=2, 1,2 ,1,3")
+
+    with patch(
+        "fdk_organization_bff.resources.org_catalogs_batch.get_organization_catalogs_batch",
+        new=AsyncMock(return_value={}),
+    ) as get_batch, patch(
+        "fdk_organization_bff.resources.org_catalogs_batch.dataclass_json_response"
+    ):
+        await OrgCatalogsBatch(request).get()
+
+    get_batch.assert_called_once()
+    assert get_batch.call_args.args[0] == ["2", "1", "3"]
+
+
+@pytest.mark.unit
+def test_limit_param() -> None:
+    """Test parsing of limit query param."""
+    assert limit_param({}) is None
+    assert limit_param({"limit": "5"}) == 5
+    for invalid in ["0", "-1", "ten", "1001", "99999999999999999999"]:
+        with pytest.raises(ValueError):
+            limit_param({"limit": invalid})
+    assert limit_param({"limit": "1000"}) == 1000
+    assert limit_param({"limit": "20"}, maximum=20) == 20
+    with pytest.raises(ValueError):
+        limit_param({"limit": "21"}, maximum=20)
+
+
+@pytest.mark.unit
+def test_facet_limits_param() -> None:
+    """Test parsing of facetLimit and orgPathDepth query params."""
+    facets = facet_limits_param({"facetLimit": "10", "orgPathDepth": "2"})
+
+    assert (facets.limit, facets.org_path_depth) == (10, 2)
+    assert facet_limits_param({}).limit is None
+    with pytest.raises(ValueError):
+        facet_limits_param({"orgPathDepth": "0"})
+    with pytest.raises(ValueError):
+        facet_limits_param({"facetLimit": str(sys.maxsize + 1)})
@@ -1,13 +1,41 @@
 """Unit test cases for service."""
 
 import asyncio
-from typing import Any
+from typing import Any, Iterator
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from fdk_organization_bff.classes import FilterEnum
 from fdk_organization_bff.service import org_catalog_service
+from fdk_organization_bff.service.adapter import UpstreamResponseError
+from fdk_organization_bff.service.organization_directory import OrganizationDirectory
+from fdk_organization_bff.utils.lru_ttl_cache import LruTtlCache
+from fdk_organization_bff.utils.staleness import LastKnownGood
+
+
+@pytest.fixture(autouse=True)
+def empty_organization_directory() -> Iterator[OrganizationDirectory]:
+    """Use an empty organization directory in each test."""
+    directory = OrganizationDirectory()
+    with patch.object(org_catalog_service, "organization_directory", directory):
+        yield directory
+
+
+@pytest.fixture(autouse=True)
+def empty_brreg_cache() -> Iterator[LruTtlCache]:
+    """Use an empty Brreg cache in each test."""
+    cache = LruTtlCache(max_size=10, ttl=60, negative_ttl=10)
+    with patch.object(org_catalog_service, "brreg_cache", cache):
+        yield cache
+
+
+@pytest.fixture(autouse=True)
+def empty_last_known_good() -> Iterator[LastKnownGood]:
+    """Use an empty last known good store in each test."""
+    store = LastKnownGood(max_entries=100)
+    with patch.object(org_catalog_service, "last_known_good", store):
+        yield store
 
 
 def async_test(coro: Any) -> Any:
@@ -305,7 +333,7 @@ async def test_get_organization_catalogs_with_exceptions(
 
     # Mock the adapter functions
     with patch(
-        "fdk_organization_bff.service.org_catalog_service.fetch_organizations_from_organization_catalog"
+        "fdk_organization_bff.service.organization_directory.fetch_organizations_from_organization_catalog"
     ) as mock_fetch_orgs:
         with patch(
             "fdk_organization_bff.service.org_catalog_service.query_all_datasets_ordered_by_publisher"
@@ -379,7 +407,7 @@ async def test_get_municipality_categories_success(mock_session: MagicMock) -> N
             "fdk_organization_bff.service.org_catalog_service.fetch_municipality_data"
         ) as mock_fetch_municipality:
             mock_summarize.return_value = []
-            mock_fetch_municipality.return_value = {"fylke": {}, "kommune": {}}
+            mock_fetch_municipality.return_value = {"fylke": [], "kommune": []}
 
             result = await org_catalog_service.get_municipality_categories(
                 FilterEnum.NONE, "true"
@@ -445,60 +473,222 @@ async def test_fetch_municipality_data_with_exceptions(mock_session: MagicMock)
         assert result["kommune"] is None
 
 
-@patch("aiohttp.ClientSession")
 @async_test
 @pytest.mark.unit
-async def test_fetch_organizations_for_org_paths_with_paths(
-    mock_session: MagicMock,
-) -> None:
+async def test_fetch_organizations_for_org_paths_with_paths() -> None:
     """Test fetch_organizations_for_org_paths with org paths."""
-    # Mock the session methods
-    mock_session_instance = MagicMock()
-    mock_session.return_value = mock_session_instance
-    mock_session_instance.__aenter__.return_value = mock_session_instance
-    mock_session_instance.__aexit__.return_value = None
-
-    # Mock the fetch_organizations_from_organization_catalog function
     with patch(
-        "fdk_organization_bff.service.org_catalog_service.fetch_organizations_from_organization_catalog"
+        "fdk_organization_bff.service.organization_directory.fetch_organizations_from_organization_catalog"
     ) as mock_fetch:
-        mock_fetch.side_effect = [
-            {"org1": {"id": "org1", "name": "Org 1"}},
-            {"org2": {"id": "org2", "name": "Org 2"}},
-        ]
+        mock_fetch.return_value = {
+            "org1": {"id": "org1", "name": "Org 1", "orgPath": "/path1/org1"},
+            "org2": {"id": "org2", "name": "Org 2", "orgPath": "/path2/org2"},
+            "org3": {"id": "org3", "name": "Org 3", "orgPath": "/path3/org3"},
+        }
 
-        org_paths = ["/path1", "/path2"]
-        result = await org_catalog_service.fetch_organizations_for_org_paths(
-            org_paths, mock_session_instance
-        )
+        org_paths = ["/path1/", "/path2/"]
+        result = await org_catalog_service.fetch_organizations_for_org_paths(org_paths)
 
         assert result is not None
         assert "org1" in result
         assert "org2" in result
+        assert "org3" not in result
+        mock_fetch.assert_called_once()
 
 
-@patch("aiohttp.ClientSession")
 @async_test
 @pytest.mark.unit
-async def test_fetch_organizations_for_org_paths_no_paths(
-    mock_session: MagicMock,
-) -> None:
+async def test_fetch_organizations_for_org_paths_no_paths() -> None:
     """Test fetch_organizations_for_org_paths with no org paths."""
-    # Mock the session methods
+    with patch(
+        "fdk_organization_bff.service.organization_directory.fetch_organizations_from_organization_catalog"
+    ) as mock_fetch:
+        mock_fetch.return_value = {"org1": {"id": "org1", "name": "Org 1"}}
+
+        result = await org_catalog_service.fetch_organizations_for_org_paths(None)
+        await org_catalog_service.fetch_organizations_for_org_paths(None)
+
+        assert result is not None
+        assert "org1" in result
+        mock_fetch.assert_called_once()
+
+
+@patch("aiohttp.ClientSession")
+@async_test
+@pytest.mark.unit
+async def test_get_organization_catalogs_batch(mock_session: MagicMock) -> None:
+    """Test get_organization_catalogs_batch returns catalogs keyed by id."""
     mock_session_instance = MagicMock()
     mock_session.return_value = mock_session_instance
     mock_session_instance.__aenter__.return_value = mock_session_instance
     mock_session_instance.__aexit__.return_value = None
 
-    # Mock the fetch_organizations_from_organization_catalog function
+    service = "fdk_organization_bff.service.org_catalog_service"
+    with patch(f"{service}.fetch_org_cat_data") as mock_fetch_org, patch(
+        f"{service}.fetch_brreg_data"
+    ) as mock_fetch_brreg, patch(
+        f"{service}.query_publishers_datasets"
+    ) as mock_datasets, patch(
+        f"{service}.query_publishers_dataservices"
+    ) as mock_dataservices, patch(
+        f"{service}.query_publishers_concepts"
+    ) as mock_concepts, patch(
+        f"{service}.query_publishers_informationmodels"
+    ) as mock_informationmodels, patch(
+        f"{service}.fetch_org_dataset_catalog_scores"
+    ) as mock_scores:
+        mock_fetch_org.side_effect = lambda id, session: (
+            {"organizationId": id, "name": "Test Org"} if id == "12345678" else {}
+        )
+        mock_fetch_brreg.side_effect = Exception("Network error")
+        mock_datasets.return_value = {
+            "12345678": [{"dataset": {"value": "http://example.com/dataset"}}]
+        }
+        mock_dataservices.return_value = {}
+        mock_concepts.side_effect = Exception("SPARQL error")
+        mock_informationmodels.return_value = {}
+        mock_scores.return_value = {}
+
+        result = await org_catalog_service.get_organization_catalogs_batch(
+            ["12345678", "87654321"], FilterEnum.NONE
+        )
+
+        assert list(result.organizations.keys()) == ["12345678", "87654321"]
+        catalog = result.organizations["12345678"]
+        assert catalog is not None
+        assert catalog.datasets.totalCount == 1
+        assert result.organizations["87654321"] is None
+        mock_datasets.assert_called_once()
+        mock_scores.assert_called_once()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_fetch_directory_org_cat_data(
+    empty_organization_directory: OrganizationDirectory,
+) -> None:
+    """Test that organizations in the directory are not fetched upstream."""
+    organization = {"organizationId": "12345678", "name": "Test Org"}
+    empty_organization_directory.index({"12345678": organization})
+    service = "fdk_organization_bff.service.org_catalog_service"
+    with patch(f"{service}.fetch_org_cat_data") as mock_fetch_org:
+        mock_fetch_org.return_value = {"organizationId": "87654321"}
+        session = MagicMock()
+
+        found = await org_catalog_service.fetch_directory_org_cat_data(
+            "12345678", session
+        )
+        missing = await org_catalog_service.fetch_directory_org_cat_data(
+            "87654321", session
+        )
+
+        assert found == organization
+        assert missing == {"organizationId": "87654321"}
+        mock_fetch_org.assert_called_once_with("87654321", session)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_fetch_cached_brreg_data_serves_expired_on_error(
+    empty_brreg_cache: LruTtlCache,
+) -> None:
+    """Test that a Brreg error response does not replace a cached value."""
+    cached = {"organisasjonsnummer": "12345678"}
+    empty_brreg_cache.restore([("12345678", cached, 120.0)])
     with patch(
-        "fdk_organization_bff.service.org_catalog_service.fetch_organizations_from_organization_catalog"
-    ) as mock_fetch:
-        mock_fetch.return_value = {"org1": {"id": "org1", "name": "Org 1"}}
+        "fdk_organization_bff.service.org_catalog_service.fetch_brreg_data",
+        side_effect=UpstreamResponseError("brreg", 503),
+    ):
+        result = await org_catalog_service.fetch_cached_brreg_data("12345678")
+
+    assert result == cached
+    assert empty_brreg_cache.snapshot()[0][1] == cached
+
+
+@async_test
+@pytest.mark.unit
+async def test_fetch_cached_brreg_data() -> None:
+    """Test that Enhetsregisteret is called once for repeated lookups."""
+    with patch(
+        "fdk_organization_bff.service.org_catalog_service.fetch_brreg_data"
+    ) as mock_fetch_brreg:
+        mock_fetch_brreg.return_value = {"organisasjonsnummer": "12345678"}
+
+        await org_catalog_service.fetch_cached_brreg_data("12345678")
+        result = await org_catalog_service.fetch_cached_brreg_data("12345678")
+
+        assert result == {"organisasjonsnummer": "12345678"}
+        mock_fetch_brreg.assert_called_once()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_organization_catalog_serves_last_known_good() -> None:
+    """Test that a catalog is served stale when sparql fails after a success."""
+    service = "fdk_organization_bff.service.org_catalog_service"
+    with patch(f"{service}.fetch_org_cat_data") as mock_fetch_org, patch(
+        f"{service}.fetch_brreg_data"
+    ) as mock_fetch_brreg, patch(
+        f"{service}.query_publisher_datasets"
+    ) as mock_datasets, patch(
+        f"{service}.query_publisher_dataservices"
+    ) as mock_dataservices, patch(
+        f"{service}.query_publisher_concepts"
+    ) as mock_concepts, patch(
+        f"{service}.query_publisher_informationmodels"
+    ) as mock_informationmodels, patch(
+        f"{service}.fetch_org_dataset_catalog_scores"
+    ) as mock_scores:
+        mock_fetch_org.return_value = {"organizationId": "12345678", "name": "Org"}
+        mock_fetch_brreg.return_value = {}
+        mock_datasets.return_value = [{"dataset": {"value": "http://ds/1"}}]
+        mock_dataservices.return_value = []
+        mock_concepts.return_value = []
+        mock_informationmodels.return_value = []
+        mock_scores.return_value = {}
 
-        result = await org_catalog_service.fetch_organizations_for_org_paths(
-            None, mock_session_instance
+        fresh = await org_catalog_service.get_organization_catalog(
+            "12345678", FilterEnum.NONE
+        )
+        mock_datasets.side_effect = Exception("SPARQL error")
+        stale = await org_catalog_service.get_organization_catalog(
+            "12345678", FilterEnum.NONE
         )
 
-        assert result is not None
-        assert "org1" in result
+    assert fresh is not None and fresh.datasets.totalCount == 1
+    assert stale == fresh
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_summaries_use_last_known_good_counts() -> None:
+    """Test that summaries keep last counts when a sparql query fails."""
+    service = "fdk_organization_bff.service.org_catalog_service"
+    counts = [{"organizationNumber": "12345678", "count": 3}]
+    with patch(f"{service}.fetch_organizations_for_org_paths") as mock_orgs, patch(
+        f"{service}.query_all_datasets_ordered_by_publisher"
+    ) as mock_datasets, patch(
+        f"{service}.query_all_dataservices_ordered_by_publisher"
+    ) as mock_dataservices, patch(
+        f"{service}.query_all_concepts_ordered_by_publisher"
+    ) as mock_concepts, patch(
+        f"{service}.query_all_informationmodels_ordered_by_publisher"
+    ) as mock_informationmodels, patch(
+        f"{service}.map_org_summaries"
+    ) as mock_map:
+        mock_orgs.return_value = {}
+        mock_datasets.return_value = counts
+        mock_dataservices.return_value = []
+        mock_concepts.return_value = []
+        mock_informationmodels.return_value = []
+        mock_map.return_value = []
+
+        await org_catalog_service.summarize_catalog_data_for_organizations(
+            FilterEnum.NONE, None, None
+        )
+        mock_datasets.side_effect = Exception("SPARQL error")
+        await org_catalog_service.summarize_catalog_data_for_organizations(
+            FilterEnum.NONE, None, None
+        )
+
+    assert mock_map.call_args.kwargs["datasets"] == counts
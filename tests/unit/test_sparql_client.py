@@ -0,0 +1,107 @@
+"""Unit test cases for sparql client module."""
+
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from fdk_organization_bff.service.sparql_client import (
+    FORM_CONTENT_TYPE,
+    sparql_query,
+    SparqlClient,
+)
+from fdk_organization_bff.utils.metrics import metrics
+
+
+def _session(body: bytes) -> MagicMock:
+    """Return session answering both GET and POST with body."""
+    mock_response = MagicMock()
+    mock_response.status = 200
+    mock_response.read = AsyncMock(return_value=body)
+    mock_session = MagicMock()
+    mock_session.get.return_value.__aenter__.return_value = mock_response
+    mock_session.post.return_value.__aenter__.return_value = mock_response
+    return mock_session
+
+
+@pytest.mark.unit
+def test_sparql_query_is_form_encoded() -> None:
+    """Test that queries are encoded once on creation."""
+    query = sparql_query("q", "SELECT ?s WHERE { ?s a <https://x/y> }")
+
+    assert query.encoded == ("query=SELECT+?s+WHERE+%7B+?s+a+%3Chttps://x/y%3E+%7D")
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_short_query_is_sent_as_get() -> None:
+    """Test that queries below threshold are sent as GET with encoded query."""
+    query = sparql_query("short", "SELECT ?s")
+    mock_session = _session(b'{"results": {"bindings": [{"s": {"value": "1"}}]}}')
+
+    result = await SparqlClient(100).bindings(query, mock_session)
+
+    assert result["results"]["bindings"] == [{"s": {"value": "1"}}]
+    mock_session.post.assert_not_called()
+    assert mock_session.get.call_args.args[0].endswith("/sparql?query=SELECT+?s")
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_long_query_is_sent_as_form_post() -> None:
+    """Test that queries above threshold are posted form encoded."""
+    query = sparql_query("long", "SELECT ?s WHERE { ?s ?p ?o }")
+    mock_session = _session(b"counted")
+
+    result = await SparqlClient(10).raw(query, mock_session)
+
+    assert result == b"counted"
+    mock_session.get.assert_not_called()
+    kwargs = mock_session.post.call_args.kwargs
+    assert kwargs["data"] == query.encoded
+    assert kwargs["headers"]["Content-Type"] == FORM_CONTENT_TYPE
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_query_stats_are_recorded() -> None:
+    """Test that time and rows are recorded per query name."""
+    query = sparql_query("stats_test", "SELECT ?s")
+    mock_session = _session(b'{"results": {"bindings": [{}, {}]}}')
+    rows_before = metrics.value("sparql_query_rows_total", query="stats_test")
+
+    await SparqlClient(100).bindings(query, mock_session)
+
+    rows = metrics.value("sparql_query_rows_total", query="stats_test")
+    assert rows == rows_before + 2
+    assert 'sparql_query_seconds_count{query="stats_test"}' in metrics.exposition()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_tsv_rows_are_streamed() -> None:
+    """Test that TSV results split over chunks are parsed line by line."""
+
+    async def chunks() -> Any:
+        yield b"?organizationNumber\t?count\n<https://org"
+        yield b's/1>\t"3"\n'
+        yield b'<https://orgs/2>\t"4"'
+
+    mock_response = MagicMock()
+    mock_response.status = 200
+    mock_response.content.iter_chunked.return_value = chunks()
+    mock_session = MagicMock()
+    mock_session.get.return_value.__aenter__.return_value = mock_response
+
+    result = await SparqlClient(100).bindings(
+        sparql_query("tsv", "SELECT"), mock_session, "tsv"
+    )
+
+    assert result["results"]["bindings"] == [
+        {"organizationNumber": {"value": "https://orgs/1"}, "count": {"value": "3"}},
+        {"organizationNumber": {"value": "https://orgs/2"}, "count": {"value": "4"}},
+    ]
+    assert (
+        mock_session.get.call_args.kwargs["headers"]["Accept"]
+        == "text/tab-separated-values"
+    )
@@ -0,0 +1,69 @@
+"""Unit test cases for sparql TSV and CSV result parsing."""
+
+import pytest
+
+from fdk_organization_bff.sparql.results import (
+    parse_csv_rows,
+    parse_result_bytes,
+    parse_tsv_rows,
+)
+
+
+@pytest.mark.unit
+def test_parse_tsv_rows() -> None:
+    """Test that TSV terms are parsed to binding values."""
+    lines = [
+        "?concept\t?firstHarvested\t?referer\t?count\n",
+        '<https://concepts/1>\t"2020-01-01T00:00:00Z"^^<http://www.w3.org/2001/XMLSchema#dateTime>\t\t5\n',
+        '<https://concepts/2>\t"tab\\there\\nline"@nb\t<https://datasets/1>\t"7"\n',
+    ]
+
+    rows = list(parse_tsv_rows(lines))
+
+    assert rows == [
+        {
+            "concept": {"value": "https://concepts/1"},
+            "firstHarvested": {"value": "2020-01-01T00:00:00Z"},
+            "count": {"value": "5"},
+        },
+        {
+            "concept": {"value": "https://concepts/2"},
+            "firstHarvested": {"value": "tab\there\nline"},
+            "referer": {"value": "https://datasets/1"},
+            "count": {"value": "7"},
+        },
+    ]
+
+
+@pytest.mark.unit
+def test_parse_csv_rows_with_multiline_value() -> None:
+    """Test that CSV values spanning lines are parsed as one row."""
+    lines = [
+        "dataset,themes\r\n",
+        'https://datasets/1,"https://themes/A\n',
+        'https://themes/B"\r\n',
+        "https://datasets/2,\r\n",
+    ]
+
+    rows = list(parse_csv_rows(lines))
+
+    assert rows == [
+        {
+            "dataset": {"value": "https://datasets/1"},
+            "themes": {"value": "https://themes/A\nhttps://themes/B"},
+        },
+        {"dataset": {"value": "https://datasets/2"}},
+    ]
+
+
+@pytest.mark.unit
+def test_parse_result_bytes() -> None:
+    """Test parsing complete responses in both formats."""
+    tsv = b'?orgId\n"910244132"\n"974760673"\n'
+    csv = b"orgId\r\n910244132\r\n974760673\r\n"
+
+    assert parse_result_bytes(tsv, "tsv") == parse_result_bytes(csv, "csv")
+    assert parse_result_bytes(tsv, "tsv") == [
+        {"orgId": {"value": "910244132"}},
+        {"orgId": {"value": "974760673"}},
+    ]
@@ -0,0 +1,54 @@
+"""Unit test cases for staleness module."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from fdk_organization_bff.utils.staleness import (
+    current_staleness,
+    LastKnownGood,
+    start_staleness,
+    stop_staleness,
+)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_load_stores_and_falls_back() -> None:
+    """Test that a failing load returns the last known good value marked stale."""
+    store = LastKnownGood(max_entries=10)
+    token = start_staleness()
+
+    assert await store.load("key", "sparql", AsyncMock(return_value=[1, 2])) == [1, 2]
+    staleness = current_staleness()
+    assert staleness is not None and staleness.ages == {}
+
+    failing = AsyncMock(side_effect=Exception("SPARQL error"))
+    assert await store.load("key", "sparql", failing) == [1, 2]
+    assert "sparql" in staleness.ages
+
+    stop_staleness(token)
+    assert current_staleness() is None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_load_raises_without_last_known_good() -> None:
+    """Test that failures are raised when nothing was stored."""
+    store = LastKnownGood(max_entries=10)
+
+    with pytest.raises(ValueError):
+        await store.load("key", "sparql", AsyncMock(side_effect=ValueError()))
+
+
+@pytest.mark.unit
+def test_store_is_bounded() -> None:
+    """Test that the oldest stored values are dropped when full."""
+    store = LastKnownGood(max_entries=2)
+    store.store("a", 1)
+    store.store("b", 2)
+    store.store("c", 3)
+
+    assert len(store) == 2
+    assert store.fallback("a", "sparql") is None
+    assert store.fallback("c", "sparql") == 3
@@ -0,0 +1,108 @@
+"""Unit test cases for tracing."""
+
+import logging
+from pathlib import Path
+
+import pytest
+from pytest_mock import MockFixture
+
+from fdk_organization_bff.utils.tracing import (
+    configure_span_export,
+    current_span,
+    end_trace,
+    span,
+    span_logger,
+    start_trace,
+    trace_headers,
+    traced,
+)
+
+TRACE_ID = "4bf92f3577b34da6a3ce929d0e0e4736"
+PARENT_ID = "00f067aa0ba902b7"
+
+
+@pytest.mark.unit
+def test_start_trace_continues_sampled_traceparent() -> None:
+    """Test that a sampled incoming traceparent is continued."""
+    token = start_trace("GET /", f"00-{TRACE_ID}-{PARENT_ID}-01", 1.0)
+    assert token is not None
+    root = current_span()
+    assert root is not None
+    assert root.trace_id == TRACE_ID
+    assert root.parent_span_id == PARENT_ID
+    end_trace(token)
+
+    assert current_span() is None
+
+
+@pytest.mark.unit
+def test_start_trace_new_trace_for_unsampled_traceparent() -> None:
+    """Test that a sampled request with unsampled traceparent starts a new trace."""
+    token = start_trace("GET /", f"00-{TRACE_ID}-{PARENT_ID}-00", 1.0)
+    assert token is not None
+    root = current_span()
+    assert root is not None
+    assert root.trace_id != TRACE_ID
+    assert root.parent_span_id is None
+    end_trace(token)
+
+
+@pytest.mark.unit
+def test_start_trace_not_sampled() -> None:
+    """Test that unsampled requests are not traced."""
+    assert start_trace("GET /", f"00-{TRACE_ID}-{PARENT_ID}-00", 0.0) is None
+    assert start_trace("GET /", f"00-{TRACE_ID}-{PARENT_ID}-01", 0.0) is None
+    assert start_trace("GET /", "invalid", 0.0) is None
+    assert trace_headers() == {}
+
+
+@pytest.mark.unit
+def test_child_span_propagates_traceparent(caplog: pytest.LogCaptureFixture) -> None:
+    """Test that child spans link to the root span and are exported."""
+    caplog.set_level(logging.INFO, logger="fdk_organization_bff.tracing")
+    token = start_trace("GET /", None, 1.0)
+    assert token is not None
+    root = current_span()
+    assert root is not None
+
+    with span("sparql POST", **{"http.url": "http://sparql"}) as child:
+        assert child is not None
+        assert child.parent_span_id == root.span_id
+        assert trace_headers() == {
+            "traceparent": f"00-{root.trace_id}-{child.span_id}-01"
+        }
+    end_trace(token, **{"http.status_code": 200})
+
+    exported = [record.span for record in caplog.records]  # type: ignore
+    assert [s["name"] for s in exported] == ["sparql POST", "GET /"]
+    assert exported[1]["attributes"]["http.status_code"] == 200
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_traced_without_trace() -> None:
+    """Test that traced functions run unchanged outside traced requests."""
+
+    @traced("work")
+    async def work() -> int:
+        assert current_span() is None
+        return 1
+
+    assert await work() == 1
+
+
+@pytest.mark.unit
+def test_configure_span_export_adds_file_handler_once(
+    mocker: MockFixture, tmp_path: Path
+) -> None:
+    """Test that repeated configuration keeps one file handler per path."""
+    path = str(tmp_path / "spans.jsonl")
+    mocker.patch("fdk_organization_bff.config.Config._TRACE_EXPORT_PATH", path)
+    mocker.patch.object(span_logger, "handlers", [])
+    mocker.patch.object(span_logger, "propagate", True)
+
+    configure_span_export()
+    configure_span_export()
+
+    assert len(span_logger.handlers) == 1
+    span_logger.handlers[0].close()
@@ -0,0 +1,59 @@
+"""Unit test cases for per upstream connection pools."""
+
+from aiohttp import TCPConnector
+import pytest
+
+from fdk_organization_bff.classes import UpstreamEnum
+from fdk_organization_bff.service.upstream_pools import UpstreamPools
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_upstream_pools_have_separate_connectors() -> None:
+    """Test that each upstream gets its own connector with configured limit."""
+    pools = UpstreamPools()
+    pools.start()
+
+    sparql = pools.session(UpstreamEnum.SPARQL)
+    brreg = pools.session(UpstreamEnum.BRREG)
+    assert sparql is not None and brreg is not None
+    assert sparql.connector is not brreg.connector
+    assert isinstance(sparql.connector, TCPConnector)
+    assert sparql.connector.limit == 30
+    assert brreg.connector is not None and brreg.connector.limit == 10
+
+    saturation = {
+        (name, labels["upstream"]): value for name, labels, value in pools.saturation()
+    }
+    assert saturation[("upstream_pool_limit", "sparql")] == 30
+    assert saturation[("upstream_pool_in_use", "brreg")] == 0
+
+    await pools.close()
+    assert pools.session(UpstreamEnum.SPARQL) is None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_upstream_pools_not_started() -> None:
+    """Test that callers fall back to their own session before start."""
+    pools = UpstreamPools()
+
+    assert pools.session(UpstreamEnum.SPARQL) is None
+    assert pools.session(None) is None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_upstream_pools_client_session() -> None:
+    """Test that no session is opened per request while pools are started."""
+    pools = UpstreamPools()
+    async with pools.client_session() as session:
+        assert session is not pools.session(UpstreamEnum.SPARQL)
+    assert session.closed
+
+    pools.start()
+    async with pools.client_session() as session:
+        assert session is pools.session(UpstreamEnum.SPARQL)
+    assert not session.closed
+
+    await pools.close()
@@ -0,0 +1,97 @@
+"""Unit test cases for warm snapshot module."""
+
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Tuple
+from unittest.mock import patch
+
+import pytest
+
+from fdk_organization_bff.classes import FilterEnum, MunicipalityLookup
+from fdk_organization_bff.service import warm_snapshot
+from fdk_organization_bff.service.municipality_lookup_cache import (
+    MunicipalityLookupCache,
+)
+from fdk_organization_bff.service.organization_directory import OrganizationDirectory
+from fdk_organization_bff.utils.lru_ttl_cache import LruTtlCache
+from fdk_organization_bff.utils.staleness import LastKnownGood
+
+State = Tuple[
+    OrganizationDirectory, MunicipalityLookupCache, LruTtlCache, LastKnownGood
+]
+
+
+def _empty_state() -> State:
+    return (
+        OrganizationDirectory(),
+        MunicipalityLookupCache(ttl=60, path=None),
+        LruTtlCache(max_size=10, ttl=60, negative_ttl=10, name="brreg"),
+        LastKnownGood(max_entries=10),
+    )
+
+
+@contextmanager
+def _use_state(state: State) -> Iterator[None]:
+    directory, municipalities, brreg, store = state
+    with patch.object(
+        warm_snapshot,
+        "report_snapshots",
+        LruTtlCache(max_size=4, ttl=60, negative_ttl=60),
+    ), patch.object(warm_snapshot, "organization_directory", directory), patch.object(
+        warm_snapshot, "municipality_lookup_cache", municipalities
+    ), patch.object(
+        warm_snapshot, "brreg_cache", brreg
+    ), patch.object(
+        warm_snapshot, "last_known_good", store
+    ):
+        yield
+
+
+@pytest.fixture
+def saved_snapshot(tmp_path: Path) -> Iterator[str]:
+    """Save a snapshot of populated state and return its path."""
+    directory, municipalities, brreg, store = state = _empty_state()
+    directory.index({"123": {"organizationId": "123", "orgPath": "/STAT/123"}})
+    municipalities.restore(
+        MunicipalityLookup(fylker=[], fylkesnummerByOrganization={"9": "03"}), 1.0
+    )
+    brreg.restore([("123", {"navn": "Org"}, 5.0)])
+    store.store(("datasets_by_publisher", FilterEnum.NONE), [{"count": 3}])
+
+    path = str(tmp_path / "warm.snapshot")
+    with _use_state(state):
+        warm_snapshot.write_snapshot(path, warm_snapshot.collect_snapshot())
+    yield path
+
+
+@pytest.mark.unit
+def test_snapshot_round_trip(saved_snapshot: str) -> None:
+    """Test that a saved snapshot restores warm state in a new process."""
+    directory, municipalities, brreg, store = state = _empty_state()
+
+    with _use_state(state):
+        assert warm_snapshot.load_snapshot(saved_snapshot)
+
+    assert directory.loaded_at is not None
+    assert list(directory.organizations("/STAT").keys()) == ["123"]
+    restored_municipalities = municipalities.snapshot()
+    assert restored_municipalities is not None
+    assert restored_municipalities[0].fylkesnummerByOrganization == {"9": "03"}
+    assert [(key, value) for key, value, _ in brreg.snapshot()] == [
+        ("123", {"navn": "Org"})
+    ]
+    assert brreg.snapshot()[0][2] >= 5.0
+    assert store.fallback(("datasets_by_publisher", FilterEnum.NONE), "sparql") == [
+        {"count": 3}
+    ]
+
+
+@pytest.mark.unit
+def test_load_snapshot_ignores_missing_and_corrupt_files(tmp_path: Path) -> None:
+    """Test that startup continues cold without a usable snapshot."""
+    corrupt = tmp_path / "corrupt.snapshot"
+    corrupt.write_bytes(b"not a pickle")
+
+    with _use_state(_empty_state()):
+        assert not warm_snapshot.load_snapshot(str(tmp_path / "missing.snapshot"))
+        assert not warm_snapshot.load_snapshot(str(corrupt))